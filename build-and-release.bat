@@ -26,6 +26,8 @@ py -%pyver% -m pylint -d all -e F,E,W --output-format=text "%modulename%" > "./r
 py -%pyver% -m coverage run -m unittest discover || GOTO :error
 py -%pyver% -m coverage report --format=markdown > "./reports/COVERAGE.md" || GOTO :error
 
+py -%pyver% -m urilibplus.benchmarks --output "./reports/BENCHMARK.md" || GOTO :error
+
 py -%pyver% -m piptools compile -v --resolver=backtracking --no-header -U --annotate --no-strip-extras -r pyproject.toml || GOTO :error
 
 py -%pyver% -m pdoc --html -f -c show_inherited_members=True -c list_class_variables_in_index=False -c show_type_annotations=True -c show_source_code=True -o tempdocs %modulename% || GOTO :error
@@ -7,10 +7,59 @@ uris in python in a easier and consistent manner.
 
 #pylint:disable=invalid-name
 
-from .uri_path import URIPath
-from .uri_query import URIQuery
-from .uri import URI
-from .characters import CharacterSets
+from os import environ
+
+#every name is only imported from its module once it is first used (see PEP 562),
+#so importing this package alone stays quick
+_LAZY_NAMES = {
+    "URI": "uri",
+    "FrozenURI": "uri",
+    "URIParseCache": "uri",
+    "URINormalization": "uri_parsing",
+    "BytesURI": "uri_bytes",
+    "URIPath": "uri_path",
+    "FrozenURIPath": "uri_path",
+    "URIQuery": "uri_query",
+    "FrozenURIQuery": "uri_query",
+    "URIFrame": "frame",
+    "URIRouter": "router",
+    "URIPatternSet": "patterns",
+    "CharacterSets": "characters",
+}
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from .uri_path import URIPath, FrozenURIPath
+    from .uri_query import URIQuery, FrozenURIQuery
+    from .uri import URI, FrozenURI, URIParseCache
+    from .uri_parsing import URINormalization
+    from .uri_bytes import BytesURI
+    from .characters import CharacterSets
+    from .frame import URIFrame
+    from .router import URIRouter
+    from .patterns import URIPatternSet
+
+def __getattr__(name:str):
+    module = _LAZY_NAMES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(__import__(module, globals(), None, [name], 1), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_NAMES))
+
+if environ.get("URILIBPLUS_PROFILE", "") != "":
+    from . import instrumentation
+    instrumentation.enable()
 
 __version__ = "1.0.0.0"
-__all__ = ["URI", "URIPath", "URIQuery", "CharacterSets"]
+__all__ = ["URI", "FrozenURI", "URIParseCache", "URINormalization",
+           "BytesURI",
+           "URIPath", "FrozenURIPath",
+           "URIQuery", "FrozenURIQuery",
+           "URIFrame",
+           "URIRouter",
+           "URIPatternSet",
+           "CharacterSets"]
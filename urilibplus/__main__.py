@@ -0,0 +1,82 @@
+"""
+`__main__`
+
+The command line entry point for `urilibplus`.
+
+Usage:
+    python -m urilibplus validate [FILE ...] [--workers N] [--chunksize N]
+                                  [--default-scheme SCHEME] [--quote] [--quote-safe CHARS]
+                                  [--invalid-only]
+
+Every line read from the given files (or standard input, if none are given) is treated
+as a uri, and a line of `valid`, `invalid`, or `error`, followed by a tab and the encoded uri
+(or the error raised) is written for each, in the same order.
+"""
+
+import sys
+from argparse import ArgumentParser
+
+from .batch import process_many
+from .typings import * # pylint: disable=wildcard-import, unused-wildcard-import
+
+def _readlines(files:Sequence[str]) -> Iterator[str]:
+    if len(files) <= 0:
+        yield from sys.stdin
+    for path in files:
+        with open(path, "r", encoding="utf-8") as file:
+            yield from file
+
+def main(argv:Optional[Sequence[str]] = None) -> int:
+    """
+    `main`
+
+    Arguments:
+        `argv` -- The command line arguments to use, defaulting to those given to python.
+
+    Returns:
+        The exit code, `1` if any uri given was invalid or could not be parsed, otherwise `0`.
+    """
+    parser = ArgumentParser(prog="python -m urilibplus")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    validate = commands.add_parser("validate",
+                                   help="parse, encode, and validate one uri per line")
+    validate.add_argument("files", nargs="*",
+                          help="the files to read uris from, defaulting to standard input")
+    validate.add_argument("--workers", type=int, default=None,
+                          help="the amount of processes to use, defaulting to one per processor")
+    validate.add_argument("--chunksize", type=int, default=2048,
+                          help="the amount of uris sent to a process at once")
+    validate.add_argument("--default-scheme", default=None,
+                          help="the scheme to use for any uri that has none")
+    validate.add_argument("--quote", action="store_true", default=None,
+                          help="quote every uri when encoding it")
+    validate.add_argument("--quote-safe", default=None,
+                          help="the characters to leave unquoted when quoting")
+    validate.add_argument("--invalid-only", action="store_true",
+                          help="only write the lines for uris that are invalid or had errors")
+
+    args = parser.parse_args(argv)
+
+    uris = (line.rstrip("\r\n") for line in _readlines(args.files))
+
+    exit_code = 0
+    for result in process_many(uris,
+                               args.default_scheme,
+                               quote=args.quote,
+                               quote_safe=args.quote_safe,
+                               workers=args.workers,
+                               chunksize=args.chunksize):
+        if result.error is not None:
+            status, text = "error", result.error
+        else:
+            status, text = ("valid" if result.valid else "invalid"), cast(str, result.encoded)
+        if status != "valid":
+            exit_code = 1
+        elif args.invalid_only:
+            continue
+        sys.stdout.write(f"{status}\t{text}\n")
+    return exit_code
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,105 @@
+"""
+`batch`
+
+Holds the functions used to encode and validate large amounts of uris over multiple processes.
+"""
+
+from concurrent.futures import ProcessPoolExecutor, Future
+from collections import deque
+from itertools import islice
+from os import cpu_count
+
+from .uri import URI
+from .typings import * # pylint: disable=wildcard-import, unused-wildcard-import
+
+class URIResult(NamedTuple):
+    """
+    `URIResult`
+
+    The result of processing a single uri string with `process_many`.
+    """
+    encoded: Optional[str]
+    valid: bool
+    error: Optional[str]
+
+_ChunkOptions:TypeAlias = Tuple[Optional[str], Optional[bool], Optional[str]]
+
+def _process_chunk(chunk:List[str],
+                   options:_ChunkOptions
+                  ) -> List[Tuple[Optional[str], bool, Optional[str]]]:
+    #only plain tuples of strings are sent back, never the `URI` objects themselves
+    default_scheme, quote, quote_safe = options
+    results:List[Tuple[Optional[str], bool, Optional[str]]] = []
+    append = results.append
+    for contents in chunk:
+        try:
+            uri = URI(contents, default_scheme)
+            append((uri.encode(quote, quote_safe), uri.validate(), None))
+        except Exception as e: # pylint: disable=broad-exception-caught
+            append((None, False, f"{type(e).__name__}: {e}"))
+    return results
+
+def _chunked(it:Iterable[str], size:int) -> Iterator[List[str]]:
+    it = iter(it)
+    chunk = list(islice(it, size))
+    while len(chunk) > 0:
+        yield chunk
+        chunk = list(islice(it, size))
+
+def process_many(uris:Iterable[str],
+                 default_scheme:Optional[str] = None,
+                 *,
+                 quote:Optional[bool] = None,
+                 quote_safe:Optional[str] = None,
+                 workers:Optional[int] = None,
+                 chunksize:int = 2048
+                ) -> Iterator[URIResult]:
+    """
+    `process_many`
+
+    Parses, encodes, and validates every given uri string,
+    split into chunks that are handled by a pool of processes.
+
+    Arguments:
+        `uris` -- The uri strings to process, only read as they are needed.
+        `default_scheme` -- The scheme to use for any string that has none.
+
+    Keyword Arguments:
+        `quote`, `quote_safe` -- Used when encoding each uri, the same as with `URI.encode`.
+        `workers` -- The amount of processes to use, defaulting to the amount of processors;
+            with `1` or less processing everything in this process instead.
+        `chunksize` -- The amount of uri strings sent to a process at once.
+
+    Raises:
+        ValueError: Raised when the chunk size is not positive, as soon as this is called.
+
+    Returns:
+        An iterator of the `URIResult` of each uri string, in the same order as given.
+        A string that fails to parse gives a result with its `error` set, instead of raising.
+    """
+    #only the processing is a generator, so bad arguments are refused before anything is read
+    if chunksize <= 0:
+        raise ValueError(chunksize)
+    if workers is None:
+        workers = cpu_count() or 1
+    return _process_many(_chunked(uris, chunksize), (default_scheme, quote, quote_safe), workers)
+
+def _process_many(chunks:Iterator[List[str]],
+                  options:_ChunkOptions,
+                  workers:int
+                 ) -> Iterator[URIResult]:
+    if workers <= 1:
+        for chunk in chunks:
+            yield from (URIResult(*r) for r in _process_chunk(chunk, options))
+        return
+
+    with ProcessPoolExecutor(workers) as pool:
+        #only a few chunks are given to the pool at a time, so the input is never read all at once
+        pending:Deque[Future] = deque()
+        limit = 2 * workers
+        for chunk in chunks:
+            pending.append(pool.submit(_process_chunk, chunk, options))
+            if len(pending) >= limit:
+                yield from (URIResult(*r) for r in pending.popleft().result())
+        while len(pending) > 0:
+            yield from (URIResult(*r) for r in pending.popleft().result())
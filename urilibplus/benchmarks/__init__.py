@@ -0,0 +1,116 @@
+"""
+`__init__`
+
+Holds all defined benchmarks, and the functions used to run them.
+"""
+
+from timeit import Timer
+from platform import python_implementation, python_version
+
+from .corpora import CORPORA
+from .suite import BENCHMARKS, Benchmark
+from .imports import IMPORT_BENCHMARKS, ImportResult, run_import_benchmarks
+from ..typings import * # pylint: disable=wildcard-import, unused-wildcard-import
+
+class BenchmarkResult(NamedTuple):
+    """
+    `BenchmarkResult`
+
+    The timing of a single benchmark on a single corpus, in microseconds per uri;
+    or the error it raised instead.
+    """
+    benchmark: str
+    corpus: str
+    urilibplus_us: Optional[float]
+    baseline_us: Optional[float]
+    error: Optional[str]
+
+def _time(runner:Callable[[], Any], count:int, repeat:int) -> float:
+    return min(Timer(runner).repeat(repeat=repeat, number=1)) / count * 1e6
+
+def run_benchmarks(size:int = 2000,
+                   repeat:int = 5,
+                   only:Optional[Sequence[str]] = None
+                  ) -> List[BenchmarkResult]:
+    """
+    `run_benchmarks`
+
+    Keyword Arguments:
+        `size` -- The amount of uris in every corpus.
+        `repeat` -- The amount of times every benchmark is ran, with the fastest time kept.
+        `only` -- If given, only the benchmarks with these names are ran.
+
+    Returns:
+        The result of every benchmark on every corpus.
+    """
+    results = []
+    for corpus_name, corpus in CORPORA.items():
+        uris = corpus(size)
+        for benchmark in BENCHMARKS:
+            if only is not None and benchmark.name not in only:
+                continue
+            try:
+                runner, baseline = benchmark.prepare(uris)
+                results.append(BenchmarkResult(benchmark.name,
+                                               corpus_name,
+                                               _time(runner, size, repeat),
+                                               None if baseline is None else
+                                               _time(baseline, size, repeat),
+                                               None))
+            except Exception as e: # pylint: disable=broad-exception-caught
+                results.append(BenchmarkResult(benchmark.name, corpus_name, None, None,
+                                               f"{type(e).__name__}: {e}"))
+    return results
+
+def _format_us(value:Optional[float]) -> str:
+    return "-" if value is None else f"{value:.2f}"
+
+def _format_ratio(value:Optional[float], baseline:Optional[float]) -> str:
+    return "-" if value is None or baseline is None else f"{value / baseline:.2f}x"
+
+def format_results(results:Iterable[BenchmarkResult],
+                   size:int,
+                   imports:Iterable[ImportResult] = ()
+                  ) -> str:
+    """
+    `format_results`
+
+    Returns:
+        The given results as a markdown report, in a stable order that can be diffed.
+    """
+    lines = [
+        "# Benchmarks",
+        "",
+        f"{python_implementation()} {python_version()}, {size} uris per corpus, "
+        "microseconds per uri (lower is better).",
+        "",
+        "| Benchmark | Corpus | urilibplus | urllib.parse | Ratio |",
+        "|--- | --- | ---: | ---: | ---: |",
+    ]
+    for result in results:
+        if result.error is not None:
+            lines.append(f"| {result.benchmark} | {result.corpus} | "
+                         f"failed: {result.error} | - | - |")
+            continue
+        lines.append(f"| {result.benchmark} | {result.corpus} | "
+                     f"{_format_us(result.urilibplus_us)} | {_format_us(result.baseline_us)} | "
+                     f"{_format_ratio(result.urilibplus_us, result.baseline_us)} |")
+    imports = list(imports)
+    if len(imports) > 0:
+        lines += [
+            "",
+            "## Import Time",
+            "",
+            "Microseconds spent importing, as given by `python -X importtime` (lower is better).",
+            "",
+            "| Statement | urilibplus | urllib.parse | Ratio |",
+            "|--- | ---: | ---: | ---: |",
+        ]
+        for result in imports:
+            if result.error is not None:
+                lines.append(f"| {result.benchmark} | failed: {result.error} | - | - |")
+                continue
+            lines.append(f"| {result.benchmark} | "
+                         f"{_format_us(result.urilibplus_us)} | {_format_us(result.baseline_us)} | "
+                         f"{_format_ratio(result.urilibplus_us, result.baseline_us)} |")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,32 @@
+"""
+`__main__`
+
+The main entry point for benchmarks.
+
+Usage:
+    python -m urilibplus.benchmarks [--size N] [--repeat N] [--only NAME ...] [--output FILE]
+"""
+
+from argparse import ArgumentParser
+
+from .__init__ import run_benchmarks, run_import_benchmarks, format_results
+
+if __name__ == '__main__':
+    parser = ArgumentParser(prog="python -m urilibplus.benchmarks")
+    parser.add_argument("--size", type=int, default=2000,
+                        help="the amount of uris in every corpus")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="the amount of times every benchmark is ran")
+    parser.add_argument("--only", nargs="*", default=None,
+                        help="the names of the only benchmarks to run")
+    parser.add_argument("--output", default="./reports/BENCHMARK.md",
+                        help="the file to write the report to, or - to only print it")
+    args = parser.parse_args()
+
+    report = format_results(run_benchmarks(args.size, args.repeat, args.only),
+                            args.size,
+                            run_import_benchmarks(args.repeat, args.only))
+    print(report, end="")
+    if args.output != "-":
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(report)
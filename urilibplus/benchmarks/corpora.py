@@ -0,0 +1,66 @@
+"""
+`corpora`
+
+Holds the uri corpora used by the benchmarks, always generated the same way.
+"""
+
+from random import Random
+
+from ..typings import * # pylint: disable=wildcard-import, unused-wildcard-import
+
+HOSTS:Tuple[str, ...] = ("api.example.com", "www.example.org", "cdn.example.net:8443",
+                         "user:secret@internal.example.com:8080", "[2001:db8::1]")
+WORDS:Tuple[str, ...] = ("users", "orders", "v1", "v2", "items", "search", "static", "img",
+                         "profile", "settings", "archive", "2024", "reports", "a%20b", "index.html")
+TRACKING_KEYS:Tuple[str, ...] = ("utm_source", "utm_medium", "utm_campaign", "utm_term",
+                                 "utm_content", "gclid", "fbclid", "ref", "sid", "cid", "pos")
+
+def short_api(count:int, seed:int = 0) -> List[str]:
+    """
+    `short_api`
+
+    Returns:
+        `count` short api uris, with a few path segments and at most a couple query fields.
+    """
+    rand = Random(seed)
+    uris = []
+    for i in range(count):
+        path = "/".join(rand.choice(WORDS) for _ in range(rand.randint(1, 3)))
+        query = f"?id={i}" if rand.random() < 0.5 else ""
+        uris.append(f"https://{rand.choice(HOSTS)}/{path}/{i}{query}")
+    return uris
+
+def tracking_queries(count:int, seed:int = 1) -> List[str]:
+    """
+    `tracking_queries`
+
+    Returns:
+        `count` uris with long, tracking laden, query strings of 20 to 60 fields.
+    """
+    rand = Random(seed)
+    uris = []
+    for i in range(count):
+        fields = "&".join(f"{rand.choice(TRACKING_KEYS)}={rand.getrandbits(48):x}"
+                          for _ in range(rand.randint(20, 60)))
+        uris.append(f"https://{rand.choice(HOSTS)}/landing/{i}?{fields}#section-{i % 7}")
+    return uris
+
+def nested_paths(count:int, seed:int = 2) -> List[str]:
+    """
+    `nested_paths`
+
+    Returns:
+        `count` uris with deeply nested paths of 15 to 40 segments.
+    """
+    rand = Random(seed)
+    uris = []
+    for i in range(count):
+        path = "/".join(rand.choice(WORDS) for _ in range(rand.randint(15, 40)))
+        uris.append(f"http://{rand.choice(HOSTS)}/{path}/{i}")
+    return uris
+
+CORPORA:Dict[str, Callable[[int], List[str]]] = {
+    "short api": short_api,
+    "tracking queries": tracking_queries,
+    "nested paths": nested_paths,
+}
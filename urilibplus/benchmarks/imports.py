@@ -0,0 +1,91 @@
+"""
+`imports`
+
+Holds the import time benchmarks, measured with `python -X importtime` in new processes.
+"""
+
+import sys
+from os import environ
+from subprocess import run
+
+from ..typings import * # pylint: disable=wildcard-import, unused-wildcard-import
+
+class ImportBenchmark(NamedTuple):
+    """
+    `ImportBenchmark`
+
+    A single import statement, paired with a similar `urllib.parse` import as a baseline.
+    """
+    name: str
+    statement: str
+    baseline: str
+
+class ImportResult(NamedTuple):
+    """
+    `ImportResult`
+
+    The time taken by a single import benchmark, in microseconds.
+    """
+    benchmark: str
+    urilibplus_us: Optional[float]
+    baseline_us: Optional[float]
+    error: Optional[str]
+
+IMPORT_BENCHMARKS:Tuple[ImportBenchmark, ...] = (
+    ImportBenchmark("import urilibplus", "import urilibplus", "import urllib.parse"),
+    ImportBenchmark("from urilibplus import URI",
+                    "from urilibplus import URI",
+                    "from urllib.parse import urlsplit"),
+    ImportBenchmark("from urilibplus import URIQuery",
+                    "from urilibplus import URIQuery",
+                    "from urllib.parse import parse_qsl"),
+)
+
+def _importtime(statement:str) -> List[Tuple[str, int]]:
+    #bytecode is always written, as any real install would already have it
+    env = {k:v for k, v in environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+    stderr = run([sys.executable, "-X", "importtime", "-c", statement],
+                 env=env, capture_output=True, text=True, check=True).stderr
+    timings = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        if self_us.strip().isdigit():
+            timings.append((name.strip(), int(self_us)))
+    return timings
+
+def _import_us(statement:str, startup:FrozenSet[str], repeat:int) -> float:
+    _importtime(statement)
+    return min(sum(us for name, us in _importtime(statement) if name not in startup)
+               for _ in range(repeat))
+
+def run_import_benchmarks(repeat:int = 5,
+                          only:Optional[Sequence[str]] = None
+                         ) -> List[ImportResult]:
+    """
+    `run_import_benchmarks`
+
+    Keyword Arguments:
+        `repeat` -- The amount of new processes every statement is timed in,
+            with the fastest time kept.
+        `only` -- If given, only the benchmarks with these names are ran.
+
+    Returns:
+        The total time spent importing every module that each statement imports,
+        not counting those that python itself imports when starting.
+    """
+    startup = frozenset(name for name, _ in _importtime("pass"))
+    results = []
+    for benchmark in IMPORT_BENCHMARKS:
+        if only is not None and benchmark.name not in only:
+            continue
+        try:
+            results.append(ImportResult(benchmark.name,
+                                        _import_us(benchmark.statement, startup, repeat),
+                                        _import_us(benchmark.baseline, startup, repeat),
+                                        None))
+        except Exception as e: # pylint: disable=broad-exception-caught
+            results.append(ImportResult(benchmark.name, None, None,
+                                        f"{type(e).__name__}: {e}"))
+    return results
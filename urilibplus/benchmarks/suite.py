@@ -0,0 +1,219 @@
+"""
+`suite`
+
+Holds every benchmark, each paired with a plain `urllib.parse` baseline where one makes sense.
+"""
+
+from re import compile as regexcompile, escape as regexescape
+from urllib.parse import urlsplit, urlunsplit, urljoin, parse_qsl, urlencode, quote, unquote
+from pathlib import PurePosixPath
+
+from .. import URI, URIPath, URIQuery, BytesURI, URIRouter, URIPatternSet
+from ..typings import * # pylint: disable=wildcard-import, unused-wildcard-import
+
+Runner:TypeAlias = Callable[[], Any]
+
+class Benchmark(NamedTuple):
+    """
+    `Benchmark`
+
+    A single named benchmark, with a function that prepares it for the given corpus,
+    returning the `urilibplus` runner and the `urllib.parse` baseline runner, if any.
+    Each runner handles every uri of the corpus once.
+    """
+    name: str
+    prepare: Callable[[List[str]], Tuple[Runner, Optional[Runner]]]
+
+def _paths(uris:List[str]) -> List[URIPath]:
+    #every parsed uri has a path and a query, even if empty
+    return [cast(URIPath, URI(u).path) for u in uris]
+
+def _queries(uris:List[str]) -> List[URIQuery]:
+    return [cast(URIQuery, URI(u).query) for u in uris]
+
+def _urllib_parse(uri:str) -> Any:
+    split = urlsplit(uri)
+    return (split, PurePosixPath(split.path), parse_qsl(split.query, keep_blank_values=True))
+
+def _parse(uris:List[str]) -> Tuple[Runner, Optional[Runner]]:
+    return (lambda: [URI(u) for u in uris],
+            lambda: [_urllib_parse(u) for u in uris])
+
+def _parse_lazy(uris:List[str]) -> Tuple[Runner, Optional[Runner]]:
+    return (lambda: [URI(u, lazy=True) for u in uris],
+            lambda: [urlsplit(u) for u in uris])
+
+def _parse_many(uris:List[str]) -> Tuple[Runner, Optional[Runner]]:
+    return (lambda: URI.parse_many(uris),
+            lambda: [_urllib_parse(u) for u in uris])
+
+def _parse_many_lazy(uris:List[str]) -> Tuple[Runner, Optional[Runner]]:
+    return (lambda: URI.parse_many(uris, lazy=True),
+            lambda: [urlsplit(u) for u in uris])
+
+def _parse_bytes(uris:List[str]) -> Tuple[Runner, Optional[Runner]]:
+    raw = [u.encode("utf-8") for u in uris]
+    return (lambda: [BytesURI(r) for r in raw],
+            lambda: [urlsplit(r) for r in raw])
+
+#`URI.encode` is only done once until the uri changes, so every run encodes new objects,
+#with the baselines splitting and joining again to match
+def _encode(uris:List[str]) -> Tuple[Runner, Optional[Runner]]:
+    #unquoted, as `URI.encode` is by default
+    return (lambda: [URI(u).encode() for u in uris],
+            lambda: [unquote(urlunsplit(urlsplit(u))) for u in uris])
+
+def _encode_quoted(uris:List[str]) -> Tuple[Runner, Optional[Runner]]:
+    #every character is quoted, `:` and `/` included, as `URI.encode` does with no `quote_safe`
+    return (lambda: [URI(u).encode(True) for u in uris],
+            lambda: [quote(urlunsplit(urlsplit(u)), "") for u in uris])
+
+def _encode_cached(uris:List[str]) -> Tuple[Runner, Optional[Runner]]:
+    #encoding the same unchanged objects again, which only looks up the last encoding
+    objs = [URI(u) for u in uris]
+    splits = [urlsplit(u) for u in uris]
+    return (lambda: [o.encode() for o in objs],
+            lambda: [unquote(urlunsplit(s)) for s in splits])
+
+def _stripped(uris:List[str]) -> Tuple[Runner, Optional[Runner]]:
+    objs = [URI(u) for u in uris]
+    splits = [urlsplit(u) for u in uris]
+    return (lambda: [o.stripped() for o in objs],
+            lambda: [urlunsplit(s[:3] + ("", "")) for s in splits])
+
+def _root(uris:List[str]) -> Tuple[Runner, Optional[Runner]]:
+    objs = [URI(u) for u in uris]
+    splits = [urlsplit(u) for u in uris]
+    return (lambda: [o.root() for o in objs],
+            lambda: [urlunsplit(s[:2] + ("", "", "")) for s in splits])
+
+def _validate(uris:List[str]) -> Tuple[Runner, Optional[Runner]]:
+    objs = [URI(u) for u in uris]
+    return (lambda: [o.validate() for o in objs], None)
+
+def _normalize_many(uris:List[str]) -> Tuple[Runner, Optional[Runner]]:
+    return (lambda: URI.normalize_many(uris), None)
+
+def _resolve_many(uris:List[str]) -> Tuple[Runner, Optional[Runner]]:
+    #every uri as a link relative to the first, as found on a single page
+    base = uris[0]
+    splits = [urlsplit(u) for u in uris]
+    references = [f"../{s.path.rsplit('/', 1)[-1]}?{s.query}" for s in splits]
+    parsed = URI(base)
+    return (lambda: parsed.resolve_many(references, encoded=True),
+            lambda: [urljoin(base, r) for r in references])
+
+def _path_append(uris:List[str]) -> Tuple[Runner, Optional[Runner]]:
+    paths = _paths(uris)
+    pure = [PurePosixPath(urlsplit(u).path) for u in uris]
+    def run():
+        for path in paths:
+            path.copy().append("extra")
+    return (run, lambda: [p / "extra" for p in pure])
+
+def _path_insert(uris:List[str]) -> Tuple[Runner, Optional[Runner]]:
+    paths = _paths(uris)
+    pure = [PurePosixPath(urlsplit(u).path) for u in uris]
+    def run():
+        for path in paths:
+            path.copy().insert(1, "extra")
+    return (run, lambda: [PurePosixPath(*p.parts[:2], "extra", *p.parts[2:]) for p in pure])
+
+def _path_index(uris:List[str]) -> Tuple[Runner, Optional[Runner]]:
+    paths = _paths(uris)
+    pure = [PurePosixPath(urlsplit(u).path) for u in uris]
+    return (lambda: [p[len(p) // 2] for p in paths],
+            lambda: [p.parts[len(p.parts) // 2] for p in pure])
+
+def _path_segafter(uris:List[str]) -> Tuple[Runner, Optional[Runner]]:
+    paths = _paths(uris)
+    pure = [PurePosixPath(urlsplit(u).path) for u in uris]
+    targets = [p.parts[len(p.parts) // 2] if len(p.parts) > 0 else "" for p in pure]
+    def baseline():
+        for p, target in zip(pure, targets):
+            parts = p.parts
+            if target in parts:
+                i = parts.index(target)
+                _ = parts[i + 1] if i + 1 < len(parts) else None
+    return (lambda: [p.segafter(t) for p, t in zip(paths, targets)], baseline)
+
+def _router_match(uris:List[str]) -> Tuple[Runner, Optional[Runner]]:
+    #a route for the shape of every path, with its last segment as a placeholder
+    patterns = sorted({urlsplit(u).path.rsplit("/", 1)[0] + "/{id}" for u in uris})
+    router = URIRouter((p, p) for p in patterns)
+    regexes = [(regexcompile(regexescape(p).replace(r"\{id\}", "(?P<id>[^/]+)") + "$"), p)
+               for p in patterns]
+    objs = [URI(u) for u in uris]
+    paths = [urlsplit(u).path for u in uris]
+    def baseline():
+        for path in paths:
+            for regex, pattern in regexes:
+                match = regex.match(path)
+                if match is not None:
+                    _ = (pattern, match.groupdict())
+                    break
+    return (lambda: [router.match(o) for o in objs], baseline)
+
+def _pattern_search(uris:List[str]) -> Tuple[Runner, Optional[Runner]]:
+    #a blocklist of hosts that are never found, with a segment of some of the paths among them
+    patterns = [regexescape(f"ads{i}.tracker.example") for i in range(500)]
+    patterns += [regexescape(urlsplit(u).path.rsplit("/", 1)[-1]) for u in uris[::100]]
+    patternset = URIPatternSet(patterns)
+    regexes = [regexcompile(p) for p in patterns]
+    objs = [URI(u) for u in uris]
+    def baseline():
+        for uri in uris:
+            _ = [i for i, regex in enumerate(regexes) if regex.search(uri) is not None]
+    return (lambda: [patternset.search(o) for o in objs], baseline)
+
+def _query_append(uris:List[str]) -> Tuple[Runner, Optional[Runner]]:
+    queries = _queries(uris)
+    pairs = [parse_qsl(urlsplit(u).query, keep_blank_values=True) for u in uris]
+    def run():
+        for query in queries:
+            query.copy().append("extra=value")
+    def baseline():
+        for pair in pairs:
+            pair.copy().append(("extra", "value"))
+    return (run, baseline)
+
+def _query_getvalues(uris:List[str]) -> Tuple[Runner, Optional[Runner]]:
+    queries = _queries(uris)
+    pairs = [parse_qsl(urlsplit(u).query, keep_blank_values=True) for u in uris]
+    return (lambda: [q.getvalues("utm_source") for q in queries],
+            lambda: [[v for k, v in p if k == "utm_source"] for p in pairs])
+
+def _query_encode(uris:List[str]) -> Tuple[Runner, Optional[Runner]]:
+    pairs = [parse_qsl(urlsplit(u).query, keep_blank_values=True) for u in uris]
+    return (lambda: [URIQuery(p).encode(True) for p in pairs],
+            lambda: [urlencode(p, quote_via=quote) for p in pairs])
+
+def _copy(uris:List[str]) -> Tuple[Runner, Optional[Runner]]:
+    objs = [URI(u) for u in uris]
+    return (lambda: [o.copy() for o in objs], None)
+
+BENCHMARKS:Tuple[Benchmark, ...] = (
+    Benchmark("URI(...)", _parse),
+    Benchmark("URI(..., lazy=True)", _parse_lazy),
+    Benchmark("URI.parse_many", _parse_many),
+    Benchmark("URI.parse_many(lazy=True)", _parse_many_lazy),
+    Benchmark("BytesURI(...)", _parse_bytes),
+    Benchmark("URI(...).encode()", _encode),
+    Benchmark("URI(...).encode(quote=True)", _encode_quoted),
+    Benchmark("URI.encode, unchanged", _encode_cached),
+    Benchmark("URI.stripped", _stripped),
+    Benchmark("URI.root", _root),
+    Benchmark("URI.validate", _validate),
+    Benchmark("URI.copy", _copy),
+    Benchmark("URI.normalize_many", _normalize_many),
+    Benchmark("URI.resolve_many", _resolve_many),
+    Benchmark("URIPath.append", _path_append),
+    Benchmark("URIPath.insert", _path_insert),
+    Benchmark("URIPath[index]", _path_index),
+    Benchmark("URIPath.segafter", _path_segafter),
+    Benchmark("URIRouter.match", _router_match),
+    Benchmark("URIPatternSet.search", _pattern_search),
+    Benchmark("URIQuery.append", _query_append),
+    Benchmark("URIQuery.getvalues", _query_getvalues),
+    Benchmark("URIQuery.encode(quote=True)", _query_encode),
+)
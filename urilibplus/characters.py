@@ -4,11 +4,12 @@ characters
 Holds the character literals and related functions for the `urilibplus` module.
 """
 
-from urllib.parse import scheme_chars as uri_scheme_chars
-from string import ascii_letters, digits, hexdigits
+from __future__ import annotations
+
+from functools import lru_cache
+from re import compile as regexcompile, escape as regexescape
 
 from .typings import * # pylint: disable=wildcard-import, unused-wildcard-import
-from .tools import singlify_str
 
 class CharacterSets:
     """
@@ -21,44 +22,51 @@ class CharacterSets:
      - https://en.wikipedia.org/wiki/Uniform_Resource_Identifier
     """
 
-    HEXDIGITS: LiteralString = hexdigits
-    DIGITS: LiteralString = digits
-    LETTERS: LiteralString = ascii_letters
+    #every set is written out in full and sorted, instead of being built when imported,
+    #test_character_set_literals checks that they still match the sets they are made from
+    HEXDIGITS: LiteralString = "0123456789ABCDEFabcdef"
+    DIGITS: LiteralString = "0123456789"
+    LETTERS: LiteralString = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
 
     GENERIC_DELIMITERS: LiteralString = ":/?#[]@"
     SPECIFIC_DELIMITERS: LiteralString = "!$&'()*+,;="
-    PERCENT_ENCODING: LiteralString = singlify_str(HEXDIGITS,
-                                                   "%")
-    UNRESERVED: LiteralString = singlify_str(LETTERS,
-                                             DIGITS,
-                                             "-._~")
-    P_CHARS: LiteralString = singlify_str(UNRESERVED,
-                                          PERCENT_ENCODING,
-                                          SPECIFIC_DELIMITERS,
-                                          ":@")
-    ALL: LiteralString = singlify_str(GENERIC_DELIMITERS,
-                                      SPECIFIC_DELIMITERS,
-                                      PERCENT_ENCODING,
-                                      UNRESERVED)
+    PERCENT_ENCODING: LiteralString = "%0123456789ABCDEFabcdef"
+    UNRESERVED: LiteralString = ("-.0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ_"
+                                 "abcdefghijklmnopqrstuvwxyz~")
+    P_CHARS: LiteralString = ("!$%&'()*+,-.0123456789:;=@ABCDEFGHIJKLMNOPQRSTUVWXYZ_"
+                              "abcdefghijklmnopqrstuvwxyz~")
+    ALL: LiteralString = ("!#$%&'()*+,-./0123456789:;=?@ABCDEFGHIJKLMNOPQRSTUVWXYZ[]_"
+                          "abcdefghijklmnopqrstuvwxyz~")
 
     SEGMENT: LiteralString = P_CHARS
 
-    SCHEME: LiteralString = cast(LiteralString, uri_scheme_chars)
-    USERINFO: LiteralString = singlify_str(UNRESERVED,
-                                           PERCENT_ENCODING,
-                                           SPECIFIC_DELIMITERS,
-                                           ":")
-    HOST: LiteralString = singlify_str(DIGITS,
-                                       HEXDIGITS,
-                                       UNRESERVED,
-                                       PERCENT_ENCODING,
-                                       SPECIFIC_DELIMITERS,
-                                       ".-:[]")
+    SCHEME: LiteralString = "+-.0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+    USERINFO: LiteralString = ("!$%&'()*+,-.0123456789:;=ABCDEFGHIJKLMNOPQRSTUVWXYZ_"
+                               "abcdefghijklmnopqrstuvwxyz~")
+    HOST: LiteralString = ("!$%&'()*+,-.0123456789:;=ABCDEFGHIJKLMNOPQRSTUVWXYZ[]_"
+                           "abcdefghijklmnopqrstuvwxyz~")
     PORT: LiteralString = DIGITS
-    PATH: LiteralString = singlify_str(SEGMENT, "/")
-    QUERY: LiteralString = singlify_str(P_CHARS, "/?")
+    PATH: LiteralString = ("!$%&'()*+,-./0123456789:;=@ABCDEFGHIJKLMNOPQRSTUVWXYZ_"
+                           "abcdefghijklmnopqrstuvwxyz~")
+    QUERY: LiteralString = ("!$%&'()*+,-./0123456789:;=?@ABCDEFGHIJKLMNOPQRSTUVWXYZ_"
+                            "abcdefghijklmnopqrstuvwxyz~")
     FRAGMENT: LiteralString = QUERY
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def invalid_pattern(character_set: LiteralString) -> Pattern:
+        """
+        `invalid_pattern`
+
+        Arguments:
+            `character_set` -- The character set to get the pattern of.
+
+        Returns:
+            A compiled regex that matches any single character *not* in the given `character_set`.
+            Only compiled once for every character set.
+        """
+        return regexcompile(f"[^{regexescape(character_set)}]")
+
     @staticmethod
     def invalid_check(character_set: LiteralString, *validate_all: str) -> bool:
         """
@@ -72,8 +80,8 @@ class CharacterSets:
             `*validate_all` -- The strings to check.
 
         Returns:
-            True if *all* `*validate_all` strings only use
-            the characters in the given `character_set`.
+            True if *any* of the `*validate_all` strings use
+            a character not in the given `character_set`.
         """
-
-        return any(any((c not in character_set) for c in s) for s in validate_all if s != "")
+        search = CharacterSets.invalid_pattern(character_set).search
+        return any(search(s) is not None for s in validate_all if s != "")
@@ -0,0 +1,148 @@
+"""
+`codec`
+
+Holds the percent encoding functions used throughout `urilibplus`.
+
+Each works the same as its `urllib.parse` counterpart, but with the lookup tables for every
+set of safe characters built only once, any string that needs no changes given back as is,
+and `bytes`, `bytearray`, and `memoryview` content accepted without copying it first.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from re import compile as regexcompile, escape as regexescape
+from urllib.parse import unquote as _urllib_unquote
+
+from .characters import CharacterSets
+from .typings import * # pylint: disable=wildcard-import, unused-wildcard-import
+
+BytesLike:TypeAlias = Union[bytes, bytearray, memoryview]
+
+#every byte that is never quoted, no matter what safe characters are given
+_ALWAYS_SAFE:FrozenSet[int] = frozenset(CharacterSets.UNRESERVED.encode("ascii"))
+
+#every two hexadecimal digits (in either case) as the byte they stand for
+_HEX_BYTES:Dict[bytes, bytes] = {f"{a}{b}".encode("ascii"):bytes((int(a + b, 16),))
+                                 for a in CharacterSets.HEXDIGITS
+                                 for b in CharacterSets.HEXDIGITS}
+
+class _QuoteTable(NamedTuple):
+    table: Tuple[str, ...]
+    search: Callable[[str], Any]
+    search_bytes: Callable[[BytesLike], Any]
+
+@lru_cache(maxsize=None)
+def _quote_table(safe:str) -> _QuoteTable:
+    #the same safe characters `urllib.parse.quote` uses, with any non ascii characters ignored
+    safe_bytes = _ALWAYS_SAFE | frozenset(ord(c) for c in safe if ord(c) < 128)
+    unsafe = f"[^{regexescape(''.join(chr(b) for b in sorted(safe_bytes)))}]"
+    return _QuoteTable(tuple(chr(b) if b in safe_bytes else f"%{b:02X}" for b in range(256)),
+                       regexcompile(unsafe).search,
+                       regexcompile(unsafe.encode("ascii")).search)
+
+@lru_cache(maxsize=None)
+def quoter(safe:str = "/") -> Callable[[Union[str, BytesLike]], str]:
+    """
+    `quoter`
+
+    Arguments:
+        `safe` -- The characters, along with all unreserved characters, that are never quoted.
+
+    Returns:
+        A function that quotes a single string (or bytes like object) given to it, the same as
+        `quote` does; built only once for every `safe`, for use when quoting many strings.
+    """
+    table, search, search_bytes = _quote_table(safe)
+
+    def quote_one(content:Union[str, BytesLike]) -> str:
+        if isinstance(content, str):
+            if search(content) is None:
+                return content
+            content = content.encode("utf-8")
+        elif search_bytes(content) is None:
+            return str(content, "ascii")
+        return "".join([table[b] for b in content])
+    return quote_one
+
+def quote(content:Union[str, BytesLike], safe:str = "/") -> str:
+    """
+    `quote`
+
+    Percent encodes every character that is not unreserved, or in `safe`,
+    the same as `urllib.parse.quote`.
+
+    Arguments:
+        `content` -- The string, or bytes like object, to quote.
+
+    Keyword Arguments:
+        `safe` -- The characters, along with all unreserved characters, that are never quoted.
+
+    Returns:
+        The quoted string, being `content` itself if nothing needed to be quoted.
+    """
+    return quoter(safe)(content)
+
+def quote_bytes(content:Union[str, BytesLike], safe:str = "/") -> bytes:
+    """
+    `quote_bytes`
+
+    The same as `quote`, but returning `bytes`.
+    """
+    if not isinstance(content, str) and _quote_table(safe).search_bytes(content) is None:
+        return bytes(content)
+    return quoter(safe)(content).encode("ascii")
+
+def unquote_bytes(content:Union[str, BytesLike]) -> bytes:
+    """
+    `unquote_bytes`
+
+    Decodes every percent encoded byte, the same as `urllib.parse.unquote_to_bytes`.
+
+    Arguments:
+        `content` -- The string, or bytes like object, to unquote.
+
+    Returns:
+        The unquoted bytes.
+    """
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    elif not isinstance(content, bytes):
+        content = bytes(content)
+    if b"%" not in content:
+        return content
+    parts = content.split(b"%")
+    decoded = [parts[0]]
+    append = decoded.append
+    for part in parts[1:]:
+        byte = _HEX_BYTES.get(part[:2])
+        if byte is None:
+            append(b"%")
+            append(part)
+        else:
+            append(byte)
+            append(part[2:])
+    return b"".join(decoded)
+
+def unquote(content:Union[str, BytesLike], encoding:str = "utf-8", errors:str = "replace") -> str:
+    """
+    `unquote`
+
+    Decodes every percent encoded character, the same as `urllib.parse.unquote`.
+
+    Arguments:
+        `content` -- The string, or bytes like object, to unquote.
+
+    Keyword Arguments:
+        `encoding`, `errors` -- How the percent encoded bytes are decoded into characters.
+
+    Returns:
+        The unquoted string, being `content` itself if it is a string with nothing to unquote.
+    """
+    if isinstance(content, str):
+        if "%" not in content:
+            return content
+        if not content.isascii():
+            #only ascii runs are decoded, with every other character kept as is
+            return _urllib_unquote(content, encoding, errors)
+    return unquote_bytes(content).decode(encoding, errors)
@@ -0,0 +1,235 @@
+"""
+`frame`
+
+Holds the `URIFrame` class and reated imports.
+
+Requires `numpy`, which can be installed along with this module using `urilibplus[frame]`.
+"""
+
+from importlib import import_module
+
+from .uri import URI
+from .uri_parsing import URIComponents, urisplit, _cleaned
+from .typings import * # pylint: disable=wildcard-import, unused-wildcard-import
+
+def _numpy() -> Any:
+    #numpy is only imported once a frame is used, so it never slows down importing this module
+    try:
+        return import_module("numpy")
+    except ImportError as e:
+        raise ImportError("`URIFrame` requires `numpy`, "
+                          "install it with `pip install urilibplus[frame]`") from e
+
+#ports are parsed from any amount of digits, so only those that fit the port column are stored
+_PORT_MAX:int = 2 ** 63 - 1
+
+def _storedport(port:Optional[int]) -> int:
+    if port is None:
+        return -1
+    if port > _PORT_MAX:
+        raise ValueError(f"the port {port} is too large to be stored in a `URIFrame`")
+    return port
+
+class URIFrame:
+    """
+    `URIFrame`
+
+    A columnar container of many uris, used to filter and count large amounts of them at once.
+
+    Every string component is stored as a `numpy` array of codes into a list of the
+    unique strings of that component, with the port stored as its own 64 bit integer array
+    (using `-1` where no port is given); `URI` objects are only made on demand.
+    """
+
+    STRING_COLUMNS:Tuple[str, ...] = ("scheme", "userinfo", "host", "path", "query", "fragment")
+    COLUMNS:Tuple[str, ...] = STRING_COLUMNS + ("port",)
+
+    def __init__(self, components:Iterable[URIComponents] = ()):
+        numpy = _numpy()
+
+        vocabularies:Dict[str, List[str]] = {name:[] for name in self.STRING_COLUMNS}
+        indexes:Dict[str, Dict[str, int]] = {name:{} for name in self.STRING_COLUMNS}
+        codes:Dict[str, List[int]] = {name:[] for name in self.STRING_COLUMNS}
+        ports:List[int] = []
+
+        for parts in components:
+            for name, value in zip(self.STRING_COLUMNS, (parts.scheme,
+                                                         parts.userinfo,
+                                                         parts.host,
+                                                         parts.path,
+                                                         parts.query,
+                                                         parts.fragment)):
+                index = indexes[name]
+                code = index.get(value)
+                if code is None:
+                    code = index[value] = len(index)
+                    vocabularies[name].append(value)
+                codes[name].append(code)
+            ports.append(_storedport(parts.port))
+
+        #the lookups of strings to codes are only kept while building, as they would double
+        #the memory of every column with many distinct strings
+        self.vocabularies:Dict[str, List[str]] = vocabularies
+        self.codes:Dict[str, Any] = {name:numpy.array(column, dtype=numpy.int32)
+                                     for name, column in codes.items()}
+        self.port:Any = numpy.array(ports, dtype=numpy.int64)
+
+    @classmethod
+    def from_strings(cls, uris:Iterable[str], default_scheme:str = "") -> 'URIFrame':
+        """
+        `from_strings`
+
+        Arguments:
+            `uris` -- The uri strings to store.
+
+        Keyword Arguments:
+            `default_scheme` -- The scheme to use for any string that has none.
+
+        Raises:
+            ValueError: Raised when a port is too large to be stored.
+
+        Returns:
+            A new frame of the raw components of every given string, as `urisplit` gives them;
+            without ever making a `URI` object.
+        """
+        return cls(urisplit(_cleaned(uri), default_scheme) for uri in uris)
+
+    @classmethod
+    def from_uris(cls, uris:Iterable[URI]) -> 'URIFrame':
+        """
+        `from_uris`
+
+        Arguments:
+            `uris` -- The `URI` objects to store.
+
+        Returns:
+            A new frame of the components of every given `URI`, as `URI.tupled` gives them.
+        """
+        return cls(URIComponents(uri.scheme,
+                                 uri.user_info,
+                                 uri.host,
+                                 uri.port,
+                                 *uri.tupled()[2:])
+                   for uri in uris)
+
+    def __len__(self):
+        return len(self.port)
+
+    def __getitem__(self, index:int) -> URI:
+        return URI(self.components(index))
+
+    def __iter__(self) -> Iterator[URI]:
+        return (self[i] for i in range(len(self)))
+
+    def _subset(self, selection:Any) -> 'URIFrame':
+        subset = URIFrame.__new__(URIFrame)
+        subset.vocabularies = self.vocabularies
+        subset.codes = {name:column[selection] for name, column in self.codes.items()}
+        subset.port = self.port[selection]
+        return subset
+
+    def components(self, index:int) -> Tuple[str, str, str, str, str]:
+        """
+        `components`
+
+        Arguments:
+            `index` -- The index of the uri in this frame.
+
+        Returns:
+            The uri at the given index formated as a `tuple`,
+            in the same order as `URI.tupled` gives.
+        """
+        scheme, userinfo, host, path, query, fragment = (
+            self.vocabularies[name][self.codes[name][index]] for name in self.STRING_COLUMNS
+        )
+        port = int(self.port[index])
+        authority = f"{userinfo}@{host}" if userinfo != "" else host
+        if port > 0:
+            authority += f":{port}"
+        return (scheme, authority, path, query, fragment)
+
+    def column(self, name:str) -> List[Optional[Union[str, int]]]:
+        """
+        `column`
+
+        Arguments:
+            `name` -- The name of the column, one of `URIFrame.COLUMNS`.
+
+        Returns:
+            Every value of the given column, decoded back into a list, with `None` for no port.
+        """
+        if name == "port":
+            return [None if p < 0 else p for p in self.port.tolist()]
+        vocabulary = self.vocabularies[name]
+        return [vocabulary[code] for code in self.codes[name].tolist()]
+
+    def mask(self, **conditions:Union[str, int, None, Iterable[Union[str, int, None]]]) -> Any:
+        """
+        `mask`
+
+        Keyword Arguments:
+            `**conditions` -- Every column to filter by, with either a single value that
+                the column must equal, or a collection of values that it must be one of.
+                `None` can be used for no port.
+
+        Returns:
+            A `numpy` boolean array, `True` for every uri matching all of the `conditions`.
+        """
+        numpy = _numpy()
+        selected = numpy.ones(len(self), dtype=bool)
+        for name, values in conditions.items():
+            if name not in self.COLUMNS:
+                raise KeyError(name)
+            if isinstance(values, (str, int)) or values is None:
+                values = (values,)
+            if name == "port":
+                #a port too large to be stored can't be matched by any uri
+                ports = [-1 if v is None else int(v) for v in values]
+                targets = [p for p in ports if p <= _PORT_MAX]
+                selected &= numpy.isin(self.port, numpy.array(targets, dtype=numpy.int64))
+            else:
+                #every string is only in the vocabulary once, so its position is its code
+                vocabulary = self.vocabularies[name]
+                targets = [vocabulary.index(v) for v in set(values) if v in vocabulary]
+                selected &= numpy.isin(self.codes[name], numpy.array(targets, dtype=numpy.int32))
+        return selected
+
+    def where(self, **conditions:Union[str, int, None, Iterable[Union[str, int, None]]]
+             ) -> 'URIFrame':
+        """
+        `where`
+
+        Keyword Arguments:
+            `**conditions` -- The same as with `mask`.
+
+        Returns:
+            A new frame holding only the uris matching all of the `conditions`, in order.
+        """
+        return self._subset(self.mask(**conditions))
+
+    def count_by(self, name:str) -> Dict[Optional[Union[str, int]], int]:
+        """
+        `count_by`
+
+        Arguments:
+            `name` -- The name of the column to group by, one of `URIFrame.COLUMNS`.
+
+        Returns:
+            A dictionary of every value found in the given column, and how many uris have it.
+        """
+        numpy = _numpy()
+        if name == "port":
+            values, counts = numpy.unique(self.port, return_counts=True)
+            return {(None if v < 0 else v):c for v, c in zip(values.tolist(), counts.tolist())}
+        vocabulary = self.vocabularies[name]
+        counts = numpy.bincount(self.codes[name], minlength=len(vocabulary))
+        return {vocabulary[code]:count for code, count in enumerate(counts.tolist()) if count > 0}
+
+    def to_uris(self) -> List[URI]:
+        """
+        `to_uris`
+
+        Returns:
+            A new `URI` object for every uri in this frame, in order.
+        """
+        return list(self)
@@ -0,0 +1,160 @@
+"""
+`instrumentation`
+
+Holds the optional instrumentation of the main operations of `urilibplus`,
+counting the calls, time taken, and memory blocks allocated by each.
+
+Nothing is instrumented until `enable` is called, the `profiling` context manager is used,
+or the `URILIBPLUS_PROFILE` environment variable is set to a non empty value before
+`urilibplus` is imported; so this costs nothing when not in use.
+"""
+
+from contextlib import contextmanager
+from functools import wraps
+from sys import getallocatedblocks
+from time import perf_counter
+
+from . import uri, uri_bytes, uri_lazy, uri_parsing, uri_path, uri_query, uri_resolution
+from .typings import * # pylint: disable=wildcard-import, unused-wildcard-import
+
+class OperationStats(NamedTuple):
+    """
+    `OperationStats`
+
+    The statistics recorded for a single operation.
+    `allocations` is the net amount of memory blocks allocated while inside the operation.
+    """
+    calls: int
+    seconds: float
+    allocations: int
+
+#every instrumented operation, and every function (or property setter) that is wrapped for it;
+#module functions are looked up on each call, so are wrapped in every module that calls them;
+#while `__str__` and `__repr__` are the same function as `encode`, so are wrapped along with it
+OPERATIONS:Dict[str, Tuple[Tuple[object, str], ...]] = {
+    "URI.parse": ((uri_lazy._LazyURI, "_parse"),), # pylint: disable=protected-access
+    "URI.authority": ((uri_parsing, "_authorityfields"),
+                      (uri, "_authorityfields"),
+                      (uri_resolution, "_authorityfields")),
+    "URI.encode": ((uri.URI, "encode"), (uri.URI, "__str__"), (uri.URI, "__repr__")),
+    "URI.validate": ((uri.URI, "validate"),),
+    "URIPath.__init__": ((uri_path.URIPath, "__init__"),),
+    "URIPath.encode": ((uri_path.URIPath, "encode"),
+                       (uri_path.URIPath, "__str__"),
+                       (uri_path.URIPath, "__repr__")),
+    "URIPath.validate": ((uri_path.URIPath, "validate"),),
+    "URIQuery.parse": ((uri_query, "querysplit"),
+                       (uri_lazy, "querysplit"),
+                       (uri_resolution, "querysplit")),
+    "URIQuery.encode": ((uri_query.URIQuery, "encode"),
+                        (uri_query.URIQuery, "__str__"),
+                        (uri_query.URIQuery, "__repr__")),
+    "URIQuery.validate": ((uri_query.URIQuery, "validate"),),
+    "BytesURI.parse": ((uri_bytes.BytesURI, "__init__"),),
+    "BytesURI.encode": ((uri_bytes.BytesURI, "encode"),),
+}
+
+_stats:Dict[str, List[Union[int, float]]] = {name:[0, 0.0, 0] for name in OPERATIONS}
+_originals:Dict[Tuple[int, str], Tuple[object, str, Any]] = {}
+
+def _instrumented(name:str, func:Callable[..., Any]) -> Callable[..., Any]:
+    stats = _stats[name]
+
+    @wraps(func)
+    def wrapper(*args:Any, **kwargs:Any) -> Any:
+        blocks = getallocatedblocks()
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            stats[0] += 1
+            stats[1] += perf_counter() - start
+            stats[2] += getallocatedblocks() - blocks
+    return wrapper
+
+def _raw(owner:object, attr:str) -> Any:
+    return vars(owner)[attr] if isinstance(owner, type) else getattr(owner, attr)
+
+def enabled() -> bool:
+    """
+    `enabled`
+
+    Returns:
+        `True` if the operations of `urilibplus` are currently instrumented.
+    """
+    return len(_originals) > 0
+
+def enable():
+    """
+    `enable`
+
+    Starts instrumenting every operation in `OPERATIONS`, doing nothing if already enabled.
+    """
+    if enabled():
+        return
+    for name, targets in OPERATIONS.items():
+        for owner, attr in targets:
+            original = _raw(owner, attr)
+            if isinstance(original, property):
+                replacement:Any = property(original.fget,
+                                           _instrumented(name, cast(Callable, original.fset)),
+                                           original.fdel,
+                                           original.__doc__)
+            else:
+                replacement = _instrumented(name, original)
+            _originals[(id(owner), attr)] = (owner, attr, original)
+            setattr(owner, attr, replacement)
+
+def disable():
+    """
+    `disable`
+
+    Stops instrumenting every operation, restoring them exactly as they were.
+    Any statistics recorded are kept until `reset` is called.
+    """
+    for owner, attr, original in _originals.values():
+        setattr(owner, attr, original)
+    _originals.clear()
+
+def snapshot() -> Dict[str, OperationStats]:
+    """
+    `snapshot`
+
+    Returns:
+        A copy of the statistics recorded for every operation so far.
+    """
+    return {name:OperationStats(int(calls), float(seconds), int(allocations))
+            for name, (calls, seconds, allocations) in _stats.items()}
+
+def reset():
+    """
+    `reset`
+
+    Sets every recorded statistic back to zero.
+    """
+    for stats in _stats.values():
+        stats[:] = [0, 0.0, 0]
+
+@contextmanager
+def profiling(reset_stats:bool = False) -> Iterator[Callable[[], Dict[str, OperationStats]]]:
+    """
+    `profiling`
+
+    A context manager that instruments every operation while inside of it,
+    returning to the previous state once exited.
+
+    Keyword Arguments:
+        `reset_stats` -- Reset every recorded statistic before starting.
+
+    Yields:
+        The `snapshot` function, for convenience.
+    """
+    was_enabled = enabled()
+    if reset_stats:
+        reset()
+    enable()
+    try:
+        yield snapshot
+    finally:
+        if not was_enabled:
+            disable()
@@ -0,0 +1,306 @@
+"""
+`patterns`
+
+Holds the `URIPatternSet` class and related imports.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from re import (compile as regexcompile,
+                error as RegexError,
+                IGNORECASE,
+                MULTILINE,
+                DOTALL,
+                VERBOSE,
+                UNICODE)
+
+from .uri import URI
+from .uri_path import URIPath
+from .uri_query import URIQuery
+from .typings import * # pylint: disable=wildcard-import, unused-wildcard-import
+
+PatternTarget:TypeAlias = Literal["uri", "segments", "keys", "values"]
+
+#patterns made only of plain characters, or escaped punctuation, match that text exactly
+_LITERAL_PATTERN:Pattern = regexcompile(r"(?:[^\\.^$*+?{}\[\]|()]|\\[^0-9A-Za-z])+", DOTALL)
+_ESCAPE_PATTERN:Pattern = regexcompile(r"\\(.)", DOTALL)
+
+#the flags that can be scoped to a single part of a pattern, and how they are written there
+_SCOPED_FLAGS:Tuple[Tuple[int, str], ...] = ((IGNORECASE, "i"),
+                                             (MULTILINE, "m"),
+                                             (DOTALL, "s"),
+                                             (VERBOSE, "x"))
+_COMBINABLE_FLAGS:int = IGNORECASE | MULTILINE | DOTALL | VERBOSE | UNICODE
+
+#group references can't be kept once the groups of every pattern are numbered together
+_BACKREFERENCE_PATTERN:Pattern = regexcompile(r"\\(?:[1-9]|g<)|\(\?P=|\(\?\(")
+
+def _literal(pattern:Pattern) -> Optional[str]:
+    #the exact text the given pattern matches, or `None` if it isn't just text
+    if (not isinstance(pattern.pattern, str) or
+        pattern.flags & ~(UNICODE | IGNORECASE) or
+        _LITERAL_PATTERN.fullmatch(pattern.pattern) is None):
+        return None
+    literal = _ESCAPE_PATTERN.sub(r"\1", pattern.pattern)
+    if pattern.flags & IGNORECASE:
+        #only ascii text is lowercased the same way the regex engine would
+        return literal.lower() if literal.isascii() else None
+    return literal
+
+def _fragment(pattern:Pattern) -> Optional[str]:
+    #the given pattern as one alternative among many, or `None` if it can't be combined
+    if (not isinstance(pattern.pattern, str) or
+        pattern.groupindex or
+        pattern.flags & ~_COMBINABLE_FLAGS or
+        _BACKREFERENCE_PATTERN.search(pattern.pattern) is not None):
+        return None
+    flags = "".join(letter for flag, letter in _SCOPED_FLAGS if pattern.flags & flag)
+    #the pattern is ended with a new line, so any trailing verbose comment can't swallow the `)`
+    end = "\n" if "x" in flags else ""
+    fragment = f"(?{flags}:{pattern.pattern}{end})"
+    try:
+        regexcompile(fragment)
+    except RegexError:
+        return None
+    return fragment
+
+class _Automaton:
+    #an aho-corasick automaton, finding every one of many literals in a single pass of the text
+    __slots__ = ("goto", "fail", "found", "members")
+
+    def __init__(self, literals:List[Tuple[str, int]]):
+        self.goto:List[Dict[str, int]] = [{}]
+        self.fail:List[int] = [0]
+        self.found:List[Tuple[int, ...]] = [()]
+        self.members:Tuple[int, ...] = tuple(i for _, i in literals)
+        for literal, index in literals:
+            state = 0
+            for char in literal:
+                following = self.goto[state].get(char)
+                if following is None:
+                    following = self.goto[state][char] = len(self.goto)
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.found.append(())
+                state = following
+            self.found[state] += (index,)
+
+        #every state falls back to the longest suffix of it that is also a state,
+        #also finding everything that suffix finds
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, following in self.goto[state].items():
+                fallback = self.fail[state]
+                while fallback != 0 and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                fallback = self.goto[fallback].get(char, 0)
+                self.fail[following] = fallback
+                self.found[following] += self.found[fallback]
+                queue.append(following)
+
+    def search(self, text:str, found:Set[int], first:bool):
+        """Adds the index of every literal in the text to `found`, stopping at the first if asked"""
+        goto, fail, outputs = self.goto, self.fail, self.found
+        state = 0
+        for char in text:
+            following = goto[state].get(char)
+            while following is None and state != 0:
+                state = fail[state]
+                following = goto[state].get(char)
+            state = 0 if following is None else following
+            if outputs[state]:
+                found.update(outputs[state])
+                if first:
+                    return
+
+class _PatternChunk(NamedTuple):
+    combined: Pattern
+    members: Tuple[int, ...]
+
+class URIPatternSet:
+    """
+    `URIPatternSet`
+
+    Many regex patterns, searched for together in uris, their path segments,
+    or their query keys or values; reporting which of the patterns were found.
+
+    Patterns that are only plain text (such as those made with `re.escape`) are all found
+    in a single pass of the content, no matter how many there are. Every other pattern is
+    compiled into alternations of a few dozen patterns each, so only the patterns of an
+    alternation that matched are then searched for one by one. Patterns that can't be combined
+    (such as those with named groups or group references) are always searched for on their own.
+    """
+
+    def __init__(self,
+                 patterns:Iterable[Union[str, Pattern]] = (),
+                 *,
+                 flags:int = 0,
+                 chunk_size:int = 64):
+        if chunk_size <= 0:
+            raise ValueError(chunk_size)
+        self.flags:int = flags
+        self.chunk_size:int = chunk_size
+        self.patterns:List[Pattern] = []
+        self._compiled:bool = False
+        self._literals:Optional[_Automaton] = None
+        self._folded:Optional[_Automaton] = None
+        self._chunks:List[_PatternChunk] = []
+        self._separate:List[int] = []
+        for pattern in patterns:
+            self.add(pattern)
+
+    def __len__(self):
+        return len(self.patterns)
+
+    def __iter__(self):
+        return iter(self.patterns)
+
+    def add(self, pattern:Union[str, Pattern]) -> int:
+        """
+        `add`
+
+        Arguments:
+            `pattern` -- The regex pattern to add, compiled with this set's `flags` if a string.
+
+        Raises:
+            re.error: Raised when the pattern is not a valid regex pattern.
+
+        Returns:
+            The index of the pattern, as reported by `search`.
+        """
+        if isinstance(pattern, str):
+            pattern = regexcompile(pattern, self.flags)
+        self.patterns.append(pattern)
+        #everything is compiled again on the next search
+        self._compiled = False
+        return len(self.patterns) - 1
+
+    def _compile(self):
+        literals:List[Tuple[str, int]] = []
+        folded:List[Tuple[str, int]] = []
+        fragments:List[Tuple[int, str]] = []
+        separate:List[int] = []
+        for i, pattern in enumerate(self.patterns):
+            literal = _literal(pattern)
+            if literal is not None:
+                (folded if pattern.flags & IGNORECASE else literals).append((literal, i))
+                continue
+            fragment = _fragment(pattern)
+            if fragment is None:
+                separate.append(i)
+            else:
+                fragments.append((i, fragment))
+
+        chunks = []
+        for start in range(0, len(fragments), self.chunk_size):
+            chunk = fragments[start:start + self.chunk_size]
+            #capturing groups slow every alternative down, so the combined pattern only finds
+            #if any of its patterns matched, and not which
+            combined = regexcompile("|".join(fragment for _, fragment in chunk))
+            chunks.append(_PatternChunk(combined, tuple(i for i, _ in chunk)))
+
+        self._literals = _Automaton(literals) if len(literals) > 0 else None
+        self._folded = _Automaton(folded) if len(folded) > 0 else None
+        self._chunks, self._separate = chunks, separate
+        self._compiled = True
+
+    @staticmethod
+    def _contents(content:Union[str, URI, URIPath, URIQuery],
+                  target:PatternTarget
+                 ) -> List[str]:
+        #every string of the given content that the target names
+        if target == "uri":
+            return [content if isinstance(content, str) else str(content)]
+        if target == "segments":
+            path = content.path if isinstance(content, URI) else content
+            if path is None:
+                return []
+            if isinstance(path, str):
+                path = URIPath(path)
+            return [s for s in cast(URIPath, path).raw if s not in ("/", "//")]
+        if target in ("keys", "values"):
+            query = content.query if isinstance(content, URI) else content
+            if query is None:
+                return []
+            if isinstance(query, str):
+                query = URIQuery(query)
+            position = 0 if target == "keys" else 1
+            return [pair[position] for pair in cast(URIQuery, query).data]
+        raise ValueError(target)
+
+    def _search(self, contents:List[str], first:bool) -> Set[int]:
+        #the indexes of the patterns found in any of the contents, stopping at the first if asked
+        if not self._compiled:
+            self._compile()
+        patterns = self.patterns
+        found:Set[int] = set()
+
+        for content in contents:
+            if self._literals is not None:
+                self._literals.search(content, found, first)
+            if self._folded is not None:
+                if content.isascii():
+                    self._folded.search(content.lower(), found, first)
+                else:
+                    #the regex engine can fold some non ascii characters into ascii ones
+                    found.update(i
+                                 for i in self._folded.members
+                                 if patterns[i].search(content) is not None)
+            if first and len(found) > 0:
+                return found
+
+        for chunk in self._chunks:
+            if any(chunk.combined.search(c) is not None for c in contents):
+                #only this chunk's patterns need to be searched for one by one
+                found.update(i
+                             for i in chunk.members
+                             if any(patterns[i].search(c) is not None for c in contents))
+                if first:
+                    return found
+
+        for i in self._separate:
+            if any(patterns[i].search(c) is not None for c in contents):
+                found.add(i)
+                if first:
+                    return found
+        return found
+
+    def search(self,
+               content:Union[str, URI, URIPath, URIQuery],
+               target:PatternTarget = "uri"
+              ) -> List[int]:
+        """
+        `search`
+
+        Arguments:
+            `content` -- What to search, as a string or the object the `target` is part of.
+
+        Keyword Arguments:
+            `target` -- What to search in the content:
+                `"uri"` being the whole, encoded, uri;
+                `"segments"` being every segment of the uri's path;
+                and `"keys"` or `"values"` being every key or value of the uri's query.
+
+        Raises:
+            ValueError: Raised when the target is not known.
+
+        Returns:
+            The indexes of every pattern found anywhere in the target, in order.
+        """
+        return sorted(self._search(self._contents(content, target), False))
+
+    def ismatch(self,
+                content:Union[str, URI, URIPath, URIQuery],
+                target:PatternTarget = "uri"
+               ) -> bool:
+        """
+        `ismatch`
+
+        The same as `search`, but stopping as soon as any pattern is found.
+
+        Returns:
+            `True` if any pattern is found anywhere in the target, otherwise `False`.
+        """
+        return len(self._search(self._contents(content, target), True)) > 0
@@ -0,0 +1,201 @@
+"""
+`router`
+
+Holds the `URIRouter` class and reated imports.
+"""
+
+from __future__ import annotations
+
+from .uri import URI
+from .uri_path import URIPath
+from .typings import * # pylint: disable=wildcard-import, unused-wildcard-import
+
+class RouteMatch(NamedTuple):
+    """
+    `RouteMatch`
+
+    A route found by a `URIRouter`, along with the parts of the path it matched.
+    """
+    route: Any
+    pattern: str
+    params: Dict[str, str]
+    rest: Tuple[str, ...]
+
+class _Route(NamedTuple):
+    route: Any
+    pattern: str
+    names: Tuple[str, ...]
+
+class _RouteNode:
+    #a single segment of every pattern added, and the segments that can come after it
+    __slots__ = ("literals", "param", "route", "wildcard")
+
+    def __init__(self):
+        self.literals:Dict[str, _RouteNode] = {}
+        self.param:Optional[_RouteNode] = None
+        self.route:Optional[_Route] = None
+        self.wildcard:Optional[_Route] = None
+
+def _segments(path:Union[str, URIPath, Iterable[str]]) -> List[str]:
+    #every segment of a path, without its root or any empty segments
+    if isinstance(path, str):
+        return [s for s in path.split("/") if s not in ("", ".")]
+    return [s for s in path if s not in ("/", "//")]
+
+class URIRouter:
+    """
+    `URIRouter`
+
+    Matches uris against many route patterns at once, such as `/users/{id}/files/*`,
+    made of literal segments, `{name}` placeholders matching any single segment, and a trailing
+    `*` matching every segment left, if any.
+
+    Every pattern is kept in a tree of segments for each host, so finding the route of a uri
+    only takes as long as its path is deep, no matter how many patterns there are.
+    Literal segments are always preferred to placeholders, and placeholders to wildcards.
+    """
+
+    def __init__(self, routes:Optional[Iterable[Tuple[str, Any]]] = None):
+        self._hosts:Dict[Optional[str], _RouteNode] = {}
+        self._count:int = 0
+        if routes is not None:
+            for pattern, route in routes:
+                self.add(pattern, route)
+
+    def __len__(self):
+        return self._count
+
+    def add(self, pattern:str, route:Any = None, host:Optional[str] = None):
+        """
+        `add`
+
+        Arguments:
+            `pattern` -- The path pattern to match, such as `/users/{id}/files/*`.
+            `route` -- What to give back when the pattern is matched, defaulting to `pattern`.
+
+        Keyword Arguments:
+            `host` -- The host the pattern is only for, or `None` to match any host;
+                patterns for a given host are always preferred to those for any host.
+
+        Raises:
+            ValueError: Raised when the pattern is malformed, or was already added for the host.
+        """
+        if route is None:
+            route = pattern
+        if host is not None:
+            host = host.lower()
+
+        segments = _segments(pattern)
+        wildcard = len(segments) > 0 and segments[-1] == "*"
+        if wildcard:
+            segments.pop()
+
+        #the whole pattern is checked before any node is made,
+        #so a rejected pattern never leaves any part of itself to be matched
+        names:List[str] = []
+        for segment in segments:
+            if segment[:1] == "{" and segment[-1:] == "}" and len(segment) > 2:
+                names.append(segment[1:-1])
+            elif "{" in segment or "}" in segment or segment == "*":
+                raise ValueError(f"malformed route pattern: {pattern!r}")
+        if len(set(names)) != len(names):
+            raise ValueError(f"repeated placeholder in route pattern: {pattern!r}")
+
+        node = self._hosts.get(host)
+        if node is None:
+            node = self._hosts[host] = _RouteNode()
+        for segment in segments:
+            if segment[:1] == "{" and segment[-1:] == "}" and len(segment) > 2:
+                if node.param is None:
+                    node.param = _RouteNode()
+                node = node.param
+            else:
+                child = node.literals.get(segment)
+                if child is None:
+                    child = node.literals[segment] = _RouteNode()
+                node = child
+
+        #a conflicting route is only ever found on nodes that were already there
+        found = node.wildcard if wildcard else node.route
+        if found is not None:
+            raise ValueError(f"route pattern {pattern!r} conflicts with {found.pattern!r}")
+        if wildcard:
+            node.wildcard = _Route(route, pattern, tuple(names))
+        else:
+            node.route = _Route(route, pattern, tuple(names))
+        self._count += 1
+
+    def match_path(self,
+                   path:Union[str, URIPath, Iterable[str]],
+                   host:Optional[str] = None
+                  ) -> Optional[RouteMatch]:
+        """
+        `match_path`
+
+        Arguments:
+            `path` -- The path to find the route of, as a string, a `URIPath`,
+                or its segments directly (such as `URIPath.parts`).
+
+        Keyword Arguments:
+            `host` -- The host the path is on, if any.
+
+        Returns:
+            The best matching route, or `None` if no route matched.
+        """
+        segments = _segments(path)
+        if host is not None:
+            node = self._hosts.get(host.lower())
+            if node is not None:
+                found = self._find(node, segments, 0, [])
+                if found is not None:
+                    return found
+        node = self._hosts.get(None)
+        if node is None:
+            return None
+        return self._find(node, segments, 0, [])
+
+    def match(self, uri:URI) -> Optional[RouteMatch]:
+        """
+        `match`
+
+        Arguments:
+            `uri` -- The uri to find the route of, by its host and path.
+
+        Returns:
+            The best matching route, or `None` if no route matched.
+        """
+        path = uri.path
+        return self.match_path(() if path is None else path.raw, uri.host or None)
+
+    @staticmethod
+    def _find(node:_RouteNode,
+              segments:List[str],
+              i:int,
+              values:List[str]
+             ) -> Optional[RouteMatch]:
+        #a depth first search from the `i`th segment on, trying the literal segment first,
+        #then any placeholder, and then any wildcard
+        if i == len(segments):
+            if node.route is not None:
+                return RouteMatch(node.route.route,
+                                  node.route.pattern,
+                                  dict(zip(node.route.names, values)),
+                                  ())
+        else:
+            child = node.literals.get(segments[i])
+            if child is not None:
+                found = URIRouter._find(child, segments, i + 1, values)
+                if found is not None:
+                    return found
+            if node.param is not None:
+                values.append(segments[i])
+                found = URIRouter._find(node.param, segments, i + 1, values)
+                if found is not None:
+                    return found
+                values.pop()
+        if node.wildcard is not None:
+            return RouteMatch(node.wildcard.route,
+                              node.wildcard.pattern,
+                              dict(zip(node.wildcard.names, values)),
+                              tuple(segments[i:]))
+        return None
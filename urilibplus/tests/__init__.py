@@ -6,3 +6,12 @@ Holds all defined tests.
 
 from .module_tests import *
 from .tools_tests import *
+from .frame_tests import *
+from .batch_tests import *
+from .instrumentation_tests import *
+from .codec_tests import *
+from .uri_bytes_tests import *
+from .router_tests import *
+from .patterns_tests import *
+from .uri_path_tests import *
+from .uri_query_tests import *
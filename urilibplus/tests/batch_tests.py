@@ -0,0 +1,113 @@
+""" 
+`batch_tests`
+
+Holds tests that relate to processing batches of uris.
+"""
+
+import os
+import unittest
+from io import StringIO
+from tempfile import TemporaryDirectory
+from contextlib import redirect_stdout
+from urilibplus import URI
+from urilibplus.batch import process_many
+from urilibplus.__main__ import main
+
+class TestProcessMany(unittest.TestCase):
+    """
+    `TestProcessMany`
+
+    Test cases for the `process_many` function.
+    """
+
+    URI_EXAMPLES = ["http://www.example.com/index.html?field1=value1",
+                    "http://www.exa mple.com/",
+                    "http://[::1/a",
+                    "https://user@example.org:8443/a/b#frag"] * 5
+
+    def check_results(self, workers:int):
+        """
+        `check_results`
+
+        Checks that `process_many` gives the expected results, in order,
+        with the given amount of `workers`.
+        """
+        results = list(process_many(self.URI_EXAMPLES, workers = workers, chunksize = 3))
+        self.assertEqual(len(results), len(self.URI_EXAMPLES))
+        for result, example in zip(results, self.URI_EXAMPLES):
+            if example == "http://[::1/a":
+                self.assertIsNone(result.encoded)
+                self.assertFalse(result.valid)
+                assert result.error is not None
+                self.assertIn("ValueError", result.error)
+            else:
+                self.assertEqual(result.encoded, URI(example).encode())
+                self.assertEqual(result.valid, URI(example).validate())
+                self.assertIsNone(result.error)
+
+    def test_in_process(self):
+        """
+        `test_in_process`
+        
+        Tests that `process_many` handles every uri in order when not using other processes.
+        """
+        self.check_results(1)
+
+    def test_pool(self):
+        """
+        `test_pool`
+        
+        Tests that `process_many` handles every uri in order when using a pool of processes.
+        """
+        self.check_results(2)
+
+    def test_arguments(self):
+        """
+        `test_arguments`
+        
+        Tests that a bad chunk size is refused as soon as `process_many` is called,
+        without reading any of the uris.
+        """
+        read = []
+        def uris():
+            read.append("read")
+            yield "http://example.com/"
+        with self.assertRaises(ValueError):
+            process_many(uris(), workers = 1, chunksize = 0)
+        self.assertEqual(read, [])
+        self.assertEqual(len(list(process_many(uris(), workers = 1))), 1)
+
+    def test_command(self):
+        """
+        `test_command`
+        
+        Tests that the `validate` command writes a line for every uri given,
+        or only those that are not valid when asked to.
+        """
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, "uris.txt")
+            with open(path, "w", encoding="utf-8") as file:
+                file.write("\n".join(self.URI_EXAMPLES[:4]) + "\n")
+
+            output = StringIO()
+            with redirect_stdout(output):
+                code = main(["validate", "--workers", "1", path])
+            self.assertEqual(code, 1)
+            lines = output.getvalue().splitlines()
+            self.assertEqual(len(lines), 4)
+            self.assertEqual(lines[0], "valid\t" + URI(self.URI_EXAMPLES[0]).encode())
+            self.assertTrue(lines[2].startswith("error\t"))
+
+            output = StringIO()
+            with redirect_stdout(output):
+                main(["validate", "--workers", "1", "--invalid-only", path])
+            self.assertEqual(len(output.getvalue().splitlines()), 2)
+
+            output = StringIO()
+            with redirect_stdout(output):
+                main(["validate", "--workers", "1", "--quote", "--quote-safe", ":/", path])
+            self.assertEqual(output.getvalue().splitlines()[0],
+                             "valid\t" + URI(self.URI_EXAMPLES[0]).encode(True, ":/"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+""" 
+`codec_tests`
+
+Holds tests that relate to the percent encoding functions of `urilibplus`.
+"""
+
+import unittest
+from urllib.parse import quote as urllib_quote, unquote as urllib_unquote, unquote_to_bytes
+from urilibplus import URI
+from urilibplus.codec import quote, quote_bytes, quoter, unquote, unquote_bytes
+
+class TestCodec(unittest.TestCase):
+    """
+    `TestCodec`
+
+    Test cases for the `codec` module.
+    """
+
+    STRING_EXAMPLES = ["", "plain", "a b/c?d=e&f", "é中", "%41%e9%C3%A9", "%zz%4", "100%", "~-._"]
+    SAFE_EXAMPLES = ["", "/", ":@/", "é=&", "%"]
+
+    def test_quote(self):
+        """
+        `test_quote`
+        
+        Tests that `quote` matches `urllib.parse.quote` for strings, bytes and memoryviews.
+        """
+        for example in self.STRING_EXAMPLES:
+            for safe in self.SAFE_EXAMPLES:
+                expected = urllib_quote(example, safe)
+                self.assertEqual(quote(example, safe), expected)
+                self.assertEqual(quote(example.encode(), safe), expected)
+                self.assertEqual(quote(memoryview(example.encode()), safe), expected)
+                self.assertEqual(quote_bytes(bytearray(example.encode()), safe), expected.encode())
+        self.assertEqual(quote("a/b c"), "a/b%20c")
+
+    def test_quote_fast_path(self):
+        """
+        `test_quote_fast_path`
+        
+        Tests that strings with nothing to quote are given back as is,
+        and that every `quoter` is only built once.
+        """
+        example = "already-safe/path"
+        self.assertIs(quote(example), example)
+        self.assertIs(quoter(":@"), quoter(":@"))
+
+    def test_unquote(self):
+        """
+        `test_unquote`
+        
+        Tests that `unquote` and `unquote_bytes` match `urllib.parse` for strings and bytes.
+        """
+        for example in self.STRING_EXAMPLES:
+            self.assertEqual(unquote(example), urllib_unquote(example))
+            self.assertEqual(unquote(example.encode()), urllib_unquote(example.encode()))
+            self.assertEqual(unquote_bytes(memoryview(example.encode())),
+                             unquote_to_bytes(example.encode()))
+        self.assertEqual(unquote("%e9", "latin-1"), "é")
+
+    def test_uri_methods(self):
+        """
+        `test_uri_methods`
+        
+        Tests that `URI.quotestr` and `URI.unquotestr` use the codec.
+        """
+        self.assertEqual(URI.quotestr("a b"), "a%20b")
+        self.assertEqual(URI.unquotestr("a%20b"), "a b")
+
+if __name__ == '__main__':
+    unittest.main()
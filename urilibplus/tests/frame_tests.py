@@ -0,0 +1,88 @@
+""" 
+`frame_tests`
+
+Holds tests that relate to the `URIFrame` class.
+"""
+
+import unittest
+from importlib.util import find_spec
+from urilibplus import URI, URIFrame
+
+@unittest.skipIf(find_spec("numpy") is None, "`URIFrame` requires `numpy`")
+class TestURIFrame(unittest.TestCase):
+    """
+    `TestURIFrame`
+
+    Test cases for the `URIFrame` object with given examples.
+    """
+
+    URI_EXAMPLES = ("https://www.example.com/index.html?field1=value1",
+                    "http://www.example.com:8080/a/b",
+                    "https://user@example.org:8443/c#frag",
+                    "https://www.example.com/d")
+
+    def test_roundtrip(self):
+        """
+        `test_roundtrip`
+        
+        Tests that every uri in a `URIFrame` converts back to the same `URI`.
+        """
+        frame = URIFrame.from_strings(self.URI_EXAMPLES)
+        self.assertEqual(len(frame), len(self.URI_EXAMPLES))
+        for obj, example in zip(frame, self.URI_EXAMPLES):
+            self.assertEqual(obj.encode(), URI(example).encode())
+        from_uris = URIFrame.from_uris(URI(example) for example in self.URI_EXAMPLES)
+        self.assertEqual([u.encode() for u in from_uris.to_uris()],
+                         [URI(example).encode() for example in self.URI_EXAMPLES])
+
+    def test_filter(self):
+        """
+        `test_filter`
+        
+        Tests that `URIFrame.where` keeps only the uris matching every condition given.
+        """
+        frame = URIFrame.from_strings(self.URI_EXAMPLES)
+        https = frame.where(scheme = "https", port = {None, 8443})
+        self.assertEqual(https.column("host"),
+                         ["www.example.com", "example.org", "www.example.com"])
+        self.assertEqual(len(frame.where(scheme = "ftp")), 0)
+        self.assertEqual(frame.where(port = 8080)[0].encode(), URI(self.URI_EXAMPLES[1]).encode())
+
+    def test_count_by(self):
+        """
+        `test_count_by`
+        
+        Tests that `URIFrame.count_by` counts every value of a column.
+        """
+        frame = URIFrame.from_strings(self.URI_EXAMPLES)
+        self.assertEqual(frame.count_by("host"), {"www.example.com":3, "example.org":1})
+        self.assertEqual(frame.count_by("port"), {None:2, 8080:1, 8443:1})
+
+    def test_filter_subset(self):
+        """
+        `test_filter_subset`
+        
+        Tests that a filtered `URIFrame` can be filtered again, with values missing from it ignored.
+        """
+        frame = URIFrame.from_strings(self.URI_EXAMPLES)
+        self.assertFalse(hasattr(frame, "_indexes"))
+        https = frame.where(scheme = "https")
+        self.assertEqual(https.where(path = ["/d", "/missing", "/d"]).column("path"), ["/d"])
+        self.assertEqual(len(https.where(host = "nowhere.example")), 0)
+
+    def test_large_port(self):
+        """
+        `test_large_port`
+        
+        Tests that ports beyond 32 bits are stored and matched, and ones beyond 64 bits refused.
+        """
+        frame = URIFrame.from_strings(["http://a:70000/", "http://b:3000000000/", "http://c/"])
+        self.assertEqual(frame.column("port"), [70000, 3000000000, None])
+        self.assertEqual(frame.where(port = 3000000000).column("host"), ["b"])
+        self.assertEqual(len(frame.where(port = 2 ** 70)), 0)
+        self.assertEqual(frame[1].port, 3000000000)
+        with self.assertRaises(ValueError):
+            URIFrame.from_strings(["http://a:" + "9" * 20 + "/"])
+
+if __name__ == '__main__':
+    unittest.main()
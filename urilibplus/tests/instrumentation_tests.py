@@ -0,0 +1,136 @@
+""" 
+`instrumentation_tests`
+
+Holds tests that relate to the optional instrumentation of `urilibplus`.
+"""
+
+import unittest
+from urilibplus import URI, URIQuery, BytesURI, instrumentation
+from urilibplus.uri import URI as _URI, urisplit
+
+class TestInstrumentation(unittest.TestCase):
+    """
+    `TestInstrumentation`
+
+    Test cases for the `instrumentation` module.
+    """
+
+    def setUp(self):
+        instrumentation.disable()
+        instrumentation.reset()
+
+    def tearDown(self):
+        instrumentation.disable()
+        instrumentation.reset()
+
+    def test_disabled(self):
+        """
+        `test_disabled`
+        
+        Tests that nothing is wrapped or recorded while disabled.
+        """
+        original = vars(_URI)["encode"]
+        URI("http://example.com/a?b=c").encode()
+        self.assertFalse(instrumentation.enabled())
+        self.assertIs(vars(_URI)["encode"], original)
+        self.assertTrue(all(s.calls == 0 for s in instrumentation.snapshot().values()))
+
+    def test_profiling(self):
+        """
+        `test_profiling`
+        
+        Tests that the `profiling` context manager records each operation,
+        and restores every operation exactly once exited.
+        """
+        #looked up through the class, as `_parse` is inherited
+        originals = {name:getattr(_URI, name) for name in ("_parse", "authority", "encode")}
+        original_init = vars(BytesURI)["__init__"]
+        with instrumentation.profiling() as snapshot:
+            uri = URI("http://user@example.com:80/a/b?c=d&e=f#g")
+            uri.query # pylint: disable=pointless-statement
+            uri.encode()
+            uri.validate()
+            URIQuery("x=y")
+            stats = snapshot()
+        self.assertFalse(instrumentation.enabled())
+        for name, original in originals.items():
+            self.assertIs(getattr(_URI, name), original)
+        self.assertIs(vars(BytesURI)["__init__"], original_init)
+
+        self.assertEqual(stats["URI.parse"].calls, 1)
+        self.assertEqual(stats["URI.validate"].calls, 1)
+        self.assertGreaterEqual(stats["URI.encode"].calls, 1)
+        self.assertGreaterEqual(stats["URIQuery.parse"].calls, 2)
+        self.assertGreater(stats["URI.parse"].seconds, 0.0)
+
+        URI("http://example.com/")
+        self.assertEqual(instrumentation.snapshot()["URI.parse"].calls, 1)
+        instrumentation.reset()
+        self.assertEqual(instrumentation.snapshot()["URI.parse"].calls, 0)
+
+    def test_authority(self):
+        """
+        `test_authority`
+        
+        Tests that parsing an authority is recorded, whether set or parsed with the rest of a uri,
+        while still working as before.
+        """
+        with instrumentation.profiling(reset_stats = True) as snapshot:
+            uri = URI("http://example.com/")
+            self.assertEqual(snapshot()["URI.authority"].calls, 1)
+            uri.authority = "user@other.org:8080"
+            self.assertEqual(snapshot()["URI.authority"].calls, 2)
+            self.assertEqual(urisplit("http://a.org:81/").port, 81)
+            self.assertEqual(snapshot()["URI.authority"].calls, 3)
+        self.assertEqual(uri.host, "other.org")
+        self.assertEqual(uri.port, 8080)
+
+    def test_bytes_uri(self):
+        """
+        `test_bytes_uri`
+        
+        Tests that parsing and encoding a `BytesURI` is recorded.
+        """
+        with instrumentation.profiling(reset_stats = True) as snapshot:
+            uri = BytesURI(b"http://example.com/a?b=c")
+            self.assertEqual(uri.encode(), b"http://example.com/a?b=c")
+            stats = snapshot()
+        self.assertEqual(stats["BytesURI.parse"].calls, 1)
+        self.assertEqual(stats["BytesURI.encode"].calls, 1)
+
+    def test_str_and_batches(self):
+        """
+        `test_str_and_batches`
+        
+        Tests that encoding through `str` and `repr`, and parsing in batches, are recorded.
+        """
+        with instrumentation.profiling(reset_stats = True) as snapshot:
+            uri = URI("http://example.com/a?b=c")
+            self.assertEqual(str(uri), "http://example.com/a?b=c")
+            self.assertEqual(repr(uri), "http://example.com/a?b=c")
+            before = snapshot()
+            str(uri.path)
+            repr(uri.query)
+            URI.parse_many(["http://a.org/", "http://b.org/", "http://a.org/"])
+            stats = snapshot()
+        self.assertEqual(before["URI.encode"].calls, 2)
+        self.assertEqual(stats["URIPath.encode"].calls - before["URIPath.encode"].calls, 1)
+        self.assertEqual(stats["URIQuery.encode"].calls - before["URIQuery.encode"].calls, 1)
+        self.assertEqual(stats["URI.parse"].calls, 4)
+        self.assertEqual(str(uri), "http://example.com/a?b=c")
+
+    def test_nested(self):
+        """
+        `test_nested`
+        
+        Tests that an inner `profiling` does not disable an outer one.
+        """
+        instrumentation.enable()
+        with instrumentation.profiling():
+            pass
+        self.assertTrue(instrumentation.enabled())
+        instrumentation.disable()
+        self.assertFalse(instrumentation.enabled())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,122 @@
+"""
+`patterns_tests`
+
+Holds tests that relate to the `URIPatternSet` class of `urilibplus`.
+"""
+
+import unittest
+from random import Random
+from re import compile as regexcompile, escape as regexescape, IGNORECASE, VERBOSE
+from urilibplus import URI, URIPath, URIQuery, URIPatternSet
+from urilibplus.tools import compiled
+
+class TestURIPatternSet(unittest.TestCase):
+    """
+    `TestURIPatternSet`
+
+    Test cases for the `URIPatternSet` class.
+    """
+
+    PATTERNS = ["ads?\\.",
+                "track(er|ing)?",
+                "(?P<name>evil)",
+                "(a)\\1",
+                regexcompile("FOO", IGNORECASE),
+                regexcompile("x  # a comment", VERBOSE),
+                "^utm_"]
+
+    URI = "https://ads.example.com/tracker/Foo/x?utm_source=evil&aa=zz"
+
+    def test_pattern_set_search(self):
+        """
+        `test_pattern_set_search`
+        
+        Tests that every pattern found is reported, whether combined with others or not.
+        """
+        uri = URI(self.URI)
+        for chunk_size in (1, 2, 64):
+            patterns = URIPatternSet(self.PATTERNS, chunk_size=chunk_size)
+            self.assertEqual(len(patterns), len(self.PATTERNS))
+            expected = [i for i, p in enumerate(patterns) if p.search(self.URI) is not None]
+            self.assertEqual(expected, [0, 1, 2, 3, 4, 5])
+            self.assertEqual(patterns.search(uri), expected)
+            self.assertEqual(patterns.search(self.URI), expected)
+            self.assertEqual(patterns.search("https://site.org/"), [])
+            self.assertTrue(patterns.ismatch(uri))
+            self.assertFalse(patterns.ismatch("https://site.org/"))
+
+    def test_pattern_set_random(self):
+        """
+        `test_pattern_set_random`
+        
+        Tests that random literal and regex patterns are found as searching for each one would.
+        """
+        rand = Random(0)
+        for _ in range(20):
+            texts = ["".join(rand.choice("abAB./?é") for _ in range(rand.randint(0, 12)))
+                     for _ in range(20)]
+            patterns = []
+            for _ in range(rand.randint(1, 40)):
+                literal = "".join(rand.choice("abAB./?é") for _ in range(rand.randint(1, 3)))
+                pattern = rand.choice((regexescape(literal),
+                                       "^" + regexescape(literal),
+                                       regexescape(literal) + "+",
+                                       regexescape(literal[0]).join("()") + "\\1"))
+                patterns.append(regexcompile(pattern, rand.choice((0, IGNORECASE))))
+            patternset = URIPatternSet(patterns, chunk_size=rand.randint(1, 8))
+            for text in texts:
+                expected = [i for i, p in enumerate(patterns) if p.search(text) is not None]
+                self.assertEqual(patternset.search(text), expected)
+                self.assertEqual(patternset.ismatch(text), len(expected) > 0)
+
+    def test_pattern_set_targets(self):
+        """
+        `test_pattern_set_targets`
+        
+        Tests that patterns can be searched for in path segments, query keys, and query values.
+        """
+        uri = URI(self.URI)
+        assert uri.path is not None and uri.query is not None
+        patterns = URIPatternSet(self.PATTERNS)
+        self.assertEqual(patterns.search(uri, "segments"), [1, 4, 5])
+        self.assertEqual(patterns.search(uri.path, "segments"), [1, 4, 5])
+        self.assertEqual(patterns.search(URIPath("/a/x"), "segments"), [5])
+        self.assertEqual(patterns.search(uri, "keys"), [3, 6])
+        self.assertEqual(patterns.search(uri, "values"), [2])
+        self.assertEqual(patterns.search(URIQuery("b=tracking"), "values"), [1])
+        self.assertEqual(patterns.search(URI("https://example.com"), "keys"), [])
+        self.assertTrue(patterns.ismatch(uri.query, "values"))
+        with self.assertRaises(ValueError):
+            patterns.search(uri, "host") #type:ignore
+
+    def test_pattern_set_add(self):
+        """
+        `test_pattern_set_add`
+        
+        Tests that patterns added after searching are found, and that flags apply to them.
+        """
+        patterns = URIPatternSet(flags=IGNORECASE)
+        self.assertEqual(patterns.search("anything"), [])
+        self.assertEqual(patterns.add("ANY"), 0)
+        self.assertEqual(patterns.search("anything"), [0])
+        self.assertEqual(patterns.add("thing$"), 1)
+        self.assertEqual(patterns.search("anything"), [0, 1])
+        with self.assertRaises(ValueError):
+            URIPatternSet(chunk_size=0)
+
+    def test_compiled_search(self):
+        """
+        `test_compiled_search`
+        
+        Tests that string patterns are only compiled once, and searching queries runs as before.
+        """
+        self.assertIs(compiled("a+b"), compiled("a+b"))
+        pattern = regexcompile("c+")
+        self.assertIs(compiled(pattern), pattern)
+
+        query = URIQuery("a=1&b=2&ab=3")
+        found = [(k and k.group(), v and v.group()) for k, v in query.search("a", "3")]
+        self.assertEqual(found, [("a", None), ("a", "3")])
+        found = [(k, v and v.group()) for k, v in query.search(valmatch="[12]")]
+        self.assertEqual(found, [(None, "1"), (None, "2")])
+        self.assertEqual(list(query.search()), [])
@@ -0,0 +1,112 @@
+"""
+`router_tests`
+
+Holds tests that relate to the `URIRouter` class of `urilibplus`.
+"""
+
+import unittest
+from urilibplus import URI, URIPath, URIRouter
+from urilibplus.router import RouteMatch
+from urilibplus.typings import Optional
+
+class TestURIRouter(unittest.TestCase):
+    """
+    `TestURIRouter`
+
+    Test cases for the `URIRouter` class.
+    """
+
+    ROUTES = [("/users/{id}", "user"),
+              ("/users/me", "me"),
+              ("/users/{id}/files/*", "files"),
+              ("/users/{uid}/posts/{pid}", "post"),
+              ("/static/*", "static"),
+              ("/", "root")]
+
+    def matched(self, found:Optional[RouteMatch]) -> RouteMatch:
+        """
+        `matched`
+        
+        Asserts that a route was found, giving back what was found.
+        """
+        assert found is not None
+        return found
+
+    def test_router_match(self):
+        """
+        `test_router_match`
+        
+        Tests that paths match the best route, with their placeholders and wildcards filled in.
+        """
+        router = URIRouter(self.ROUTES)
+        self.assertEqual(len(router), len(self.ROUTES))
+
+        found = self.matched(router.match_path("/users/5"))
+        self.assertEqual((found.route, found.params, found.rest), ("user", {"id":"5"}, ()))
+        self.assertEqual(self.matched(router.match_path("/users/me")).route, "me")
+        found = self.matched(router.match_path("/users/me/posts/3"))
+        self.assertEqual((found.route, found.params), ("post", {"uid":"me", "pid":"3"}))
+        found = self.matched(router.match_path("/users/5/files/a/b/"))
+        self.assertEqual((found.route, found.params, found.rest),
+                         ("files", {"id":"5"}, ("a", "b")))
+        self.assertEqual(self.matched(router.match_path("/users/5/files")).rest, ())
+        self.assertEqual(self.matched(router.match_path("/static/app.css")).rest, ("app.css",))
+        self.assertEqual(self.matched(router.match_path("/")).route, "root")
+        self.assertIsNone(router.match_path("/missing"))
+        self.assertIsNone(router.match_path("/users/5/posts"))
+
+    def test_router_path_forms(self):
+        """
+        `test_router_path_forms`
+        
+        Tests that paths can be given as strings, `URIPath` objects, or their parts.
+        """
+        router = URIRouter(self.ROUTES)
+        for path in ("/users/7", URIPath("/users/7"), URIPath("/users/7").parts, ["users", "7"]):
+            self.assertEqual(self.matched(router.match_path(path)).params, {"id":"7"})
+
+    def test_router_hosts(self):
+        """
+        `test_router_hosts`
+        
+        Tests that routes for a host are preferred to those for any host.
+        """
+        router = URIRouter(self.ROUTES)
+        router.add("/users/{name}", "api user", host="API.example.com")
+        found = self.matched(router.match(URI("https://api.example.com/users/9")))
+        self.assertEqual((found.route, found.params), ("api user", {"name":"9"}))
+        self.assertEqual(self.matched(router.match(URI("https://api.example.com/users/me"))).route,
+                         "api user")
+        self.assertEqual(self.matched(router.match(URI("https://api.example.com/static/a"))).route,
+                         "static")
+        self.assertEqual(self.matched(router.match(URI("https://www.example.com/users/9"))).route,
+                         "user")
+
+    def test_router_errors(self):
+        """
+        `test_router_errors`
+        
+        Tests that malformed and conflicting patterns are refused.
+        """
+        router = URIRouter(self.ROUTES)
+        self.assertRaises(ValueError, router.add, "/users/{other}", "conflict")
+        self.assertRaises(ValueError, router.add, "/a/*/b")
+        self.assertRaises(ValueError, router.add, "/a/file.{ext}")
+        self.assertRaises(ValueError, router.add, "/a/{x}/{x}")
+        router.add("/users/{id}", "other host", host="example.com")
+        self.assertEqual(len(router), len(self.ROUTES) + 1)
+
+    def test_router_rejected_left_out(self):
+        """
+        `test_router_rejected_left_out`
+        
+        Tests that a refused pattern leaves nothing behind for later patterns or matches.
+        """
+        router = URIRouter()
+        self.assertRaises(ValueError, router.add, "/fresh/{x}/{x}", host="example.com")
+        self.assertRaises(ValueError, router.add, "/fresh/{x}/file.{ext}")
+        self.assertEqual(router._hosts, {}) #pylint: disable=protected-access
+        router.add("/fresh/*", "fresh")
+        found = self.matched(router.match(URI("https://example.com/fresh/a/a")))
+        self.assertEqual((found.route, found.rest), ("fresh", ("a", "a")))
+        self.assertEqual(len(router), 1)
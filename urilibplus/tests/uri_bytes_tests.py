@@ -0,0 +1,96 @@
+""" 
+`uri_bytes_tests`
+
+Holds tests that relate to uris parsed from bytes.
+"""
+
+import unittest
+from urilibplus import URI, BytesURI
+
+class TestBytesURI(unittest.TestCase):
+    """
+    `TestBytesURI`
+
+    Test cases for the `BytesURI` class.
+    """
+
+    URI_EXAMPLE = b"https://user@www.example.com:8080/a/b%20c?x=1&y=2#frag"
+
+    def test_components(self):
+        """
+        `test_components`
+        
+        Tests that every component is a view of the original content, matching `URI`.
+        """
+        content = bytearray(b"  " + self.URI_EXAMPLE + b"\r\n")
+        uri = BytesURI(content)
+        self.assertIsInstance(uri.host, memoryview)
+        self.assertEqual(bytes(uri.scheme), b"https")
+        self.assertEqual(bytes(uri.authority), b"user@www.example.com:8080")
+        self.assertEqual(bytes(uri.userinfo), b"user")
+        self.assertEqual(bytes(uri.host), b"www.example.com")
+        self.assertEqual(uri.port, 8080)
+        self.assertEqual(bytes(uri.path), b"/a/b%20c")
+        self.assertEqual(bytes(uri.query), b"x=1&y=2")
+        self.assertEqual(bytes(uri.fragment), b"frag")
+
+        #no copy was made, so changing the content changes the views
+        content[2:7] = b"HTTPS"
+        self.assertEqual(bytes(uri.scheme), b"HTTPS")
+
+        expected = URI(self.URI_EXAMPLE.decode())
+        assert expected.query is not None
+        self.assertEqual(bytes(uri.host).decode(), expected.host)
+        self.assertEqual(bytes(uri.query).decode(), expected.query.encode())
+
+    def test_missing_components(self):
+        """
+        `test_missing_components`
+        
+        Tests that missing components are empty, and that an empty authority is kept.
+        """
+        uri = BytesURI(memoryview(b"/only/a/path"))
+        self.assertFalse(uri.hasauthority())
+        self.assertEqual(bytes(uri.scheme), b"")
+        self.assertIsNone(uri.port)
+        self.assertEqual(bytes(uri.path), b"/only/a/path")
+        self.assertTrue(BytesURI(b"file:///etc/hosts").hasauthority())
+        with self.assertRaises(ValueError):
+            BytesURI(b"http://[::1/a")
+        with self.assertRaises(ValueError):
+            BytesURI(b"http://host:abc/")
+
+    def test_encode(self):
+        """
+        `test_encode`
+        
+        Tests that `BytesURI` encodes straight back to the same bytes, quoted or unquoted.
+        """
+        uri = BytesURI(self.URI_EXAMPLE)
+        self.assertEqual(uri.encode(), self.URI_EXAMPLE)
+        self.assertEqual(bytes(uri), self.URI_EXAMPLE)
+        self.assertEqual(uri, self.URI_EXAMPLE)
+        self.assertEqual(uri.encode(False), self.URI_EXAMPLE.replace(b"%20", b" "))
+        self.assertEqual(uri.encode(True, ":/?#@&=%"), self.URI_EXAMPLE)
+        self.assertEqual(uri.to_uri().host, "www.example.com")
+
+    def test_replaced(self):
+        """
+        `test_replaced`
+        
+        Tests that `BytesURI.replaced` only changes the components given.
+        """
+        uri = BytesURI(self.URI_EXAMPLE)
+        self.assertEqual(uri.replaced(host = b"other.org", fragment = b"top").encode(),
+                         b"https://user@other.org:8080/a/b%20c?x=1&y=2#top")
+        self.assertEqual(uri.replaced(authority = b"h").encode(),
+                         b"https://h/a/b%20c?x=1&y=2#frag")
+        with self.assertRaises(ValueError):
+            uri.replaced(authority = b"h", port = b"1")
+        with self.assertRaises(ValueError):
+            BytesURI(b"/path").replaced(query = b"a=1")
+        with self.assertRaises(KeyError):
+            uri.replaced(nothing = b"")
+
+if __name__ == '__main__':
+    unittest.main()
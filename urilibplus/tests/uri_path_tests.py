@@ -0,0 +1,144 @@
+""" 
+`uri_path_tests`
+
+Holds tests that relate to the `URIPath` class.
+"""
+
+import unittest
+from pathlib import PurePosixPath
+from urilibplus import URIPath
+
+class TestURIPathSegments(unittest.TestCase):
+    """
+    Tests for the segment list kept by `URIPath`.
+    """
+
+    def test_path_segments_indexing(self):
+        """
+        `test_path_segments_indexing`
+        
+        Tests that indexing a path gives single segments, and slicing gives lists of them.
+        """
+        path = URIPath("/a/b/c")
+        self.assertEqual(path.parts, ("/", "a", "b", "c"))
+        self.assertEqual(path[1], "a")
+        self.assertEqual(path[-1], "c")
+        self.assertEqual(path[1:], ["a", "b", "c"])
+        self.assertEqual(list(path), ["/", "a", "b", "c"])
+
+    def test_path_segments_mutation(self):
+        """
+        `test_path_segments_mutation`
+        
+        Tests that every mutation keeps the path and its `pathlib` view in step.
+        """
+        path = URIPath("/a/b/c")
+        path.append("d")
+        path[1] = "x"
+        del path[2]
+        path.insert(1, "i")
+        path.remove("i")
+        self.assertEqual(path.parts, ("/", "x", "c", "d"))
+        self.assertEqual(str(path), "/x/c/d")
+        self.assertEqual(path, PurePosixPath("/x/c/d"))
+        self.assertEqual(hash(path), hash(PurePosixPath("/x/c/d")))
+        self.assertEqual(str(path.parent), "/x/c")
+        self.assertEqual(path.name, "d")
+
+        path.extend(("e", "f/g"))
+        self.assertEqual(str(path), "/x/c/d/e/f/g")
+        path.append("/root")
+        self.assertEqual(path.parts, ("/", "root"))
+        path.reverse()
+        self.assertEqual(path.parts, ("/", "root"))
+        path.clear()
+        self.assertEqual(str(path), ".")
+
+    def test_path_segments_search(self):
+        """
+        `test_path_segments_search`
+        
+        Tests that searching for segments finds the same positions a list would.
+        """
+        path = URIPath("/api/v2/users/v2")
+        self.assertIn("v2", path)
+        self.assertIn("api/users", path)
+        self.assertNotIn("v3", path)
+        self.assertEqual(path.index("v2"), 2)
+        self.assertEqual(path.index("v2", 3), 4)
+        self.assertEqual(path.rindex("v2"), 4)
+        self.assertEqual(path.rindex("v2", 0, -1), 2)
+        self.assertEqual(path.count("v2"), 2)
+        self.assertRaises(ValueError, path.index, "v2", 3, 4)
+        self.assertEqual(path.segafter("v2"), "users")
+        self.assertIsNone(path.segafter("v2", last=True))
+        self.assertEqual(path.segbefore("v2", last=True), "users")
+        self.assertIsNone(path.segbefore("v3"))
+
+        path.append("v3")
+        self.assertIn("v3", path)
+        self.assertEqual(path.segafter("v2", last=True), "v3")
+
+    def test_path_segments_parent(self):
+        """
+        `test_path_segments_parent`
+        
+        Tests that paths made by `pathlib` itself can be changed as any other path.
+        """
+        parent = URIPath("/a/b").parent
+        parent.append("c")
+        self.assertIsInstance(parent, URIPath)
+        self.assertEqual(parent.parts, ("/", "a", "c"))
+        self.assertEqual(parent.encode(), "/a/c")
+
+class TestURIPathCache(unittest.TestCase):
+    """
+    Tests for the values `URIPath` derives from its segments.
+    """
+
+    def test_path_cache_raw(self):
+        """
+        `test_path_cache_raw`
+        
+        Tests that every assignment to `raw` is seen by the `pathlib` methods.
+        """
+        path = URIPath("/a/b")
+        for name in ("c", "d", "e"):
+            path.raw = ["/", "x", name]
+            self.assertEqual(path.name, name)
+            self.assertEqual(str(path), f"/x/{name}")
+            self.assertEqual(path, PurePosixPath(f"/x/{name}"))
+            self.assertEqual(hash(path), hash(PurePosixPath(f"/x/{name}")))
+
+    def test_path_cache_reuse(self):
+        """
+        `test_path_cache_reuse`
+        
+        Tests that derived values are kept until the path changes, and then made again.
+        """
+        path = URIPath("/a b/c", requote=True)
+        encoded = path.encode()
+        self.assertIs(path.encode(), encoded)
+        self.assertIs(path.parts, path.parts)
+        self.assertEqual(encoded, "/a%20b/c")
+
+        path.append("d e")
+        self.assertEqual(path.encode(), "/a%20b/c/d%20e")
+        self.assertEqual(path.encode(False), "/a b/c/d e")
+        self.assertEqual(path.parts, ("/", "a b", "c", "d e"))
+
+    def test_path_cache_parent(self):
+        """
+        `test_path_cache_parent`
+        
+        Tests that paths made by `pathlib` itself are cleared when changed.
+        """
+        parent = URIPath("/a/b/c").parent
+        self.assertEqual(str(parent), "/a/b")
+        parent.raw = ["/", "z"]
+        self.assertEqual(str(parent), "/z")
+        self.assertEqual(parent.name, "z")
+        self.assertEqual(str(parent.parent), "/")
+
+if __name__ == '__main__':
+    unittest.main()
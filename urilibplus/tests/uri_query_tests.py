@@ -0,0 +1,217 @@
+""" 
+`uri_query_tests`
+
+Holds tests that relate to the `URIQuery` class and the parsing of queries.
+"""
+
+import unittest
+from urllib.parse import urlencode, quote
+from urilibplus import URIQuery, FrozenURIQuery
+from urilibplus.uri_query import querysplit, queryiter
+from urilibplus.typings import Callable, Literal, Tuple
+
+class TestURIQueryIndex(unittest.TestCase):
+    """
+    `TestURIQueryIndex`
+
+    Test cases for the key and value lookups of `URIQuery`.
+    """
+
+    def test_lookups(self):
+        """
+        `test_lookups`
+        
+        Tests that the indexed lookups match a plain scan of the query, in order.
+        """
+        query = URIQuery("a=1&b=2&a=3&c=&b=1")
+        self.assertEqual(query.getvalues("a"), ("1", "3"))
+        self.assertEqual(query.getvalues("missing"), ())
+        self.assertEqual(query.keyindexes("b", "a"), (0, 1, 2, 4))
+        self.assertEqual(query.valueindexes("1"), (0, 4))
+        self.assertEqual(tuple(query.querykeys("1", "2")), ("a", "b", "b"))
+        self.assertEqual(tuple(query.queryvalues("b")), ("2", "1"))
+        self.assertTrue(query.iskeyempty("c"))
+        self.assertFalse(query.iskeyempty("a"))
+
+    def test_lookups_after_change(self):
+        """
+        `test_lookups_after_change`
+        
+        Tests that the lookups are never stale after the query is changed.
+        """
+        query = URIQuery("a=1&b=2&a=3")
+        self.assertEqual(query.keyindexes("a"), (0, 2))
+        query.insert(0, ("a", "0"))
+        self.assertEqual(query.keyindexes("a"), (0, 1, 3))
+        query.setvalues("a", "x")
+        self.assertEqual(query.getvalues("a"), ("x", "x", "x"))
+        self.assertEqual(query.valueindexes("x"), (0, 1, 3))
+        query.append("d=4")
+        self.assertEqual(query.getvalues("d"), ("4",))
+        del query[0]
+        self.assertEqual(query.keyindexes("a"), (0, 2))
+
+    def test_delkey(self):
+        """
+        `test_delkey`
+        
+        Tests that `URIQuery.delkey` removes every entry of the key, keeping the rest in order.
+        """
+        query = URIQuery("a=1&b=2&a=3&c=4&a=5")
+        query.delkey("a")
+        self.assertEqual(query.encode(), "b=2&c=4")
+        self.assertEqual(query.keyindexes("a"), ())
+        query.delkey("missing")
+        self.assertEqual(query.encode(), "b=2&c=4")
+
+class TestURIQueryBulk(unittest.TestCase):
+    """
+    `TestURIQueryBulk`
+
+    Test cases for the in place and bulk changes to `URIQuery`.
+    """
+
+    def test_append_in_place(self):
+        """
+        `test_append_in_place`
+        
+        Tests that appending and extending keeps the same underlying list,
+        while still clearing any cached encodings.
+        """
+        query = URIQuery("a=1")
+        data = query.data
+        self.assertEqual(query.encode(), "a=1")
+        query.append(("b", "2"))
+        query.append("c=3&d=4")
+        query.extend([("e", "5")])
+        query.extend("f=6")
+        self.assertIs(query.data, data)
+        self.assertEqual(query.encode(), "a=1&b=2&c=3&d=4&e=5&f=6")
+
+    def test_rotate(self):
+        """
+        `test_rotate`
+        
+        Tests that `URIQuery.rotate` matches the `<<` and `>>` operators.
+        """
+        query = URIQuery("a=1&b=2&c=3")
+        self.assertEqual((query << 1).encode(), "b=2&c=3&a=1")
+        self.assertEqual((query >> 1).encode(), "c=3&a=1&b=2")
+        self.assertEqual((query << 4).encode(), "b=2&c=3&a=1")
+        self.assertEqual(query.encode(), "a=1&b=2&c=3")
+        query.rotate(-1)
+        self.assertEqual(query.encode(), "c=3&a=1&b=2")
+        URIQuery().rotate(3)
+
+    def test_build(self):
+        """
+        `test_build`
+        
+        Tests that `URIQuery.build` accepts both pairs and mappings of lists.
+        """
+        self.assertEqual(URIQuery.build([("a", "1"), ("a", "2")]).encode(), "a=1&a=2")
+        query = URIQuery.build({"a": ["1", "2"], "b": "3"}, requote = True)
+        self.assertEqual(query.encode(), "a=1&a=2&b=3")
+        self.assertTrue(query.requote)
+        self.assertIsInstance(FrozenURIQuery.build({"a": "1"}), FrozenURIQuery)
+
+    def test_update_many(self):
+        """
+        `test_update_many`
+        
+        Tests that `URIQuery.update_many` replaces every entry of each key given in the place
+        of its first entry, adding new keys to the end.
+        """
+        query = URIQuery("a=1&b=2&a=3&c=4")
+        query.update_many({"a": ["x", "y", "z"], "d": "5"})
+        self.assertEqual(query.encode(), "a=x&a=y&a=z&b=2&c=4&d=5")
+        query.update_many([("c", "6"), ("b", "7")])
+        self.assertEqual(query.encode(), "a=x&a=y&a=z&b=7&c=6&d=5")
+        with self.assertRaises(TypeError):
+            FrozenURIQuery("a=1").update_many({"a": "2"})
+
+class TestURIQueryEncode(unittest.TestCase):
+    """
+    `TestURIQueryEncode`
+
+    Test cases for how `URIQuery.encode` writes out a query.
+    """
+
+    PAIRS = [("a b", "c/d"), ("é", "x&y=z"), ("safe-_.~", ""), ("%", "+:@")]
+    CASES:Tuple[Tuple[Literal["upper", "lower", "preserve"], Callable[[str], str]], ...] = (
+        ("preserve", str), ("upper", str.upper), ("lower", str.lower))
+
+    def test_matches_urlencode(self):
+        """
+        `test_matches_urlencode`
+        
+        Tests that encoding gives the same result as `urllib.parse.urlencode` with
+        `urllib.parse.quote`, for every `quote_safe` and `force_case`.
+        """
+        for quote_safe in ("", "/", ":@/", "é&="):
+            for force_case, change in self.CASES:
+                for requote in (True, False):
+                    via = ((lambda s, *_, safe=quote_safe, c=change: c(quote(s, safe)))
+                           if requote else (lambda s, *_, c=change: c(s)))
+                    expected = urlencode(self.PAIRS, doseq = True, quote_via = via)
+                    self.assertEqual(URIQuery(self.PAIRS).encode(requote, quote_safe, force_case),
+                                     expected)
+
+    def test_not_strings(self):
+        """
+        `test_not_strings`
+        
+        Tests that values that aren't strings are still written out as before.
+        """
+        #the values are deliberately of the wrong type
+        self.assertEqual(URIQuery([("a", ["1", "2"]), ("b", 3)]).encode(True), #type:ignore
+                         "a=1&a=2&b=3")
+
+class TestQueryIter(unittest.TestCase):
+    """
+    `TestQueryIter`
+
+    Test cases for the `queryiter` function.
+    """
+
+    QUERY_EXAMPLES = ["", "?", "a=1", "a", "a=1&b=&c=%20d+e", "?k%3D=v%26&k=2"]
+
+    def test_matches_querysplit(self):
+        """
+        `test_matches_querysplit`
+        
+        Tests that `queryiter` gives the same pairs as `querysplit` without any limits.
+        """
+        for example in self.QUERY_EXAMPLES:
+            self.assertEqual(list(queryiter(example)), querysplit(example))
+            self.assertEqual(list(queryiter(example, True)), querysplit(example, True))
+        with self.assertRaises(ValueError):
+            list(queryiter("a=1&b"))
+
+    def test_limits(self):
+        """
+        `test_limits`
+        
+        Tests that queries over `max_fields` or `max_length` are rejected before being split.
+        """
+        self.assertEqual(len(list(queryiter("a=1&b=2", max_fields = 2, max_length = 7))), 2)
+        with self.assertRaises(ValueError):
+            next(queryiter("a=1&b=2&c=3", max_fields = 2))
+        with self.assertRaises(ValueError):
+            next(queryiter("a=1&b=2", max_length = 6))
+
+    def test_selection(self):
+        """
+        `test_selection`
+        
+        Tests that `stop_key` and `only_keys` stop early and skip unwanted pairs.
+        """
+        query = "a=1&b=2&a=3&c=4&bad"
+        self.assertEqual(list(queryiter(query, stop_key = "c")),
+                         [("a", "1"), ("b", "2"), ("a", "3"), ("c", "4")])
+        self.assertEqual(list(queryiter(query, stop_key = "c", only_keys = ["a"])),
+                         [("a", "1"), ("a", "3")])
+        self.assertEqual(URIQuery.build(queryiter(query, stop_key = "b")).encode(), "a=1&b=2")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,6 +4,11 @@
 Holds various tool and utility functions and classes for `urilibplus`.
 """
 
+from __future__ import annotations
+
+from functools import lru_cache
+from re import compile as regexcompile
+
 from .typings import * #type:ignore # pylint: disable=wildcard-import, unused-wildcard-import
 
 def singlify_str(*in_strs: LiteralString) -> LiteralString:
@@ -18,6 +23,23 @@ def singlify_str(*in_strs: LiteralString) -> LiteralString:
     """
     return cast(LiteralString, "".join(set("".join(in_strs))))
 
+@lru_cache(maxsize=1024)
+def _compiled(pattern:str) -> Pattern:
+    return regexcompile(pattern)
+
+def compiled(pattern:Union[str, Pattern]) -> Pattern:
+    """
+    `compiled`
+
+    Arguments:
+        `pattern` -- The regex pattern to compile, or an already compiled pattern.
+
+    Returns:
+        The compiled pattern, with every string pattern only compiled once
+        (for as long as it is among the most recently used).
+    """
+    return _compiled(pattern) if isinstance(pattern, str) else pattern
+
 @overload
 def passthrough_first() -> NoReturn: ...
 @overload
@@ -38,6 +60,21 @@ def passthrough_first(*p:Any, **_) -> Union[Any, NoReturn]: #pylint:disable=inco
     if len(p) > 0:
         return p[0]
 
+def immutable_method(self:object, *_:Any, **__:Any) -> NoReturn:
+    """
+    `immutable_method`
+
+    Used in place of the mutating methods of frozen classes.
+    Takes in any amount of args and kwargs, always raising a `TypeError`.
+
+    Arguments:
+        `self` -- The object that the method was called on.
+
+    Raises:
+        TypeError: Always raised, as the object can not be changed.
+    """
+    raise TypeError(f"'{type(self).__name__}' objects are immutable")
+
 def absindex(index:int, reference_length:Union[Sized, int]) -> int:
     """
     `absindex`
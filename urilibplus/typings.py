@@ -1,4 +1,4 @@
-""" 
+"""
 `typings`
 
 Holds the imported types used for type checking and inheriting
@@ -11,77 +11,41 @@ from re import Pattern, Match
 from os import PathLike
 
 from collections import UserList
+from collections.abc import MutableSequence as MutableSequenceABC
 
+from pathlib import PurePosixPath, PurePath, PureWindowsPath
+
+#everything here is available from python 3.7 onwards, so only a single import is needed
+from typing import (TYPE_CHECKING,
+                    TypeVar,
+                    Iterable,
+                    Iterator,
+                    List,
+                    Tuple,
+                    Union,
+                    Optional,
+                    NamedTuple,
+                    FrozenSet,
+                    Set,
+                    Deque,
+                    Callable,
+                    Dict,
+                    Type,
+                    Mapping,
+                    NoReturn,
+                    Any,
+                    Sequence,
+                    cast,
+                    overload,
+                    Sized,
+                    MutableSequence)
+
+#only the types added after python 3.7 need a fallback
 try:
     from typing import TypeAlias
 except ImportError:
     from typing_extensions import TypeAlias
 
-try:
-    from typing import TypeVar
-except ImportError:
-    from typing_extensions import TypeVar
-
-try:
-    from pathlib import PurePosixPath
-except ImportError:
-    from pathlib2 import PurePosixPath #type:ignore
-
-try:
-    from pathlib import PurePath
-except ImportError:
-    from pathlib2 import PurePath #type:ignore
-
-try:
-    from pathlib import PureWindowsPath
-except ImportError:
-    from pathlib2 import PureWindowsPath #type:ignore
-
-try:
-    from typing import Iterable
-except ImportError:
-    from typing_extensions import Iterable
-
-try:
-    from typing import Iterator
-except ImportError:
-    from typing_extensions import Iterator
-
-try:
-    from typing import List
-except ImportError:
-    from typing_extensions import List
-
-try:
-    from typing import Tuple
-except ImportError:
-    from typing_extensions import Tuple
-
-try:
-    from typing import Union
-except ImportError:
-    from typing_extensions import Union
-
-try:
-    from typing import Optional
-except ImportError:
-    from typing_extensions import Optional
-
-try:
-    from typing import Dict
-except ImportError:
-    from typing_extensions import Dict
-
-try:
-    from typing import NoReturn
-except ImportError:
-    from typing_extensions import NoReturn
-
-try:
-    from typing import Any
-except ImportError:
-    from typing_extensions import Any
-
 try:
     from typing import SupportsIndex
 except ImportError:
@@ -92,47 +56,12 @@ try:
 except ImportError:
     from typing_extensions import Literal
 
-try:
-    from typing import Sequence
-except ImportError:
-    from typing_extensions import Sequence
-
 try:
     from typing import LiteralString #type:ignore #this isn't declaired if it fails
 except ImportError:
     from typing_extensions import LiteralString #type:ignore #this isn't declaired if it fails
 
-try:
-    from typing import cast
-except ImportError:
-    from typing_extensions import cast
-
-try:
-    from typing import overload
-except ImportError:
-    from typing_extensions import overload
-
-try:
-    from typing import Sized
-except ImportError:
-    from typing_extensions import Sized
-
-try:
-    from typing import MutableSequence
-except ImportError:
-    from typing_extensions import MutableSequence
-
-from collections.abc import MutableSequence as MutableSequenceABC
-
 try:
     from types import NotImplementedType #type:ignore
 except ImportError:
     NotImplementedType:TypeAlias = Any
-
-try:
-    from typing import TYPE_CHECKING
-except ImportError:
-    try:
-        from typing_extensions import TYPE_CHECKING
-    except ImportError:
-        TYPE_CHECKING:bool = False
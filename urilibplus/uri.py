@@ -4,21 +4,33 @@
 Holds the `URI` class and reated imports.
 """
 
-from urllib.parse import (urlsplit as urisplit,
-                          urlunsplit as uriunsplit,
-                          quote as uriquote,
-                          unquote as uriunquote,
-                          unwrap as uriunwrap,
-                          SplitResult)
-from re import compile as regexcompile
+from __future__ import annotations
+
+from urllib.parse import urlunsplit as uriunsplit, SplitResult
+from collections import OrderedDict
+from threading import Lock
 
 from .characters import CharacterSets
-from .uri_path import URIPath
-from .uri_query import URIQuery
+from .codec import quote as uriquote, unquote as uriunquote
+from .tools import immutable_method, compiled
+from .uri_path import URIPath, FrozenURIPath
+from .uri_query import URIQuery, FrozenURIQuery
+from .uri_parsing import (URIComponents,
+                          URINormalization,
+                          urisplit,
+                          urinormalize,
+                          _AUTHORITY_PATTERN,
+                          _authorityfields,
+                          _cleaned,
+                          _urifields,
+                          _normalized)
+from .uri_lazy import _LazyURI, _UNPARSED
+from .uri_resolution import _Resolver
 
 from .typings import * # pylint: disable=wildcard-import, unused-wildcard-import
 
-class URI:
+#the batch, normalization, and resolution methods are kept alongside those of a single uri
+class URI(_LazyURI): # pylint: disable=too-many-public-methods
     """
     `URI`
 
@@ -53,24 +65,10 @@ class URI:
         return authority
     @authority.setter
     def authority(self, value: str):
-        at_index = value.find("@")
-        if at_index < 0:
-            self.user_info = ""
-        else:
-            self.user_info = value[:at_index]
-        value = value.replace(self.user_info, "", 1).lstrip("@")
-
-        col_index = value.rfind(":")
-        if col_index < 0:
-            self.port = None
-        else:
-            self.port = int(value[col_index+1:])
-            if self.port < 0:
-                self.port = None
-        if self.port is not None:
-            value = value.replace(str(self.port), "", 1).rstrip(":")
-
-        self.host = value
+        match = cast(Match, _AUTHORITY_PATTERN.fullmatch(value))
+        self.user_info, self.host, self.port = _authorityfields(*match.group("userinfo",
+                                                                             "host",
+                                                                             "port"))
 
     @property
     def username(self) -> Union[None, str]:
@@ -123,39 +121,198 @@ class URI:
                  *,
                  unquote:bool = False,
                  requote:bool = False,
-                 quote_safe:str = ""):
+                 quote_safe:str = "",
+                 lazy:bool = False):
         self.scheme: str
         self.user_info: str = ""
         self.host: str = ""
         self.port: Optional[int] = None
-        self.path: Optional['URIPath'] = None
-        self.query: Optional['URIQuery'] = None
-        self.fragment: Optional['URIQuery'] = None
-
-        if default_scheme is None:
-            default_scheme = ""
-
-        parsed = None
-        if isinstance(contents, SplitResult):
-            parsed = contents
-        elif isinstance(contents, tuple) and len(contents) <= 5 and len(contents) >= 1:
-            parsed = SplitResult(*contents)
-        else:
-            if isinstance(contents, URI):
-                contents = str(contents)
-            contents = contents.strip()
-            contents = uriunwrap(contents)
-            parsed = urisplit(contents, scheme=default_scheme, allow_fragments=True)
-
-        self.scheme = uriunquote(parsed.scheme) if unquote else parsed.scheme
-        self.authority = uriunquote(parsed.netloc) if unquote else parsed.netloc
-        self.path = URIPath(parsed.path.lstrip("/"), unquote=unquote)
-        self.query = URIQuery(parsed.query, unquote=unquote)
-        self.fragment = URIQuery(parsed.fragment, unquote=unquote)
-
-        self.default_scheme = default_scheme
-        self.requote = requote
-        self.quote_safe = quote_safe
+        self.path = None
+        self.query = None
+        self.fragment = None
+
+        self._setup("" if default_scheme is None else default_scheme, unquote, requote, quote_safe)
+
+        if isinstance(contents, (SplitResult, tuple)):
+            parsed = (contents if isinstance(contents, SplitResult) else
+                      SplitResult(*cast(Tuple[str, str, str, str, str], contents)))
+            self.scheme = uriunquote(parsed.scheme) if unquote else parsed.scheme
+            self.authority = parsed.netloc
+            if unquote:
+                self.user_info = uriunquote(self.user_info)
+                self.host = uriunquote(self.host)
+            self.path = URIPath(parsed.path.lstrip("/"), unquote=unquote)
+            self.query = URIQuery(parsed.query, unquote=unquote)
+            self.fragment = URIQuery(parsed.fragment, unquote=unquote)
+            return
+
+        if isinstance(contents, URI):
+            contents = str(contents)
+        self._parse(contents, lazy)
+
+    @overload
+    @staticmethod
+    def parse_many(contents:Iterable[str],
+                   default_scheme: Optional[str] = None,
+                   *,
+                   unquote:bool = False,
+                   requote:bool = False,
+                   quote_safe:str = "",
+                   lazy:bool = False,
+                   components:Literal[False] = False
+                  ) -> List['URI']: ...
+    @overload
+    @staticmethod
+    def parse_many(contents:Iterable[str],
+                   default_scheme: Optional[str] = None,
+                   *,
+                   unquote:bool = False,
+                   requote:bool = False,
+                   quote_safe:str = "",
+                   lazy:bool = False,
+                   components:Literal[True]
+                  ) -> List[URIComponents]: ...
+    @staticmethod
+    def parse_many(contents:Iterable[str],
+                   default_scheme: Optional[str] = None,
+                   *,
+                   unquote:bool = False,
+                   requote:bool = False,
+                   quote_safe:str = "",
+                   lazy:bool = False,
+                   components:bool = False
+                  ) -> Union[List['URI'], List[URIComponents]]:
+        """
+        `parse_many`
+
+        Parses every given uri string, the same as the constructor would,
+        only splitting each distinct string once.
+
+        NOTE: this takes about as long as calling the constructor for every string,
+        only saving time when the same strings are repeated within the batch.
+
+        Arguments:
+            `contents` -- The uri strings to parse.
+            `default_scheme` -- The scheme to use for any string that has none.
+
+        Keyword Arguments:
+            `unquote`, `requote`, `quote_safe`, `lazy` -- The same as with the constructor.
+            `components` -- Instead of `URI` objects, return the raw `URIComponents`
+                of every string, as `urisplit` would, ignoring all other options.
+
+        Returns:
+            A list of the parsed uris, in the same order as given.
+        """
+        default_scheme = "" if default_scheme is None else default_scheme
+        if components:
+            return [urisplit(_cleaned(c), default_scheme) for c in contents]
+
+        #repeated strings in the batch are only split once, every `URI` given is still its own copy
+        seen:Dict[str, Tuple[Any, ...]] = {}
+        parsed = []
+        append = parsed.append
+        for c in contents:
+            found = seen.get(c)
+            if found is None:
+                found = seen[c] = _urifields(c, default_scheme, unquote)
+            #set up just as the constructor does, only without splitting the string again
+            obj = URI.__new__(URI)
+            obj._setup(default_scheme, unquote, requote, quote_safe) # pylint: disable=protected-access
+            obj._parse(c, lazy, found) # pylint: disable=protected-access
+            append(obj)
+        return parsed
+
+    @classmethod
+    def parse_cached(cls,
+                     contents:str,
+                     default_scheme: Optional[str] = None,
+                     *,
+                     unquote:bool = False,
+                     requote:bool = False,
+                     quote_safe:str = "",
+                     cache:Optional['URIParseCache'] = None
+                    ) -> 'URI':
+        """
+        `parse_cached`
+
+        Creates a `URI` the same as the constructor would, but reuses the parsing done
+        for any identical string and options given before.
+
+        Arguments:
+            `contents` -- The uri string to parse.
+            `default_scheme` -- The scheme to use if the given string has none.
+
+        Keyword Arguments:
+            `unquote`, `requote`, `quote_safe` -- The same as with the constructor.
+            `cache` -- The `URIParseCache` to use, defaulting to `URIParseCache.DEFAULT`.
+
+        Returns:
+            A new, lazily parsed, `URI` object that no other caller shares.
+        """
+        if cache is None:
+            cache = URIParseCache.DEFAULT
+        return cache.get(contents,
+                         default_scheme,
+                         unquote=unquote,
+                         requote=requote,
+                         quote_safe=quote_safe)
+
+    @overload
+    @staticmethod
+    def normalize_many(contents:Iterable[str],
+                       default_scheme: Optional[str] = None,
+                       *,
+                       steps:Optional[URINormalization] = None,
+                       frozen:Literal[False] = False
+                      ) -> List[str]: ...
+    @overload
+    @staticmethod
+    def normalize_many(contents:Iterable[str],
+                       default_scheme: Optional[str] = None,
+                       *,
+                       steps:Optional[URINormalization] = None,
+                       frozen:Literal[True]
+                      ) -> List['FrozenURI']: ...
+    @staticmethod
+    def normalize_many(contents:Iterable[str],
+                       default_scheme: Optional[str] = None,
+                       *,
+                       steps:Optional[URINormalization] = None,
+                       frozen:bool = False
+                      ) -> Union[List[str], List['FrozenURI']]:
+        """
+        `normalize_many`
+
+        Normalizes every given uri string, as `urinormalize` does, without making any `URI`
+        objects; with repeated strings in the batch only normalized once.
+
+        Arguments:
+            `contents` -- The uri strings to normalize.
+            `default_scheme` -- The scheme to use for any string that has none.
+
+        Keyword Arguments:
+            `steps` -- The normalization steps to take, defaulting to every one of them.
+            `frozen` -- Instead of strings, give a `FrozenURI` made from every normalized string.
+
+        Raises:
+            ValueError: Raised when a string has a malformed port or IPv6 host.
+
+        Returns:
+            A list of the normalized uris, in the same order as given.
+        """
+        scheme = "" if default_scheme is None else default_scheme
+        seen:Dict[str, Any] = {}
+        normalized = []
+        append = normalized.append
+        for c in contents:
+            found = seen.get(c)
+            if found is None:
+                found = urinormalize(c, scheme, steps)
+                if frozen:
+                    found = FrozenURI(found)
+                seen[c] = found
+            append(found)
+        return normalized
 
     def __repr__(self):
         return f"<URI object (url = {self.encode()}, valid = {self.validate()})>"
@@ -176,7 +333,22 @@ class URI:
         Returns:
             A complete, deep, copy of this object.
         """
-        return URI(self.splitted(False),
+        if self._path is _UNPARSED and self._query is _UNPARSED and self._fragment is _UNPARSED:
+            #nothing mutable has been built yet, so the parsed offsets can be shared as is
+            cpy = URI.__new__(URI)
+            cpy.__dict__.update(self.__dict__)
+            if self._parsed is not None:
+                cpy._parsed = list(self._parsed) # pylint: disable=protected-access
+            return cpy
+        if self._unchanged():
+            #parsed again, so the copy keeps the source too
+            return URI(self._source,
+                       self.default_scheme,
+                       unquote=self._unquote,
+                       requote=self.requote,
+                       quote_safe=self.quote_safe)
+
+        return URI(self._split(),
                    default_scheme=self.default_scheme,
                    unquote=False,
                    requote=self.requote,
@@ -185,6 +357,29 @@ class URI:
     __copy__ = copy
     __deepcopy__ = copy
 
+    def frozen(self) -> 'FrozenURI':
+        """
+        `frozen`
+
+        Returns:
+            A immutable, hashable, copy of this object.
+        """
+        return FrozenURI(self._split(),
+                         default_scheme=self.default_scheme,
+                         requote=self.requote,
+                         quote_safe=self.quote_safe
+                        )
+
+    def _split(self, quote:Optional[bool] = False) -> Tuple[str, str, str, str, str]:
+        #the same as `tupled`, but with the path keeping any trailing `/` it was given with,
+        #which the encoded path drops
+        scheme, authority, path, query, fragment = self.tupled(quote)
+        if (self.path is not None and
+            self.path._slashed and # pylint: disable=protected-access
+            not path.endswith("/")):
+            path += "/"
+        return scheme, authority, path, query, fragment
+
     def tupled(self,
                quote: Optional[bool] = None,
                quote_safe:Optional[str] = None
@@ -255,15 +450,30 @@ class URI:
         if quote_safe is None:
             quote_safe = self.quote_safe
 
+        key = self._encoding_key(quote, quote_safe)
+        if self._last_encoded is not None and self._last_encoded[0] == key:
+            return self._last_encoded[1]
+
         encoded = uriunsplit(SplitResult(*self.tupled(None, None)))
         if quote is True:
             encoded = uriquote(encoded, safe = quote_safe)
         elif quote is False:
             encoded = uriunquote(encoded)
+        self._last_encoded = (key, encoded)
         return encoded
     __str__ = encode
     __repr__ = encode
 
+    def _encoding_key(self, quote:bool, quote_safe:str) -> Tuple[Any, ...]:
+        # pylint: disable=protected-access
+        #everything the encoding of this uri depends on, cheap to build and compare,
+        #with its path, query, and fragment given by identity and version instead of content
+        path, query, fragment = self.path, self.query, self.fragment
+        return (self.scheme, self.user_info, self.host, self.port, quote, quote_safe,
+                path, None if path is None else path._version,
+                query, None if query is None else (query._version, query.force_case),
+                fragment, None if fragment is None else (fragment._version, fragment.force_case))
+
     def stripped(self, quote: Optional[bool] = None, quote_safe:Optional[str] = None) -> str:
         """
         `stripped`
@@ -318,6 +528,39 @@ class URI:
             encoded = uriunquote(encoded)
         return encoded
 
+    def canonical(self, steps:Optional[URINormalization] = None) -> str:
+        """
+        `canonical`
+
+        Keyword Arguments:
+            `steps` -- The normalization steps to take, defaulting to every one of them.
+
+        Returns:
+            This uri as a normalized string, as `urinormalize` gives for the string
+            it was parsed from (if unchanged since), for use as a cache or deduplication key.
+        """
+        if self._unchanged():
+            return _normalized(self._source, self.default_scheme, steps)
+
+        scheme, authority, path, query, fragment = self._split()
+        if self.path is None or self.path.isempty():
+            path = ""
+        elif authority != "" and path[0] != "/":
+            path = "/" + path
+        return urinormalize(uriunsplit((scheme, authority, path, query, fragment)), "", steps)
+
+    def normalized(self, steps:Optional[URINormalization] = None) -> 'FrozenURI':
+        """
+        `normalized`
+
+        Keyword Arguments:
+            `steps` -- The normalization steps to take, defaulting to every one of them.
+
+        Returns:
+            A immutable, hashable, uri made from the `canonical` string of this one.
+        """
+        return FrozenURI(self.canonical(steps))
+
     def validate(self) -> bool:
         """
         `validate`
@@ -325,17 +568,12 @@ class URI:
         Returns:
             True if all characters in this object are allowed in a URI.
         """
-        for char in self.scheme:
-            if char not in self.CHARACTER_SETS.SCHEME:
-                return False
-
-        for char in self.user_info:
-            if char not in self.CHARACTER_SETS.USERINFO:
-                return False
+        sets = self.CHARACTER_SETS
 
-        for char in self.host:
-            if char not in self.CHARACTER_SETS.HOST:
-                return False
+        if (sets.invalid_check(sets.SCHEME, self.scheme) or
+            sets.invalid_check(sets.USERINFO, self.user_info) or
+            sets.invalid_check(sets.HOST, self.host)):
+            return False
 
         if not (isinstance(self.port, int) or self.port is None):
             return False
@@ -344,21 +582,16 @@ class URI:
             return False
         elif isinstance(self.path, URIPath) and not self.path.validate():
             return False
-        else:
-            for char in self.host:
-                if char not in self.CHARACTER_SETS.PATH:
-                    return False
+        elif sets.invalid_check(sets.PATH, self.host):
+            return False
 
         if isinstance(self.query, URIQuery) and not self.query.validate():
             return False
-        else:
-            for char in self.host:
-                if char not in self.CHARACTER_SETS.QUERY:
-                    return False
+        elif sets.invalid_check(sets.QUERY, self.host):
+            return False
 
-        for char in str(self.fragment):
-            if char not in self.CHARACTER_SETS.FRAGMENT:
-                return False
+        if sets.invalid_check(sets.FRAGMENT, str(self.fragment)):
+            return False
 
         # This is specifically stated as invalid in the specs
         if self.authority == "" and self.path[0] == "":
@@ -398,10 +631,80 @@ class URI:
         Returns:
             `None` if not matches where found, or a `Match` object otherwise.
         """
-        if isinstance(pattern, str):
-            pattern = regexcompile(pattern)
+        return compiled(pattern).search(self.encode(quoted, quote_safe))
+
+    def _resolver(self) -> _Resolver:
+        template = URI("",
+                       self.default_scheme,
+                       unquote=self._unquote,
+                       requote=self.requote,
+                       quote_safe=self.quote_safe,
+                       lazy=True)
+        return _Resolver(self, template, self._unquote)
+
+    @overload
+    def resolve(self, reference:str, *, encoded:Literal[False] = False) -> 'URI': ...
+    @overload
+    def resolve(self, reference:str, *, encoded:Literal[True]) -> str: ...
+    def resolve(self, reference:str, *, encoded:bool = False) -> Union['URI', str]:
+        """
+        `resolve`
+
+        Resolves the given reference (such as a link found on a page) against this uri,
+        as described in https://www.rfc-editor.org/rfc/rfc3986#section-5.2
+        and done by `urllib.parse.urljoin`; without encoding this uri to do so.
+
+        Arguments:
+            `reference` -- The uri string, relative or not, to resolve.
+
+        Keyword Arguments:
+            `encoded` -- Instead of a `URI`, give the resolved uri as a string,
+                exactly as the specification gives it.
+
+        Raises:
+            ValueError: Raised when the reference has a malformed port or IPv6 host.
+
+        Returns:
+            The resolved uri, with the same options as this one.
+        """
+        resolver = self._resolver()
+        return resolver.resolved_str(reference) if encoded else resolver.resolved_uri(reference)
+
+    @overload
+    def resolve_many(self,
+                     references:Iterable[str],
+                     *,
+                     encoded:Literal[False] = False
+                    ) -> List['URI']: ...
+    @overload
+    def resolve_many(self, references:Iterable[str], *, encoded:Literal[True]) -> List[str]: ...
+    def resolve_many(self,
+                     references:Iterable[str],
+                     *,
+                     encoded:bool = False
+                    ) -> Union[List['URI'], List[str]]:
+        """
+        `resolve_many`
+
+        Resolves every given reference against this uri, the same as `resolve` would,
+        while only going over this uri once for the whole batch.
+
+        Arguments:
+            `references` -- The uri strings, relative or not, to resolve.
+
+        Keyword Arguments:
+            `encoded` -- The same as with `resolve`.
 
-        return pattern.search(self.encode(quoted, quote_safe))
+        Raises:
+            ValueError: Raised when a reference has a malformed port or IPv6 host.
+
+        Returns:
+            A list of the resolved uris, in the same order as given.
+        """
+        resolver = self._resolver()
+        if encoded:
+            return [resolver.resolved_str(r) for r in references]
+        return [resolver.resolved_uri(r) for r in references]
 
     def pathappend(self, *parts:Union[str, PathLike]):
         """
@@ -428,3 +731,191 @@ class URI:
         cpy = self.copy()
         cpy.pathappend("", value)
         return cpy
+
+class FrozenURI(URI):
+    """
+    `FrozenURI`
+
+    A immutable, hashable, `URI`; with its encoded string and hash only ever made once.
+    Its path, query, and fragment are also frozen, and any copy made of it is a mutable `URI`.
+    """
+
+    _frozen:bool = False
+
+    def __init__(self,
+                 contents:Union[str, 'URI', SplitResult, Tuple[str, str, str, str, str]],
+                 default_scheme: Optional[str] = None,
+                 *,
+                 unquote:bool = False,
+                 requote:bool = False,
+                 quote_safe:str = ""):
+        if isinstance(contents, URI):
+            #split instead of encoded, so the path keeps any trailing `/` it was given with
+            contents = contents._split(None) # pylint: disable=protected-access
+        super().__init__(contents,
+                         default_scheme,
+                         unquote=unquote,
+                         requote=requote,
+                         quote_safe=quote_safe)
+        #the frozen components are the same as those parsed, so still match any source
+        unchanged = self._unchanged()
+        path, query, fragment = self.path, self.query, self.fragment
+        if path is not None:
+            #made from the path itself, so it keeps any trailing `/` the path was given with
+            self._path = FrozenURIPath(path, unquote=unquote)
+        if query is not None:
+            self._query = FrozenURIQuery(query.data, unquote=unquote)
+        if fragment is not None:
+            self._fragment = FrozenURIQuery(fragment.data, unquote=unquote)
+        if unchanged:
+            self._sourced(4, self._path)
+            self._sourced(6, self._query)
+            self._sourced(8, self._fragment)
+        self._encoded:Optional[str] = None
+        self._hash:Optional[int] = None
+        self._frozen = True
+
+    def __setattr__(self, name:str, value:Any):
+        if self._frozen and not name.startswith("_"):
+            immutable_method(self)
+        super().__setattr__(name, value)
+
+    def __delattr__(self, name:str):
+        if self._frozen and not name.startswith("_"):
+            immutable_method(self)
+        super().__delattr__(name)
+
+    def __hash__(self):
+        if self._hash is None:
+            self._hash = hash(self.encode())
+        return self._hash
+
+    def __eq__(self, other:object):
+        if not isinstance(other, URI):
+            return NotImplemented
+        if not isinstance(other, FrozenURI):
+            #a mutable uri drops any trailing `/` of its path when encoded, which a frozen one keeps
+            other = other.frozen()
+        return self.encode() == other.encode()
+
+    def __len__(self):
+        return len(self.encode())
+
+    def __contains__(self, value:str):
+        return value in self.encode()
+
+    def frozen(self) -> 'FrozenURI':
+        return self
+
+    def encode(self, quote: Optional[bool] = None, quote_safe:Optional[str] = None) -> str:
+        if quote is not None or quote_safe is not None:
+            return super().encode(quote, quote_safe)
+        if self._encoded is None:
+            self._encoded = super().encode()
+        return self._encoded
+    __str__ = encode
+    __repr__ = encode
+
+class URIParseCacheInfo(NamedTuple):
+    """
+    `URIParseCacheInfo`
+
+    The statistics of a `URIParseCache`.
+    """
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+class URIParseCache:
+    """
+    `URIParseCache`
+
+    A bounded, least recently used, cache of parsed uri strings.
+
+    Only untouched lazily parsed `URI` objects are kept, with every lookup handing out
+    a copy of them; so no caller can change the result given to another.
+    """
+
+    DEFAULT: 'URIParseCache'
+
+    def __init__(self, maxsize:int = 4096):
+        if maxsize < 0:
+            raise ValueError(maxsize)
+        self.maxsize:int = maxsize
+        self.hits:int = 0
+        self.misses:int = 0
+        self._entries:Dict[Tuple[str, Optional[str], bool, bool, str], URI] = OrderedDict()
+        self._lock:Lock = Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self,
+            contents:str,
+            default_scheme: Optional[str] = None,
+            *,
+            unquote:bool = False,
+            requote:bool = False,
+            quote_safe:str = ""
+           ) -> URI:
+        """
+        `get`
+
+        Arguments:
+            `contents` -- The uri string to parse.
+            `default_scheme` -- The scheme to use if the given string has none.
+
+        Keyword Arguments:
+            `unquote`, `requote`, `quote_safe` -- The same as with the `URI` constructor.
+
+        Returns:
+            A copy of the cached `URI` for the given string and options,
+            parsing and caching it first if needed.
+        """
+        key = (contents, default_scheme, unquote, requote, quote_safe)
+        entries = cast('OrderedDict[Tuple[str, Optional[str], bool, bool, str], URI]',
+                       self._entries)
+        with self._lock:
+            cached = entries.get(key)
+            if cached is not None:
+                entries.move_to_end(key)
+                self.hits += 1
+                return cached.copy()
+            self.misses += 1
+
+        cached = URI(contents,
+                     default_scheme,
+                     unquote=unquote,
+                     requote=requote,
+                     quote_safe=quote_safe,
+                     lazy=True)
+
+        with self._lock:
+            if self.maxsize > 0:
+                entries[key] = cached
+                while len(entries) > self.maxsize:
+                    entries.popitem(last=False)
+        return cached.copy()
+
+    def info(self) -> URIParseCacheInfo:
+        """
+        `info`
+
+        Returns:
+            The current hit and miss counts, maximum size, and current size of this cache.
+        """
+        return URIParseCacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+    def clear(self):
+        """
+        `clear`
+
+        Removes every entry from this cache and resets its statistics.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+URIParseCache.DEFAULT = URIParseCache()
@@ -0,0 +1,246 @@
+"""
+`uri_bytes`
+
+Holds the `BytesURI` class and reated imports.
+"""
+
+from __future__ import annotations
+
+from re import compile as regexcompile, DOTALL
+
+from .codec import quote_bytes, unquote_bytes, BytesLike
+from .uri import URI
+from .uri_parsing import _URI_PATTERN, _COMPONENTS, _checkedhost, _checkedport
+from .typings import * # pylint: disable=wildcard-import, unused-wildcard-import
+
+#the same pattern `URI` uses, for matching bytes like objects directly
+_URI_BYTES_PATTERN:Pattern = regexcompile(_URI_PATTERN.pattern.encode("ascii"), DOTALL)
+
+_WHITESPACE:bytes = b" \t\r\n\x0b\x0c"
+
+_BRACKETS_PATTERN:Pattern = regexcompile(rb"[\[\]]")
+
+class BytesURI:
+    """
+    `BytesURI`
+
+    A read only uri, parsed directly from `bytes` (or any bytes like object) without decoding,
+    with every component given as a `memoryview` of the original content instead of a copy.
+
+    NOTE: only whitespace around the uri is ignored, unlike `URI`, which also removes any tabs
+    or newlines found within it. The scheme is given as is, without being lowercased.
+    """
+
+    __slots__ = ("_view", "_start", "_end", "_spans")
+
+    def __init__(self, contents:BytesLike):
+        view = memoryview(contents)
+        if view.ndim != 1 or view.itemsize != 1:
+            view = view.cast("B")
+
+        #the surrounding whitespace is skipped by index, so the content is never copied
+        start, end = 0, len(view)
+        while start < end and view[start] in _WHITESPACE:
+            start += 1
+        while end > start and view[end - 1] in _WHITESPACE:
+            end -= 1
+
+        match = cast(Match, _URI_BYTES_PATTERN.match(view, start, end))
+        self._view:memoryview = view
+        self._start:int = start
+        self._end:int = end
+        #the start and end of every component, being `(-1, -1)` for any component not given
+        self._spans:Tuple[Tuple[int, int], ...] = tuple(match.span(name) for name in _COMPONENTS)
+
+        host_start, host_end = self._spans[3]
+        if host_start >= 0 and _BRACKETS_PATTERN.search(view, host_start, host_end) is not None:
+            _checkedhost(str(view[host_start:host_end], "utf-8", "replace"))
+        port_start, port_end = self._spans[4]
+        if port_start >= 0:
+            _checkedport(str(view[port_start:port_end], "utf-8", "replace"))
+
+    def _component(self, index:int) -> memoryview:
+        start, end = self._spans[index]
+        return self._view[start:end] if start >= 0 else self._view[0:0]
+
+    @property
+    def scheme(self) -> memoryview:
+        """
+        `scheme`
+
+        Returns:
+            The scheme of this uri, as given.
+        """
+        return self._component(0)
+
+    @property
+    def userinfo(self) -> memoryview:
+        """
+        `userinfo`
+
+        Returns:
+            The user information of this uri, without its trailing `@`.
+        """
+        return self._component(2)
+
+    @property
+    def host(self) -> memoryview:
+        """
+        `host`
+
+        Returns:
+            The host of this uri.
+        """
+        return self._component(3)
+
+    @property
+    def port(self) -> Optional[int]:
+        """
+        `port`
+
+        Returns:
+            The port of this uri, or `None` if it has none.
+        """
+        port = self._component(4)
+        return int(bytes(port)) if len(port) > 0 else None
+
+    @property
+    def path(self) -> memoryview:
+        """
+        `path`
+
+        Returns:
+            The path of this uri, including its leading `/`, if any.
+        """
+        return self._component(5)
+
+    @property
+    def query(self) -> memoryview:
+        """
+        `query`
+
+        Returns:
+            The query of this uri, without its leading `?`.
+        """
+        return self._component(6)
+
+    @property
+    def fragment(self) -> memoryview:
+        """
+        `fragment`
+
+        Returns:
+            The fragment of this uri, without its leading `#`.
+        """
+        return self._component(7)
+
+    @property
+    def authority(self) -> memoryview:
+        """
+        `authority`
+
+        Returns:
+            The full authority of this uri, including its user information, host, and port.
+        """
+        return self._component(1)
+
+    def hasauthority(self) -> bool:
+        """
+        `hasauthority`
+
+        Returns:
+            `True` if this uri has an authority, even if it is empty (as with `file:///path`).
+        """
+        return self._spans[1][0] >= 0
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def __bytes__(self) -> bytes:
+        return self.encode()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.encode()!r})"
+
+    def __eq__(self, other:object) -> bool:
+        if isinstance(other, BytesURI):
+            return self._view[self._start:self._end] == other._view[other._start:other._end]
+        if isinstance(other, (bytes, bytearray, memoryview)):
+            return self._view[self._start:self._end] == other
+        return NotImplemented
+
+    __hash__ = None #type:ignore
+
+    def encode(self, quote:Optional[bool] = None, quote_safe:str = "") -> bytes:
+        """
+        `encode`
+
+        Keyword Arguments:
+            `quote` -- If not `None`, the URI will be quoted, if `True`; or unquoted, if `False`,
+                otherwise it is given exactly as it was parsed.
+            `quote_safe` -- If quoting, these characters will be excluded when quoting.
+
+        Returns:
+            This uri, encoded as `bytes`.
+        """
+        content = self._view[self._start:self._end]
+        if quote is True:
+            return quote_bytes(content, quote_safe)
+        if quote is False:
+            return unquote_bytes(content)
+        return bytes(content)
+
+    def replaced(self, **components:BytesLike) -> 'BytesURI':
+        """
+        `replaced`
+
+        Keyword Arguments:
+            `**components` -- The components to replace, by name, with each new value given
+                as a bytes like object. Any of `scheme`, `authority`, `userinfo`, `host`, `port`,
+                `path`, `query`, and `fragment` can be replaced, though not both the authority
+                and a part of it; every other part of the uri is kept as is.
+
+        Raises:
+            KeyError: Raised when a component given is not known.
+            ValueError: Raised when a component given was not in the original uri,
+                or when both the authority and a part of it are given.
+
+        Returns:
+            A new uri, made with a single copy of the original content.
+        """
+        replacements = []
+        for name, value in components.items():
+            if name not in _COMPONENTS:
+                raise KeyError(name)
+            span = self._spans[_COMPONENTS.index(name)]
+            if span[0] < 0:
+                raise ValueError(f"this uri has no {name} to replace")
+            replacements.append((span, value))
+        replacements.sort(key=lambda r: r[0])
+        for (first, _), (second, _) in zip(replacements, replacements[1:]):
+            if second[0] < first[1]:
+                raise ValueError("the authority and its parts can't both be replaced")
+
+        parts:List[BytesLike] = []
+        position = self._start
+        for (start, end), value in replacements:
+            parts.append(self._view[position:start])
+            parts.append(value)
+            position = end
+        parts.append(self._view[position:self._end])
+        return BytesURI(b"".join(parts))
+
+    def to_uri(self, default_scheme:Optional[str] = None, **kwargs:Any) -> URI:
+        """
+        `to_uri`
+
+        Arguments:
+            `default_scheme` -- The scheme to use if this uri has none.
+
+        Keyword Arguments:
+            `**kwargs` -- Given to `URI` as is.
+
+        Returns:
+            A new `URI` made from this uri, decoded as utf-8.
+        """
+        return URI(str(self._view[self._start:self._end], "utf-8"), default_scheme, **kwargs)
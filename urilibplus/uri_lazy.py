@@ -0,0 +1,168 @@
+"""
+`uri_lazy`
+
+Holds the lazily parsed components that the `URI` class is built on.
+"""
+
+from __future__ import annotations
+
+from .uri_path import URIPath
+from .uri_query import URIQuery, querysplit
+from .uri_parsing import _urifields
+
+from .typings import * # pylint: disable=wildcard-import, unused-wildcard-import
+
+#marks a lazily parsed component that has not been built yet
+_UNPARSED:Any = object()
+
+class _LazyURI:
+    #the components of a uri, with its path, query, and fragment only built from the string
+    #it was parsed from when first used; along with what is needed to tell if every component
+    #still matches that string
+    default_scheme: str
+    requote: bool
+    quote_safe: str
+    scheme: str
+    user_info: str
+    host: str
+    port: Optional[int]
+    _unquote: bool
+    _source: str
+    _spans: Tuple[int, int, int, int, int, int]
+    _last_encoded: Optional[Tuple[Tuple[Any, ...], str]]
+    _parsed: Optional[List[Any]]
+    _path: Any
+    _query: Any
+    _fragment: Any
+
+    @property
+    def path(self) -> Optional['URIPath']:
+        """
+        `path`
+
+        Returns:
+            The path of the uri, built on first access if this object was lazily parsed.
+        """
+        if self._path is _UNPARSED:
+            start, end = self._spans[0], self._spans[1]
+            self._path = self._sourced(4, URIPath(self._source[start:end].lstrip("/"),
+                                                  unquote=self._unquote))
+        return cast(Optional['URIPath'], self._path)
+    @path.setter
+    def path(self, value: Optional['URIPath']):
+        self._path = value
+
+    @property
+    def query(self) -> Optional['URIQuery']:
+        """
+        `query`
+
+        Returns:
+            The query of the uri, built on first access if this object was lazily parsed.
+        """
+        if self._query is _UNPARSED:
+            start, end = self._spans[2], self._spans[3]
+            self._query = self._sourced(6, URIQuery(querysplit(self._source[start:end],
+                                                               self._unquote),
+                                                    unquote=self._unquote))
+        return cast(Optional['URIQuery'], self._query)
+    @query.setter
+    def query(self, value: Optional['URIQuery']):
+        self._query = value
+
+    @property
+    def fragment(self) -> Optional['URIQuery']:
+        """
+        `fragment`
+
+        Returns:
+            The fragment of the uri, built on first access if this object was lazily parsed.
+        """
+        if self._fragment is _UNPARSED:
+            start, end = self._spans[4], self._spans[5]
+            self._fragment = self._sourced(8, URIQuery(querysplit(self._source[start:end],
+                                                                  self._unquote),
+                                                       unquote=self._unquote))
+        return cast(Optional['URIQuery'], self._fragment)
+    @fragment.setter
+    def fragment(self, value: Optional['URIQuery']):
+        self._fragment = value
+
+    def _setup(self, default_scheme:str, unquote:bool, requote:bool, quote_safe:str):
+        #sets every option, and the state kept alongside the components, of a new uri;
+        #used by every way of making one, so none of them can miss any of it
+        self.default_scheme = default_scheme
+        self.requote = requote
+        self.quote_safe = quote_safe
+        self._unquote: bool = unquote
+        self._source: str = ""
+        self._spans: Tuple[int, int, int, int, int, int] = (0, 0, 0, 0, 0, 0)
+        self._last_encoded: Optional[Tuple[Tuple[Any, ...], str]] = None
+        self._parsed: Optional[List[Any]] = None
+
+    def _parse(self, contents:str, lazy:bool, found:Optional[Tuple[Any, ...]] = None):
+        #fills in every component from the given string, or the fields `_urifields` already found
+        #for it, using the options already set
+        if found is None:
+            found = _urifields(contents, self.default_scheme, self._unquote)
+        (self.scheme,
+         self.user_info,
+         self.host,
+         self.port,
+         self._source,
+         self._spans) = found
+        self._path = self._query = self._fragment = _UNPARSED
+        self._parsed = [self.scheme, self.user_info, self.host, self.port,
+                        _UNPARSED, 0, _UNPARSED, 0, _UNPARSED, 0]
+        if not lazy:
+            self._build()
+
+    def _sourced(self, index:int, component:Any) -> Any:
+        #marks a component as built from the source at the given index of `_parsed`,
+        #so it is known to still match the source until it changes
+        parsed = self._parsed
+        if parsed is not None:
+            parsed[index] = component
+            parsed[index + 1] = component._version # pylint: disable=protected-access
+        return component
+
+    def _unchanged(self) -> bool:
+        # pylint: disable=protected-access
+        #if every component is still exactly as parsed from the source,
+        #which then holds everything (such as empty segments) the components may have dropped
+        parsed = self._parsed
+        if (parsed is None or
+            self.scheme != parsed[0] or
+            self.user_info != parsed[1] or
+            self.host != parsed[2] or
+            self.port != parsed[3]):
+            return False
+        for i, component in ((4, self._path), (6, self._query), (8, self._fragment)):
+            if component is not _UNPARSED and (component is not parsed[i] or
+                                               component._version != parsed[i + 1]):
+                return False
+        return True
+
+    def _build(self):
+        #builds every component that was lazily parsed and not built yet, all at once
+        source, spans, unquote = self._source, self._spans, self._unquote
+        sourced = self._sourced
+        if self._path is _UNPARSED:
+            self._path = sourced(4, URIPath(source[spans[0]:spans[1]].lstrip("/"),
+                                            unquote=unquote))
+        if self._query is _UNPARSED:
+            self._query = sourced(6, URIQuery(querysplit(source[spans[2]:spans[3]], unquote),
+                                              unquote=unquote))
+        if self._fragment is _UNPARSED:
+            self._fragment = sourced(8, URIQuery(querysplit(source[spans[4]:spans[5]], unquote),
+                                                 unquote=unquote))
+
+    def islazy(self) -> bool:
+        """
+        `islazy`
+
+        Returns:
+            `True` if any of the path, query, or fragment of this object
+            have been deferred and not yet built.
+        """
+        return _UNPARSED in (self._path, self._query, self._fragment)
@@ -0,0 +1,268 @@
+"""
+`uri_parsing`
+
+Holds `urisplit`, `urinormalize`, and the other functions used to split and normalize uri strings.
+"""
+
+from __future__ import annotations
+
+from urllib.parse import unwrap as uriunwrap
+from re import compile as regexcompile, DOTALL
+from functools import lru_cache
+
+from .characters import CharacterSets
+from .codec import unquote as uriunquote
+from .uri_path import remove_dot_segments
+
+from .typings import * # pylint: disable=wildcard-import, unused-wildcard-import
+
+#a single pass over a uri string, finding every component's boundaries at once
+#THX https://www.rfc-editor.org/rfc/rfc3986#appendix-B
+_AUTHORITY_PATTERN_STR:LiteralString = (r"(?:(?P<userinfo>[^/?#]*)@)?"
+                                        r"(?P<host>\[[^\]/?#]*\]|[^/?#:]*)"
+                                        r"(?::(?P<port>[^/?#]*))?")
+_URI_PATTERN:Pattern = regexcompile(r"(?:(?P<scheme>[A-Za-z][A-Za-z0-9+\-.]*):)?"
+                                    r"(?://(?P<authority>" + _AUTHORITY_PATTERN_STR +
+                                    r")(?=[/?#]|\Z))?"
+                                    r"(?P<path>[^?#]*)"
+                                    r"(?:\?(?P<query>[^#]*))?"
+                                    r"(?:#(?P<fragment>.*))?",
+                                    DOTALL)
+_AUTHORITY_PATTERN:Pattern = regexcompile(_AUTHORITY_PATTERN_STR, DOTALL)
+#the name of every group of the pattern, in the order they are found in a uri
+_COMPONENTS:Tuple[str, ...] = ("scheme",
+                               "authority",
+                               "userinfo",
+                               "host",
+                               "port",
+                               "path",
+                               "query",
+                               "fragment")
+
+class URIComponents(NamedTuple):
+    """
+    `URIComponents`
+
+    The raw, unquoted, components of a uri string as found by `urisplit`.
+    """
+    scheme: str
+    userinfo: str
+    host: str
+    port: Optional[int]
+    path: str
+    query: str
+    fragment: str
+
+def _checkedport(port:Optional[str]) -> Optional[int]:
+    if not port:
+        return None
+    #anything after the host's `:` is kept as the port, so it can be refused here
+    if not (port.isascii() and port.isdigit()):
+        raise ValueError(f"Port could not be cast to integer value as {port!r}")
+    return int(port)
+
+def _checkedhost(host:str) -> str:
+    if ("[" in host or "]" in host) and not (host.startswith("[") and host.endswith("]")):
+        raise ValueError("Invalid IPv6 URL")
+    return host
+
+def _authorityfields(userinfo:Optional[str],
+                     host:Optional[str],
+                     port:Optional[str],
+                     unquote:bool = False
+                    ) -> Tuple[str, str, Optional[int]]:
+    #the user information, host, and port of an authority, from the groups of its pattern;
+    #every authority parsed goes through here, so instrumenting this counts all of them
+    if unquote:
+        userinfo = uriunquote(userinfo) if userinfo else ""
+        host = uriunquote(host) if host else ""
+    return userinfo or "", _checkedhost(host or ""), _checkedport(port)
+
+def _cleaned(contents:str) -> str:
+    contents = contents.strip()
+    if contents.startswith("<") or contents.startswith("URL:"):
+        contents = uriunwrap(contents)
+    #these are always removed from uris, as done by `urllib.parse`
+    for char in "\t\r\n":
+        if char in contents:
+            contents = contents.replace(char, "")
+    return contents
+
+def _urifields(contents:str,
+               default_scheme:str,
+               unquote:bool
+              ) -> Tuple[str, str, str, Optional[int], str, Tuple[int, int, int, int, int, int]]:
+    #the scheme, user information, host, port, cleaned source, and the spans of
+    #the path, query, and fragment in that source, of the given string
+    contents = _cleaned(contents)
+    match = cast(Match, _URI_PATTERN.match(contents))
+    scheme, userinfo, host, port = match.group("scheme", "userinfo", "host", "port")
+    scheme = default_scheme if scheme is None else scheme.lower()
+    return (uriunquote(scheme) if unquote else scheme,
+            *_authorityfields(userinfo, host, port, unquote),
+            contents,
+            match.span("path") + match.span("query") + match.span("fragment"))
+
+def urisplit(contents:str, default_scheme:str = "") -> URIComponents:
+    """
+    `urisplit`
+
+    Splits the given uri string into all of its components in a single pass,
+    including the parts of its authority.
+
+    Arguments:
+        `contents` -- The uri string to split, used as is.
+
+    Keyword Arguments:
+        `default_scheme` -- The scheme to use if the given string has none.
+
+    Raises:
+        ValueError: Raised when the given string has a malformed port or IPv6 host.
+
+    Returns:
+        The components found in the given string, none of which are unquoted.
+    """
+    match = cast(Match, _URI_PATTERN.match(contents))
+    scheme, _, userinfo, host, port, path, query, fragment = match.group(*_COMPONENTS)
+    return URIComponents(default_scheme if scheme is None else scheme.lower(),
+                         *_authorityfields(userinfo, host, port),
+                         path,
+                         query or "",
+                         fragment or "")
+
+#the port used by each scheme when none is given
+DEFAULT_PORTS:Dict[str, int] = {"ftp":21,
+                                "http":80,
+                                "https":443,
+                                "ws":80,
+                                "wss":443}
+
+class URINormalization(NamedTuple):
+    """
+    `URINormalization`
+
+    The steps taken when normalizing a uri, each done unless turned off,
+    as described in https://www.rfc-editor.org/rfc/rfc3986#section-6.2.2
+    """
+    #lowercase the scheme and host
+    lowercase: bool = True
+    #uppercase the hexadecimal digits of every percent encoding
+    percent_case: bool = True
+    #decode every percent encoded unreserved character
+    decode_unreserved: bool = True
+    #remove an empty port, or the port the scheme uses by default
+    default_port: bool = True
+    #remove every `.` and `..` path segment
+    dot_segments: bool = True
+    #give an empty path a single `/` when the uri has an authority
+    empty_path: bool = True
+
+_DEFAULT_NORMALIZATION:URINormalization = URINormalization()
+
+@lru_cache(maxsize=None)
+def _percent_table(percent_case:bool, decode_unreserved:bool) -> Dict[str, str]:
+    #every two hexadecimal digits (in either case) as the text their percent encoding becomes
+    table = {}
+    for a in CharacterSets.HEXDIGITS:
+        for b in CharacterSets.HEXDIGITS:
+            char = chr(int(a + b, 16))
+            if decode_unreserved and char in CharacterSets.UNRESERVED:
+                table[a + b] = char
+            else:
+                table[a + b] = "%" + ((a + b).upper() if percent_case else a + b)
+    return table
+
+def _percent_normalized(contents:str, table:Dict[str, str]) -> str:
+    if "%" not in contents:
+        return contents
+    parts = contents.split("%")
+    normalized = [parts[0]]
+    append = normalized.append
+    for part in parts[1:]:
+        replaced = table.get(part[:2])
+        if replaced is None:
+            append("%" + part)
+        else:
+            append(replaced + part[2:])
+    return "".join(normalized)
+
+def _lowered_host(host:str) -> str:
+    #lowercases every character of the host outside of its percent encodings
+    if "%" not in host:
+        return host.lower()
+    parts = host.split("%")
+    return parts[0].lower() + "".join("%" + p[:2] + p[2:].lower() for p in parts[1:])
+
+def urinormalize(contents:str,
+                 default_scheme:str = "",
+                 steps:Optional[URINormalization] = None
+                ) -> str:
+    """
+    `urinormalize`
+
+    Normalizes the given uri string in a single pass, so that any two equivalent uris
+    become the same string; for use as cache or deduplication keys.
+
+    Arguments:
+        `contents` -- The uri string to normalize.
+
+    Keyword Arguments:
+        `default_scheme` -- The scheme to use if the given string has none.
+        `steps` -- The normalization steps to take, defaulting to every one of them.
+
+    Raises:
+        ValueError: Raised when the given string has a malformed port or IPv6 host.
+
+    Returns:
+        The normalized uri string.
+    """
+    return _normalized(_cleaned(contents), default_scheme, steps)
+
+def _normalized(contents:str,
+                default_scheme:str,
+                steps:Optional[URINormalization]
+               ) -> str:
+    #the same as `urinormalize`, for a uri string that was already cleaned
+    if steps is None:
+        steps = _DEFAULT_NORMALIZATION
+    match = cast(Match, _URI_PATTERN.match(contents))
+    scheme, authority, userinfo, host, port, path, query, fragment = match.group(*_COMPONENTS)
+    if scheme is None:
+        scheme = default_scheme
+    if steps.lowercase:
+        scheme = scheme.lower()
+
+    table = (_percent_table(steps.percent_case, steps.decode_unreserved)
+             if steps.percent_case or steps.decode_unreserved else None)
+
+    parts:List[str] = []
+    if scheme != "":
+        parts += (scheme, ":")
+    if authority is not None:
+        parts.append("//")
+        if userinfo is not None:
+            parts += (userinfo if table is None else _percent_normalized(userinfo, table), "@")
+        host = _checkedhost(host)
+        if table is not None:
+            host = _percent_normalized(host, table)
+        parts.append(_lowered_host(host) if steps.lowercase else host)
+        number = _checkedport(port)
+        if port is not None and steps.default_port:
+            if number is None or number == DEFAULT_PORTS.get(scheme.lower()):
+                port = None
+        if port is not None:
+            parts += (":", port)
+
+    if table is not None:
+        path = _percent_normalized(path, table)
+    if steps.dot_segments:
+        path = remove_dot_segments(path)
+    if steps.empty_path and path == "" and authority is not None:
+        path = "/"
+    parts.append(path)
+
+    if query is not None:
+        parts += ("?", query if table is None else _percent_normalized(query, table))
+    if fragment is not None:
+        parts += ("#", fragment if table is None else _percent_normalized(fragment, table))
+    return "".join(parts)
@@ -4,31 +4,93 @@
 Holds the `URIPath` class and reated imports.
 """
 
-from urllib.parse import quote as uriquote
+from __future__ import annotations
 
+from bisect import bisect_left
+from os import fspath
 from sys import maxsize as sys_maxsize, version_info
-from re import compile as regexcompile
 
 from .characters import CharacterSets
-from .tools import iter_flatten
+from .codec import quoter
+from .tools import iter_flatten, immutable_method, compiled
 from .typings import * # pylint: disable=wildcard-import, unused-wildcard-import
 
+_ROOTS:FrozenSet[str] = frozenset(("/", "//"))
+
+def _splitpath(path:str) -> Tuple[str, List[str]]:
+    #the root and segments of a single posix path string, exactly as `PurePosixPath` finds them
+    if "/" not in path:
+        return ("", [path] if path not in ("", ".") else [])
+    root = ""
+    if path[0] == "/":
+        root = "//" if path[1:2] == "/" and path[2:3] != "/" else "/"
+    return (root, [s for s in path.split("/") if s not in ("", ".")])
+
+def _joinparts(paths:Iterable[Union[str, PathLike]]) -> List[str]:
+    #the parts of all given paths joined together, with any root dropping every part before it
+    parts:List[str] = []
+    for path in paths:
+        root, segments = _splitpath(path if isinstance(path, str) else fspath(path))
+        if root != "":
+            parts = [root]
+        parts += segments
+    return parts
+
+def remove_dot_segments(path:str) -> str:
+    """
+    `remove_dot_segments`
+
+    Removes every `.` and `..` segment from the given path string,
+    as described in https://www.rfc-editor.org/rfc/rfc3986#section-5.2.4
+
+    Arguments:
+        `path` -- The path string, as found in a uri, to remove the dot segments of.
+
+    Returns:
+        The path without any dot segments, being `path` itself if it had none.
+    """
+    if "." not in path:
+        return path
+    segments = path.split("/")
+    last = len(segments) - 1
+    output:List[str] = []
+    for i, segment in enumerate(segments):
+        if segment in (".", ".."):
+            #the root of an absolute path (its leading empty segment) is never removed
+            if segment == ".." and len(output) > 0 and (len(output) > 1 or output[0] != ""):
+                output.pop()
+            if i == last:
+                output.append("")
+        else:
+            output.append(segment)
+    return "/".join(output)
+
 class URIPath(PurePosixPath, PathLike, MutableSequenceABC[str]):
     """
     `URIPath`
 
     A class used to manipulate and use a URI path in python easily.
+
+    Every part of the path (its root, if any, followed by every segment) is kept in a plain list,
+    with the inherited `PurePosixPath` methods working as a view of it.
     """
 
     _USE_NEW_PUREPATH_INIT_METHOD:bool = version_info.major > 3 or (version_info.major == 3 and
                                                                     version_info.minor >= 12)
     _CACHEING_ANCESTORS:Tuple[type, ...] = (PurePosixPath, PurePath, PureWindowsPath)
-    _CACHE_ATTR_NAMES:Iterator[LiteralString] = cast(Iterator[LiteralString],
-                                                     iter_flatten(
-                                                         (getattr(c, "__slots__", []) for c in _CACHEING_ANCESTORS), #pylint:disable=line-too-long
-                                                         str
-                                                         )
-                                                     )
+    #built once as a tuple, as every change to the path has to go over all of these again
+    _CACHE_ATTR_NAMES:Tuple[LiteralString, ...] = tuple(attr
+                                                        for c in _CACHEING_ANCESTORS
+                                                        for attr in getattr(c, "__slots__", ()))
+    #the inherited `pathlib` state every other `pathlib` attribute is derived from
+    _PATHLIB_ATTR_NAMES:FrozenSet[str] = frozenset(("_drv", "_root", "_parts",
+                                                    "_raw_paths", "_tail_cached"))
+    #the inherited `pathlib` state only found from python 3.12 on, set by `_sync_pathlib`
+    _raw_paths:List[str]
+    _tail_cached:List[str]
+    _PATH_ATTR_NAMES:FrozenSet[str] = frozenset(("_segments", "_version", "_derived_version",
+                                                 "_derived_values", "_pathlib_version", "_slashed",
+                                                 "unquote", "requote", "quote_safe"))
     @property
     def raw(self) -> List[str]:
         """
@@ -37,21 +99,82 @@ class URIPath(PurePosixPath, PathLike, MutableSequenceABC[str]):
         Used internally, do not modify without express intent.
 
         Returns:
-            The internal list of strings used by `Path` types to create paths from.
+            The internal list of every part of this path, its root (if any) followed by
+            every segment. Assigning a list of path strings to this joins them as `pathlib` does.
         """
-        return self._raw_paths
+        return self._segments
     @raw.setter
     def raw(self, value:List[str]):
-        #without this, the caches parts of the path wont update when we manually change the content
-        for attr in self._CACHE_ATTR_NAMES:
-            if hasattr(self, attr):
-                delattr(self, attr)
-        self._raw_paths = value
+        self._segments[:] = _joinparts(value)
+        self._changed()
     @raw.deleter
     def raw(self):
         # you don't just delete raw, but you can clear it...
         self.raw = []
 
+    def _sync_pathlib(self):
+        #the inherited `pathlib` state is only ever set from the segments, never parsed back
+        segments = self._segments
+        root = segments[0] if len(segments) > 0 and segments[0] in _ROOTS else ""
+        self._drv = ""
+        self._root = root
+        if self._USE_NEW_PUREPATH_INIT_METHOD:
+            self._raw_paths = [self._joined()]
+            self._tail_cached = segments[1:] if root else list(segments)
+        else:
+            self._parts = list(segments)
+        self._pathlib_version = self._version
+
+    def _changed(self):
+        #called whenever the segments of this path change, making everything derived from them
+        #stale; the inherited `pathlib` state is only cleared if it may have been set since the
+        #last change
+        if self._pathlib_version == self._version:
+            for attr in self._CACHE_ATTR_NAMES:
+                try:
+                    delattr(self, attr)
+                except AttributeError:
+                    pass
+        self._version += 1
+        self._slashed = False
+
+    def _derived(self) -> Dict[Any, Any]:
+        #every value derived from the segments, kept until the next change
+        if self._derived_version != self._version:
+            self._derived_values = {}
+            self._derived_version = self._version
+        return self._derived_values
+
+    def _positions(self) -> Dict[str, List[int]]:
+        #a lookup of every part to the indexes it is found at, in order,
+        #only built when first needed, and then rebuilt once the path has changed after that
+        derived = self._derived()
+        positions = derived.get("positions")
+        if positions is None:
+            positions = {}
+            for i, segment in enumerate(self._segments):
+                found = positions.get(segment)
+                if found is None:
+                    positions[segment] = [i]
+                else:
+                    found.append(i)
+            derived["positions"] = positions
+        return positions
+
+    def _joined(self) -> str:
+        derived = self._derived()
+        string = derived.get("str")
+        if string is None:
+            segments = self._segments
+            if len(segments) <= 0:
+                string = "."
+            elif segments[0] in _ROOTS:
+                string = segments[0] + "/".join(segments[1:])
+            else:
+                string = "/".join(segments)
+            derived["str"] = string
+        return string
+
     def __new__(cls,
                 *path:Union[str, PathLike, Iterable[Union[str, PathLike]]],
                 unquote: bool = False,
@@ -60,10 +183,7 @@ class URIPath(PurePosixPath, PathLike, MutableSequenceABC[str]):
                ) -> 'URIPath':
         # don't run the inherited __new__ methods,
         # it automatically makes the path in the OS local type and confuses type checkers
-        if cls._USE_NEW_PUREPATH_INIT_METHOD or TYPE_CHECKING:
-            return object.__new__(cls)
-        else:
-            return cls._from_parts(tuple(iter_flatten(path, str)))
+        return object.__new__(cls)
 
     def __init__(self,
                  *path:Union[str, PathLike, Iterable[Union[str, PathLike]]],
@@ -74,45 +194,110 @@ class URIPath(PurePosixPath, PathLike, MutableSequenceABC[str]):
         self.unquote:bool = unquote
         self.requote:bool = requote
         self.quote_safe = quote_safe
-
+        #bumped on every change, with the derived values and the inherited `pathlib` state
+        #each remembering the version they were last made at
+        self._version:int = 0
+        self._derived_version:int = 0
+        self._derived_values:Dict[Any, Any] = {}
+        self._pathlib_version:int = 0
+        #if the path was given ending with a `/` (or `/.`), as a directory would,
+        #which `pathlib` can't keep, and only kept until the path is changed
+        self._slashed:bool = False
+
+        if len(path) == 1 and isinstance(path[0], URIPath):
+            self._segments:List[str] = list(path[0]._segments)
+            self._slashed = path[0]._slashed
+        elif len(path) == 1 and isinstance(path[0], str):
+            root, segments = _splitpath(path[0])
+            self._segments = [root] + segments if root != "" else segments
+            last = path[0][path[0].rfind("/") + 1:]
+            self._slashed = len(segments) > 0 and last in ("", ".")
+        else:
+            self._segments = _joinparts(iter_flatten(path, str))
+
+    def __getattr__(self, name:str) -> Any:
+        state = self.__dict__
+        if "_segments" not in state:
+            #paths made by `pathlib` itself (such as `parent` before python 3.12) skip `__init__`,
+            #so they are set up from their `pathlib` state once first used as a `URIPath`
+            if name in self._PATH_ATTR_NAMES:
+                URIPath.__init__(self, PurePosixPath.__str__(self))
+                return getattr(self, name)
+        elif name in self._PATHLIB_ATTR_NAMES:
+            #the inherited `pathlib` state is only set again once `pathlib` itself needs it
+            self._sync_pathlib()
+            return getattr(self, name)
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def __hash__(self) -> int:
+        #the same hash `PurePosixPath` gives, so equal paths always hash the same
+        derived = self._derived()
         if self._USE_NEW_PUREPATH_INIT_METHOD:
-            super().__init__(*tuple(iter_flatten(path, str)))
+            #which is of the encoded path, so depends on how it is quoted
+            key = ("hash", bool(self.requote), self.quote_safe)
+            value = derived.get(key)
+            if value is None:
+                value = derived[key] = hash(str(self))
+        else:
+            value = derived.get("hash")
+            if value is None:
+                value = derived["hash"] = hash(tuple(self._segments))
+        return value
+
+    @property
+    def parts(self) -> Tuple[str, ...]:
+        """
+        `parts`
+
+        Returns:
+            Every part of this path, its root (if any) followed by every segment.
+        """
+        derived = self._derived()
+        parts = derived.get("parts")
+        if parts is None:
+            parts = derived["parts"] = tuple(self._segments)
+        return parts
 
     def __iter__(self):
-        return iter(self.parts)
+        return iter(self._segments)
 
     @overload
     def __getitem__(self, index:int) -> str: ...
     @overload
     def __getitem__(self, index:slice) -> List[str]: ...
     def __getitem__(self, index:Union[int, slice]) -> Union[str, List[str]]:
-        return list(self.parts[index])
+        return self._segments[index]
 
     def __setitem__(self,
                     index:Union[int, slice],
                     value:Union[str, PathLike, Iterable[Union[str, PathLike]]]
                    ):
-        c = list(self)
-
-        value = self.copy(value)
+        replacement = self.copy(value)._segments
+        segments = self._segments
 
         if isinstance(index, int):
-            c[index] = str(value)
+            index = range(len(segments))[index]
+            if len(replacement) > 0 and replacement[0] in _ROOTS:
+                self._segments = replacement + segments[index + 1:]
+            else:
+                segments[index:index + 1] = replacement
         else:
-            c[index] = list(value)
+            c = list(segments)
+            c[index] = replacement
+            #a root may now be anywhere in the path, so the parts are joined again
+            self._segments = _joinparts(c)
 
-        self.raw = c
+        self._changed()
 
     def __delitem__(self, index:Union[int, slice]):
-        c = list(self)
-        del c[index]
-        self.raw = c
+        del self._segments[index]
+        self._changed()
 
     def __bool__(self):
         return not self.isempty()
 
     def __len__(self):
-        return len(self.parts)
+        return len(self._segments)
 
     def __truediv__(self, other:Union[str, PathLike, Iterable[Union[str, PathLike]]]): #self / other
         c = self.copy()
@@ -130,7 +315,11 @@ class URIPath(PurePosixPath, PathLike, MutableSequenceABC[str]):
                     ) -> Union[bool, NotImplementedType]:
         if not isinstance(other, (str, PathLike, Iterable)):
             return NotImplemented
-        return all((x in list(self)) for x in self.copy(other))
+        positions = self._positions()
+        if isinstance(other, str) and "/" not in other:
+            #a single segment needs no parsing
+            return other in positions or other == "" or other == "."
+        return all((x in positions) for x in self.copy(other)._segments)
 
     def copy(self,
              *content_override:Union[str, PathLike, Iterable[Union[str, PathLike]]]
@@ -154,22 +343,54 @@ class URIPath(PurePosixPath, PathLike, MutableSequenceABC[str]):
     __copy__ = copy
     __deepcopy__ = copy
 
-    def append(self, value:Union[str, PathLike, Iterable[Union[str, PathLike]]]):
-        appendage = []
-        if isinstance(value, URIPath) :
-            if all(not x.startswith("/") for x in value.raw):
-                appendage = value.raw
-            else:
-                appendage = list(value[1:] if value[0] == "/" else value[:])
+    def _appended(self, value:Union[str, PathLike, Iterable[Union[str, PathLike]]]):
+        if isinstance(value, URIPath):
+            #the root of another `URIPath` is ignored, adding only its segments
+            appendage = value.raw
+            if len(appendage) > 0 and appendage[0] in _ROOTS:
+                appendage = appendage[1:]
+        elif isinstance(value, str) and "/" not in value:
+            #a single segment needs no parsing
+            appendage = [value] if value not in ("", ".") else []
         else:
             appendage = self.copy(value).raw
-        self.raw = self.raw + appendage
+            if len(appendage) > 0 and appendage[0] in _ROOTS:
+                self._segments = list(appendage)
+                return
+        self._segments += appendage
+
+    def append(self, value:Union[str, PathLike, Iterable[Union[str, PathLike]]]):
+        self._appended(value)
+        self._changed()
+
+    def extend(self, values:Iterable[Union[str, PathLike, Iterable[Union[str, PathLike]]]]):
+        for value in (list(values) if values is self else values):
+            self._appended(value)
+        self._changed()
+
+    def clear(self):
+        self._segments.clear()
+        self._changed()
+
+    def reverse(self):
+        #the root, if any, stays at the start of the path
+        segments = self._segments
+        start = 1 if len(segments) > 0 and segments[0] in _ROOTS else 0
+        segments[start:] = segments[:start - 1 if start else None:-1]
+        self._changed()
 
     def count(self, value:str) -> int:
-        return list(self).count(value)
+        return len(self._positions().get(value, ()))
 
     def index(self, value:str, start:int = 0, stop:int = sys_maxsize) -> int:
-        return list(self).index(value, start, stop)
+        found = self._positions().get(value, ())
+        if len(found) > 0 and start == 0 and stop >= len(self._segments):
+            return found[0]
+        start, stop, _ = slice(start, stop).indices(len(self._segments))
+        i = bisect_left(found, start)
+        if i < len(found) and found[i] < stop:
+            return found[i]
+        raise ValueError(f"{value!r} is not in path")
 
     def rindex(self, value:str, start:int = 0, stop:Optional[int] = None) -> int:
         """
@@ -188,16 +409,45 @@ class URIPath(PurePosixPath, PathLike, MutableSequenceABC[str]):
         Returns:
             The index found.
         """
-        return (len(self) - self[start:stop][-1::-1].index(value) - 1) + abs(start)
+        found = self._positions().get(value, ())
+        if len(found) > 0 and start == 0 and stop is None:
+            return found[-1]
+        start, stop, _ = slice(start, stop).indices(len(self._segments))
+        i = bisect_left(found, stop) - 1
+        if i >= 0 and found[i] >= start:
+            return found[i]
+        raise ValueError(f"{value!r} is not in path")
 
     def insert(self, index:int, value:Union[str, PathLike, Iterable[Union[str, PathLike]]]):
-        value = self.copy(value).raw
-        self.raw = self.raw[:index] + value + self.raw[index:]
+        insertion = self.copy(value).raw
+        segments = self._segments
+        if len(insertion) > 0 and insertion[0] in _ROOTS:
+            self._segments = insertion + segments[index:]
+        else:
+            segments[index:index] = insertion
+        self._changed()
 
     def remove(self, value:str):
-        newraw = list(self.copy(value))
-        newraw.remove(value)
-        self.raw = newraw
+        self._segments.remove(value)
+        self._changed()
+
+    def remove_dot_segments(self):
+        """
+        `remove_dot_segments`
+
+        Removes every `..` segment from this path, along with the segment before it, if any;
+        any `.` segments are already removed whenever the path is made or changed.
+        """
+        if ".." not in self._positions():
+            return
+        resolved:List[str] = []
+        for segment in self._segments:
+            if segment != "..":
+                resolved.append(segment)
+            elif len(resolved) > 0 and resolved[-1] not in _ROOTS:
+                resolved.pop()
+        self._segments[:] = resolved
+        self._changed()
 
     def isempty(self) -> bool:
         """
@@ -206,7 +456,7 @@ class URIPath(PurePosixPath, PathLike, MutableSequenceABC[str]):
         Returns:
             `True` if the path contains no segments, otherwise `False`.
         """
-        return len(self.raw) <= 0
+        return len(self._segments) <= 0
 
     def encode(self, quote: Optional[bool] = None, quote_safe:Optional[str] = None) -> str:
         """
@@ -226,15 +476,26 @@ class URIPath(PurePosixPath, PathLike, MutableSequenceABC[str]):
         if quote_safe is None:
             quote_safe = cast(str, self.quote_safe)
 
+        derived = self._derived()
+        key = (bool(quote), quote_safe)
+        encoded = derived.get(key)
+        if encoded is not None:
+            return encoded
+
         quote_safe += "/"
 
         if not quote:
-            return super().__str__()
+            encoded = self._joined()
         else:
-            seg = tuple(uriquote(x, quote_safe) for x in self)
-            if self[0] == "/": #the root slash will be consitered a part, we need to preserve that
-                seg = ("/", ) + seg[1:]
-            return super(URIPath, self.copy(*seg)).__str__()
+            quote_one = quoter(quote_safe)
+            segments = self._segments
+            #the root slash will be consitered a part, we need to preserve that
+            root = segments[0] if len(segments) > 0 and segments[0] in _ROOTS else ""
+            encoded = (root + "/".join([quote_one(x) for x in segments[1 if root else 0:]])
+                       or ".")
+
+        derived[key] = encoded
+        return encoded
     __str__ = encode
     __repr__ = encode
 
@@ -268,14 +529,15 @@ class URIPath(PurePosixPath, PathLike, MutableSequenceABC[str]):
             The content of the segment comming after the found `value`,
             or `None` if `value` was not found.
         """
-        if value not in self:
+        found = self._positions().get(value)
+        if found is None:
             return None
 
-        ind = (self.rindex if last else self.index)(value)
-        if ind >= len(self):
+        ind = found[-1 if last else 0]
+        if ind + 1 >= len(self._segments):
             return None
 
-        return cast(str, self[ind + 1])
+        return self._segments[ind + 1]
 
     def segbefore(self, value: str, last:bool = False) -> Union[str, None]:
         """
@@ -295,14 +557,15 @@ class URIPath(PurePosixPath, PathLike, MutableSequenceABC[str]):
             The content of the segment comming before the found `value`,
             or `None` if `value` was not found.
         """
-        if value not in self:
+        found = self._positions().get(value)
+        if found is None:
             return None
 
-        ind = (self.rindex if last else self.index)(value)
+        ind = found[-1 if last else 0]
         if ind <= 0:
             return None
 
-        return cast(str, self[ ind - 1])
+        return self._segments[ind - 1]
 
     def segsearch(self,
                   pattern:Union[str, Pattern],
@@ -327,10 +590,45 @@ class URIPath(PurePosixPath, PathLike, MutableSequenceABC[str]):
         Yields:
             A match found.
         """
-        if isinstance(pattern, str):
-            pattern = regexcompile(pattern)
-
+        search = compiled(pattern).search
         for s in self:
-            m = pattern.search(s)
+            m = search(s)
             if include_all or m is not None:
                 yield cast(Match, m)
+
+class FrozenURIPath(URIPath):
+    """
+    `FrozenURIPath`
+
+    A immutable, hashable, `URIPath`.
+    Any copy made of it is a mutable `URIPath`.
+    """
+
+    @property
+    def raw(self) -> Tuple[str, ...]: #type:ignore
+        #given as a tuple, so the segments can't be changed through it
+        derived = self._derived()
+        segments = derived.get("raw")
+        if segments is None:
+            segments = derived["raw"] = tuple(self._segments)
+        return segments
+    @raw.setter
+    def raw(self, value:List[str]): # pylint: disable=unused-argument
+        #the value is only taken to keep the signature of the setter this overrides
+        immutable_method(self)
+    @raw.deleter
+    def raw(self):
+        immutable_method(self)
+
+    def encode(self, quote: Optional[bool] = None, quote_safe:Optional[str] = None) -> str:
+        encoded = super().encode(quote, quote_safe)
+        #a frozen path never changes, so it always keeps any trailing `/` it was given with
+        if self._slashed and not encoded.endswith("/"):
+            encoded += "/"
+        return encoded
+    __str__ = encode
+    __repr__ = encode
+
+    __setitem__ = __delitem__ = __iadd__ = immutable_method
+    append = insert = remove = pop = clear = reverse = extend = immutable_method
+    remove_dot_segments = immutable_method
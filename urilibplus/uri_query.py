@@ -4,18 +4,165 @@
 Holds the `URIQuery` class and reated imports.
 """
 
-from urllib.parse import (parse_qsl as uriqueryparse,
-                          urlencode as uriqueryunparse,
-                          quote as uriquote,
-                          unquote as uriunquote)
+from __future__ import annotations
+
+from urllib.parse import urlencode as uriqueryunparse
 from sys import maxsize as sys_maxsize
-from re import compile as regexcompile
 
 from .characters import CharacterSets
+from .codec import quoter, unquote as uriunquote
 from .typings import * # pylint: disable=wildcard-import, unused-wildcard-import
-from .tools import passthrough_first
+from .tools import immutable_method, compiled
+
+def querysplit(querystr:str, unquote:bool = False) -> List[Tuple[str, str]]:
+    """
+    `querysplit`
+
+    Splits the given query string into its key and value pairs in a single pass,
+    decoding them the same way as `urllib.parse.parse_qsl` does with strict parsing
+    and blank values kept.
+
+    Arguments:
+        `querystr` -- The query string to split, with or without its leading `?`.
 
-class URIQuery(UserList):
+    Keyword Arguments:
+        `unquote` -- Unquote every key and value an additional time once split.
+
+    Raises:
+        ValueError: Raised when a field of the query has no value, and the query is not
+            made of a single valueless key.
+
+    Returns:
+        A list of every `(key, value)` pair found, in order.
+    """
+    querystr = querystr.strip().lstrip("?").lstrip()
+    if querystr == "":
+        return []
+    if "=" not in querystr:
+        #normaize a nonstandard query with a empty value while still in string form
+        querystr += "="
+
+    pairs = []
+    for field in querystr.split("&"):
+        key, sep, value = field.partition("=")
+        if sep == "":
+            raise ValueError(f"bad query field: {field!r}")
+        if "+" in key:
+            key = key.replace("+", " ")
+        if "%" in key:
+            key = uriunquote(key)
+        if "+" in value:
+            value = value.replace("+", " ")
+        if "%" in value:
+            value = uriunquote(value)
+        if unquote:
+            key, value = uriunquote(key), uriunquote(value)
+        pairs.append((key, value))
+    return pairs
+
+def _decoded(part:str, unquote:bool) -> str:
+    if "+" in part:
+        part = part.replace("+", " ")
+    if "%" in part:
+        part = uriunquote(part)
+    if unquote:
+        part = uriunquote(part)
+    return part
+
+def queryiter(querystr:str,
+              unquote:bool = False,
+              *,
+              max_fields:Optional[int] = None,
+              max_length:Optional[int] = None,
+              stop_key:Optional[str] = None,
+              only_keys:Optional[Iterable[str]] = None
+             ) -> Iterator[Tuple[str, str]]:
+    """
+    `queryiter`
+
+    Splits the given query string into its key and value pairs one at a time, decoding them
+    the same way as `querysplit` does; so that only the pairs needed are ever made.
+    The pairs can be given to `URIQuery.build` to make a query of them.
+
+    Arguments:
+        `querystr` -- The query string to split, with or without its leading `?`.
+
+    Keyword Arguments:
+        `unquote` -- Unquote every key and value an additional time once split.
+        `max_fields` -- If given, the most fields the query may have.
+        `max_length` -- If given, the most characters the query string may have.
+        `stop_key` -- If given, no more pairs are split once a pair with this key is found,
+            that pair still being given if it is wanted.
+        `only_keys` -- If given, only the pairs with one of these keys are given,
+            with the values of every other pair never being decoded.
+
+    Raises:
+        ValueError: Raised once iterated, when the query is longer than `max_length`, has more
+            fields than `max_fields`, or when a field of the query has no value and the query is
+            not made of a single valueless key.
+
+    Yields:
+        Every wanted `(key, value)` pair found, in order.
+    """
+    if max_length is not None and len(querystr) > max_length:
+        raise ValueError(f"query is longer than {max_length} characters")
+    querystr = querystr.strip().lstrip("?").lstrip()
+    if querystr == "":
+        return
+    if max_fields is not None and querystr.count("&") >= max_fields:
+        raise ValueError(f"query has more than {max_fields} fields")
+    if "=" not in querystr:
+        #normaize a nonstandard query with a empty value while still in string form
+        querystr += "="
+    wanted = None if only_keys is None else frozenset(only_keys)
+
+    start, end = 0, len(querystr)
+    while start <= end:
+        stop = querystr.find("&", start)
+        if stop < 0:
+            stop = end
+        key, sep, value = querystr[start:stop].partition("=")
+        if sep == "":
+            raise ValueError(f"bad query field: {querystr[start:stop]!r}")
+        start = stop + 1
+
+        key = _decoded(key, unquote)
+        if wanted is None or key in wanted:
+            yield (key, _decoded(value, unquote))
+        if key == stop_key:
+            return
+
+def _counted(method:Callable[..., Any]) -> Callable[..., Any]:
+    #the given list method, also counting the change it makes
+    def counted(self:'_QueryPairs', *args:Any, **kwargs:Any) -> Any:
+        self.changes += 1
+        return method(self, *args, **kwargs)
+    return counted
+
+class _QueryPairs(list):
+    #the pairs of a `URIQuery`, counting every change made to them, even in place through
+    #`URIQuery.data`, so anything derived from them can tell when it is out of date
+    __slots__ = ("changes",)
+
+    def __init__(self, pairs:Iterable[Tuple[str, str]] = (), changes:int = 0):
+        super().__init__(pairs)
+        self.changes:int = changes
+
+    __setitem__ = _counted(list.__setitem__)
+    __delitem__ = _counted(list.__delitem__)
+    __iadd__ = _counted(list.__iadd__)
+    __imul__ = _counted(list.__imul__)
+    append = _counted(list.append)
+    insert = _counted(list.insert)
+    pop = _counted(list.pop)
+    remove = _counted(list.remove)
+    clear = _counted(list.clear)
+    reverse = _counted(list.reverse)
+    sort = _counted(list.sort)
+    extend = _counted(list.extend)
+
+#every method of a list is kept, along with those for keys and values
+class URIQuery(UserList): # pylint: disable=too-many-public-methods
     """
     `URIQuery`
 
@@ -25,11 +172,116 @@ class URIQuery(UserList):
     it is not, as it allows for duplacate keys, and requires the ordering to be preserved.
     """
 
+    #`UserList` declares `data` as a plain list, which this keeps as a property instead,
+    #so a list assigned to it is still made to count its changes
+    @property
+    def data(self) -> List[Tuple[str, str]]:
+        """
+        `data`
+
+        Returns:
+            The internal list of `(key, value)` pairs of this query, which can be changed
+            in place. Assigning a list to this copies it in.
+        """
+        return self._data
+    @data.setter
+    def data(self, value:Iterable[Tuple[str, str]]): #type:ignore
+        #the count goes on from the last list, so no older version is ever repeated
+        self._data = _QueryPairs(value, self._data.changes + 1)
+
+    @property
+    def _version(self) -> int:
+        #changed along with the content of this query, however it was changed
+        return self._data.changes
+
+    def _changed(self):
+        #called whenever the content of this query changes, outdating anything derived from it
+        self._data.changes += 1
+
     def __parse(self, querystr:str) -> List[Tuple[str, str]]:
-        parsed = uriqueryparse(querystr, keep_blank_values=True, strict_parsing = True)
-        return parsed if not self.unquote else [(uriunquote(k), uriunquote(v)) for k,v in parsed]
+        return querysplit(querystr, self.unquote)
+
+    def _index(self, position:int) -> Dict[str, List[int]]:
+        #a lookup of every key (position 0) or value (position 1) to the indexes it is found at,
+        #only built when first needed, and then rebuilt once the query has changed after that
+        cached = self._indexes[position]
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+        index:Dict[str, List[int]] = {}
+        for i, pair in enumerate(self._data):
+            found = index.get(pair[position])
+            if found is None:
+                index[pair[position]] = [i]
+            else:
+                found.append(i)
+        self._indexes[position] = (self._version, index)
+        return index
+
+    def _indexes_of(self, position:int, searching:Tuple[str, ...]) -> Tuple[int, ...]:
+        index = self._index(position)
+        if len(searching) == 1:
+            return tuple(index.get(searching[0], ()))
+        return tuple(sorted({i for s in set(searching) for i in index.get(s, ())}))
+
+    def _pairs(self,
+               other:Union[str, Tuple[str, str], Iterable[Tuple[str, str]], 'URIQuery']
+              ) -> List[Tuple[str, str]]:
+        #every form of content that can be added to a query, as a new list of pairs
+        if isinstance(other, str):
+            return self.__parse(other)
+        if isinstance(other, URIQuery):
+            return list(other.data)
+        if (isinstance(other, tuple) and
+            len(other) == 2 and
+            isinstance(other[0], str) and
+            isinstance(other[1], str)
+           ):
+            return [cast(Tuple[str, str], other)]
+        return list(cast(Iterable[Tuple[str, str]], other))
+
+    @staticmethod
+    def _grouped(content:Union[Mapping[str, Union[str, Iterable[str]]], Iterable[Tuple[str, str]]]
+                ) -> Iterator[Tuple[str, str]]:
+        #every pair of a mapping of keys to a single value or a list of values, or of pairs as is
+        if not isinstance(content, Mapping):
+            yield from cast(Iterable[Tuple[str, str]], content)
+            return
+        for key, values in cast(Mapping[str, Union[str, Iterable[str]]], content).items():
+            if isinstance(values, str):
+                yield (key, values)
+            else:
+                for value in values:
+                    yield (key, value)
+
+    @classmethod
+    def build(cls,
+              content:Union[Mapping[str, Union[str, Iterable[str]]], Iterable[Tuple[str, str]]],
+              *,
+              unquote:bool = False,
+              requote: bool = False,
+              force_case: Literal["upper", "lower", "preserve"] = "preserve",
+              quote_safe: str = ""
+             ) -> 'URIQuery':
+        """
+        `build`
 
-    def __init__(self,
+        Arguments:
+            `content` -- Either an iterable of `(key, value)` pairs, or a mapping of keys to
+                either a single value or a list of values, every value being its own entry.
+
+        Keyword Arguments:
+            `unquote`, `requote`, `force_case`, `quote_safe` -- The same as when making a query.
+
+        Returns:
+            A new query of every given entry, in order, built in a single pass.
+        """
+        return cls(list(cls._grouped(content)),
+                   unquote=unquote,
+                   requote=requote,
+                   force_case=force_case,
+                   quote_safe=quote_safe)
+
+    def __init__(self, # pylint: disable=super-init-not-called
                  content:Union[str, List[Tuple[str, str]], Dict[str, str], 'URIQuery', None]= None,
                  *,
                  unquote:bool = False, #unquote values when unencoding strings
@@ -41,33 +293,27 @@ class URIQuery(UserList):
         self.requote:bool = requote
         self.quote_safe:str = quote_safe
         self.force_case: Literal["upper", "lower", "preserve"] = force_case
-        self.data:List[Tuple[str, str]]
+        self._encoded:Dict[Tuple[bool, str, str], str] = {}
+        self._encoded_version:int = 0
+        self._indexes:List[Optional[Tuple[int, Dict[str, List[int]]]]] = [None, None]
 
+        pairs:Iterable[Tuple[str, str]] = ()
         if isinstance(content, (dict, URIQuery)):
-            content = list(content.items())
+            pairs = content.items()
         elif isinstance(content, str):
-            content = content.strip().lstrip("?").lstrip()
-            if content == "":
-                content = None
-            else:
-                if "=" not in content:
-                    #normaize a nonstandard query with a empty value while still in string form
-                    content += "="
-                content = self.__parse(content)
+            pairs = self.__parse(content)
+        elif content is not None:
+            pairs = content
 
-        super().__init__(content)
+        #set directly, instead of through `UserList`, so the content is only copied once
+        self._data:_QueryPairs = _QueryPairs(pairs)
 
     def __bool__(self):
         return not self.isempty()
 
     def __lshift__(self, count:int) -> 'URIQuery':
         c = self.copy()
-        if count > 0:
-            for _ in range(count):
-                c.append(c.pop(0))
-        else:
-            for _ in range(abs(count)):
-                c.insert(0, c.pop(-1))
+        c.rotate(count)
         return c
 
     def __rshift__(self, count:int) -> 'URIQuery':
@@ -77,30 +323,75 @@ class URIQuery(UserList):
                 other:Union[str, Tuple[str, str], Iterable[Tuple[str, str]], 'URIQuery']
                ) -> 'URIQuery':
         c = self.copy()
-
-        if isinstance(other, str):
-            other = self.__parse(other)
-        elif isinstance(other, URIQuery):
-            other = other.data
-        elif (isinstance(other, tuple) and
-              len(other) == 2 and
-              isinstance(other[0], str) and
-              isinstance(other[1], str)
-             ):
-            other = [cast(Tuple[str, str], other)]
-        else:
-            other = list(cast(Iterable[Tuple[str, str]], other))
-
-        c.data += other
-
+        c.append(other)
         return c
 
     def __len__(self):
         return len(self.data)
 
+    def extend(self, other:Union[str, Iterable[Tuple[str, str]], 'URIQuery']):
+        self._data.extend(self._pairs(other))
+        self._changed()
+
     def append(self, item:Union[str, Tuple[str, str], Iterable[Tuple[str, str]]]):
-        #we can use the __add__ opperator, as this appcompishes the same thing
-        self.data = list(self + item)
+        #added in place, as copying the whole query for every append adds up quickly
+        self._data.extend(self._pairs(item))
+        self._changed()
+
+    def rotate(self, count:int):
+        """
+        `rotate`
+
+        Rotates every entry of this query in place, the same as `<<` does with a copy.
+
+        Arguments:
+            `count` -- The amount of entries to move from the start to the end of the query,
+                with a negative count moving entries from the end to the start instead.
+        """
+        data = self._data
+        if len(data) <= 0:
+            return
+        count %= len(data)
+        if count != 0:
+            data[:] = data[count:] + data[:count]
+
+    def update_many(self,
+                    content:Union[Mapping[str, Union[str, Iterable[str]]],
+                                  Iterable[Tuple[str, str]]]
+                   ):
+        """
+        `update_many`
+
+        A dictionary like update method, done in a single pass over the query.
+
+        Every key given has all of its entries replaced by the given values, placed where the
+        first entry with that key was found; with new keys added to the end of the query.
+
+        Arguments:
+            `content` -- Either an iterable of `(key, value)` pairs, or a mapping of keys to
+                either a single value or a list of values, the same as with `build`.
+        """
+        grouped:Dict[str, List[str]] = {}
+        for key, value in self._grouped(content):
+            values = grouped.get(key)
+            if values is None:
+                grouped[key] = [value]
+            else:
+                values.append(value)
+        if len(grouped) <= 0:
+            return
+
+        updated:List[Tuple[str, str]] = []
+        for key, value in self._data:
+            values = grouped.get(key)
+            if values is None:
+                updated.append((key, value))
+            elif len(values) > 0:
+                updated.extend((key, v) for v in values)
+                values.clear()
+        for key, values in grouped.items():
+            updated.extend((key, v) for v in values)
+        self._data[:] = updated
 
     def count(self, item:Union[str, Tuple[str, str]]) -> int:
         if isinstance(item, str):
@@ -135,6 +426,7 @@ class URIQuery(UserList):
                 raise TypeError(item)
 
         super().insert(i, item)
+        self._changed()
 
     def remove(self, item:Union[str, Tuple[str, str]]):
         if isinstance(item, str):
@@ -145,6 +437,7 @@ class URIQuery(UserList):
                 raise TypeError(item)
 
         super().remove(item)
+        self._changed()
 
     def querykeys(self, *values:str) -> Iterable[str]:
         """
@@ -155,7 +448,10 @@ class URIQuery(UserList):
             or only the keys with one of the exact `*values` given,
             if any `*values` are given.
         """
-        return (k for k,v in self if len(values) <= 0 or v in values)
+        if len(values) <= 0:
+            return (k for k,_ in self.data)
+        data = self.data
+        return (data[i][0] for i in self._indexes_of(1, values))
 
     def queryvalues(self, *keys:str) -> Iterable[str]:
         """
@@ -166,7 +462,10 @@ class URIQuery(UserList):
             or only the values with one of the exact `*keys` given,
             if any `*keys` are given.
         """
-        return (v for k,v in self if len(keys) <= 0 or k in keys)
+        if len(keys) <= 0:
+            return (v for _,v in self.data)
+        data = self.data
+        return (data[i][1] for i in self._indexes_of(0, keys))
 
     def items(self, *kvpairs:Tuple[str,str]) -> Iterable[Tuple[str, str]]:
         """
@@ -186,7 +485,7 @@ class URIQuery(UserList):
         Returns:
             An iterable with all indexes of all entries with one of the exact `*keys` in this query.
         """
-        return tuple(i for i,(k,v) in enumerate(self) if k in keys)
+        return self._indexes_of(0, keys)
 
     def valueindexes(self, *values:str) -> Tuple[int, ...]:
         """
@@ -196,7 +495,7 @@ class URIQuery(UserList):
             An iterable with all indexes of all entries
             with one of the exact `*value` in this query.
         """
-        return tuple(i for i,(k,v) in enumerate(self) if v in values)
+        return self._indexes_of(1, values)
 
     #dictionary like methods
     def getvalues(self, key:str) -> Tuple[str, ...]:
@@ -208,7 +507,8 @@ class URIQuery(UserList):
         Returns:
             A tuple with all values found with the given `key`.
         """
-        return tuple(self.queryvalues(key))
+        data = self.data
+        return tuple(data[i][1] for i in self._index(0).get(key, ()))
 
     #dictionary like methods
     def setvalues(self, key:str, *values:str):
@@ -228,13 +528,18 @@ class URIQuery(UserList):
         if len(inds) != len(values) and len(values) != 1:
             raise TypeError(values)
 
+        if len(inds) <= 0:
+            return
+
+        data = self.data
         for vi, qi in enumerate(inds):
             if len(values) != 1:
                 value = values[vi]
             else:
                 value = values[0]
 
-            self[qi] = (key, value)
+            data[qi] = (key, value)
+        self._changed()
 
     def delkey(self, key:str):
         """
@@ -242,8 +547,10 @@ class URIQuery(UserList):
 
         Deletes every entry in the query with key `key`.
         """
-        for i in reversed(self.keyindexes(key)):
-            del self[i]
+        if key not in self._index(0):
+            return
+        #a single pass over the query, instead of deleting (and shifting) every entry in turn
+        self._data[:] = [pair for pair in self._data if pair[0] != key]
 
     def isempty(self) -> bool:
         """
@@ -265,7 +572,7 @@ class URIQuery(UserList):
             `all_values` -- If `True`, `True` will be returned only if *all* values are empty,
                 not just one.
         """
-        return (all if all_values else any)(v == "" for v in self.queryvalues(key))
+        return (all if all_values else any)(v == "" for v in self.getvalues(key))
 
     def encode(self,
                quote: Optional[bool] = None,
@@ -286,8 +593,6 @@ class URIQuery(UserList):
         Returns:
             This `URIQuery` object, encoded as a string.
         """
-        #pylint:disable=unnecessary-lambda-assignment
-
         if force_case is not None and force_case not in ("upper", "lower", "preserve"):
             raise AttributeError
 
@@ -300,23 +605,37 @@ class URIQuery(UserList):
         if quote_safe is None:
             quote_safe = self.quote_safe
 
-        qmet = passthrough_first
-        if quote:
-            qmet = lambda s: uriquote(s, quote_safe)
-
-        cmet = passthrough_first
-        if force_case != "preserve":
-            cmet = (lambda s: s.upper()) if force_case == "upper" else (lambda s: s.lower())
-
-        quote_via=lambda *p :cmet(qmet(passthrough_first(*p)))
-        #we must use items instead of the query dict to ensure that the order remains intace
-        encoded = uriqueryunparse(tuple(self.items()), doseq=True, quote_via=quote_via)
-
-        _self_tup = tuple(self.items())
-        if len(_self_tup) == 1 and _self_tup[0][0] != "" and _self_tup[0][1] == "":
+        if self._encoded_version != self._version:
+            self._encoded.clear()
+            self._encoded_version = self._version
+        key = (quote, quote_safe, force_case)
+        encoded = self._encoded.get(key)
+        if encoded is not None:
+            return encoded
+
+        data = self.data
+        try:
+            #written out in a single join, with every key and value quoted at most once
+            if quote:
+                quote_one = quoter(quote_safe)
+                encoded = "&".join([quote_one(k) + "=" + quote_one(v) for k, v in data])
+            else:
+                encoded = "&".join([k + "=" + v for k, v in data])
+        except TypeError:
+            #keys or values that aren't strings (such as lists of values) are left to `urlencode`
+            via = quoter(quote_safe) if quote else str
+            encoded = uriqueryunparse(data, doseq=True, quote_via=lambda s, *_: via(str(s)))
+
+        if force_case == "upper":
+            encoded = encoded.upper()
+        elif force_case == "lower":
+            encoded = encoded.lower()
+
+        if len(data) == 1 and data[0][0] != "" and data[0][1] == "":
             #reformat a single, valueless query as just a string of the query key
             encoded = encoded.rstrip("=")
 
+        self._encoded[key] = encoded
         return encoded
     __str__ = encode
     __repr__ = encode
@@ -352,17 +671,79 @@ class URIQuery(UserList):
             with the format of `(Optional[Match], Optional[Match])`,
             the first being matches for keys, the second for values.
         """
-        #pylint:disable=unnecessary-lambda, unnecessary-lambda-assignment
-        ksch = lambda *a, **k: None
-        if isinstance(keymatch, str):
-            keymatch = cast(Pattern, regexcompile(keymatch))
-        if keymatch is not None:
-            ksch = lambda s: keymatch.search(s)
+        keysearch = None if keymatch is None else compiled(keymatch).search
+        valsearch = None if valmatch is None else compiled(valmatch).search
+
+        def searched() -> Iterator[Tuple[Optional[Match], Optional[Match]]]:
+            #each pattern is only ran once for every pair
+            for k, v in self:
+                kmatch = None if keysearch is None else keysearch(k)
+                vmatch = None if valsearch is None else valsearch(v)
+                if kmatch is not None or vmatch is not None:
+                    yield (kmatch, vmatch)
+        return searched()
+
+class _FrozenPairs(_QueryPairs):
+    #the pairs of a `FrozenURIQuery`, still comparing and copying as a list,
+    #but refusing every change made through `FrozenURIQuery.data`
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = immutable_method
+    append = insert = pop = remove = clear = reverse = sort = extend = immutable_method
+
+class FrozenURIQuery(URIQuery):
+    """
+    `FrozenURIQuery`
 
-        vsch = lambda *a, **k: None
-        if isinstance(valmatch, str):
-            valmatch = cast(Pattern, regexcompile(valmatch))
-        if valmatch is not None:
-            vsch = lambda s: valmatch.search(s)
+    A immutable, hashable, `URIQuery`.
+    Any copy made of it is a mutable `URIQuery`.
+    """
+
+    @property
+    def data(self) -> List[Tuple[str, str]]:
+        return self._data
+    @data.setter
+    def data(self, value:Iterable[Tuple[str, str]]):
+        #only set while being made, before the pairs are frozen
+        if isinstance(self._data, _FrozenPairs):
+            immutable_method(self)
+        URIQuery.data.fset(self, value) # type:ignore # pylint: disable=no-member
 
-        return ((ksch(k),vsch(v)) for k,v in self if ksch(k) is not None or vsch(v) is not None)
+    def __init__(self,
+                 content:Union[str, List[Tuple[str, str]], Dict[str, str], 'URIQuery', None]= None,
+                 *,
+                 unquote:bool = False,
+                 requote: bool = False,
+                 force_case: Literal["upper", "lower", "preserve"] = "preserve",
+                 quote_safe: str = ""
+                ):
+        super().__init__(content,
+                         unquote=unquote,
+                         requote=requote,
+                         force_case=force_case,
+                         quote_safe=quote_safe)
+        self._data = _FrozenPairs(self._data, self._data.changes)
+        self._hash:Optional[int] = None
+
+    #`UserList` is declared unhashable, which only this frozen query isn't
+    def __hash__(self) -> int: #type:ignore
+        if self._hash is None:
+            self._hash = hash(tuple(self.data))
+        return self._hash
+
+    def copy(self) -> URIQuery:
+        """
+        `copy`
+
+        Returns:
+            A mutable copy of this query.
+        """
+        return URIQuery(list(self.data),
+                        unquote=self.unquote,
+                        requote=self.requote,
+                        force_case=self.force_case,
+                        quote_safe=self.quote_safe)
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = immutable_method
+    append = insert = pop = remove = clear = reverse = sort = extend = immutable_method
+    setvalues = delkey = rotate = update_many = immutable_method
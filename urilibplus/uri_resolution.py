@@ -0,0 +1,126 @@
+"""
+`uri_resolution`
+
+Holds the resolving of references against a base uri, as done by `URI.resolve`.
+"""
+
+from __future__ import annotations
+
+from .codec import unquote as uriunquote
+from .uri_path import URIPath, remove_dot_segments
+from .uri_query import URIQuery, querysplit
+from .uri_parsing import _URI_PATTERN, _authorityfields, _cleaned
+
+from .typings import * # pylint: disable=wildcard-import, unused-wildcard-import
+
+if TYPE_CHECKING:
+    from .uri import URI
+
+def _recomposed(scheme:str,
+                authority:Optional[str],
+                path:str,
+                query:Optional[str],
+                fragment:Optional[str]
+               ) -> str:
+    #the uri string of the given components,
+    #as described in https://www.rfc-editor.org/rfc/rfc3986#section-5.3
+    parts:List[str] = []
+    if scheme != "":
+        parts += (scheme, ":")
+    if authority is not None:
+        parts += ("//", authority)
+    parts.append(path)
+    if query is not None:
+        parts += ("?", query)
+    if fragment is not None:
+        parts += ("#", fragment)
+    return "".join(parts)
+
+class _Resolver:
+    #everything about a base uri needed to resolve references against it, found only once,
+    #following https://www.rfc-editor.org/rfc/rfc3986#section-5.2.2
+    __slots__ = ("unquote", "uri_type", "defaults", "scheme", "authority", "authority_fields",
+                 "path", "query", "path_str", "query_str", "directory")
+
+    def __init__(self, base:'URI', template:'URI', unquote:bool):
+        #every resolved `URI` starts as a copy of the template, given the same options as the base
+        self.unquote:bool = unquote
+        self.uri_type:Type['URI'] = type(template)
+        self.defaults:Dict[str, Any] = template.__dict__
+        self.scheme:str = base.scheme
+        self.authority:str = base.authority
+        self.authority_fields:Tuple[str, str, Optional[int]] = (base.user_info,
+                                                                 base.host,
+                                                                 base.port)
+        self.path:Optional[URIPath] = base.path
+        self.query:Optional[URIQuery] = base.query
+
+        #the base path, up to and including its last `/`, that relative paths are merged onto
+        path = self.path
+        segments = [] if path is None else [s for s in path.raw if s not in ("/", "//")]
+        slashed = path is not None and path._slashed # pylint: disable=protected-access
+        absolute = "/" if self.authority != "" else ""
+        self.directory:str = absolute + "".join(s + "/" for s in (segments if slashed else
+                                                                  segments[:-1]))
+        self.path_str:str = (absolute + "/".join(segments) + ("/" if slashed else "")
+                             if len(segments) > 0 else "")
+        self.query_str:Optional[str] = None
+        if self.query is not None and not self.query.isempty():
+            self.query_str = self.query.encode(False, "")
+
+    def _target(self,
+                reference:str,
+                encoded:bool
+               ) -> Tuple[Match, str, bool, Union[str, URIPath, None], Union[str, URIQuery, None]]:
+        #the match of the reference, and the scheme, path, and query of the uri it resolves to;
+        #if the reference has no scheme or authority, its path is merged with the base's,
+        #with the base's own path and query objects given when taken as is
+        match = cast(Match, _URI_PATTERN.match(_cleaned(reference)))
+        scheme, authority, path, query = match.group("scheme", "authority", "path", "query")
+        inherited = scheme is None and authority is None
+        scheme = self.scheme if scheme is None else scheme.lower()
+        if not inherited:
+            return match, scheme, inherited, remove_dot_segments(path), query
+        if path == "":
+            if query is None:
+                query = self.query_str if encoded else self.query
+            return match, scheme, inherited, self.path_str if encoded else self.path, query
+        if path[0] != "/":
+            path = self.directory + path
+        return match, scheme, inherited, remove_dot_segments(path), query
+
+    def resolved_str(self, reference:str) -> str:
+        """Resolves the reference, giving the uri string exactly as the specification does."""
+        match, scheme, inherited, path, query = self._target(reference, True)
+        authority = match.group("authority")
+        if inherited and self.authority != "":
+            authority = self.authority
+        return _recomposed(scheme,
+                           authority,
+                           cast(str, path),
+                           cast(Optional[str], query),
+                           match.group("fragment"))
+
+    def resolved_uri(self, reference:str) -> 'URI':
+        """Resolves the reference, giving a new `URI` with the same options as the base."""
+        match, scheme, inherited, path, query = self._target(reference, False)
+        unquote = self.unquote
+        resolved = self.uri_type.__new__(self.uri_type)
+        resolved.__dict__.update(self.defaults)
+        resolved.scheme = uriunquote(scheme) if unquote else scheme
+        if inherited:
+            resolved.user_info, resolved.host, resolved.port = self.authority_fields
+        elif match.group("authority") is not None:
+            resolved.user_info, resolved.host, resolved.port = _authorityfields(
+                *match.group("userinfo", "host", "port"), unquote=unquote)
+        if isinstance(path, URIPath):
+            resolved.path = path.copy()
+        else:
+            resolved.path = URIPath((path or "").lstrip("/"), unquote=unquote)
+        if isinstance(query, URIQuery):
+            resolved.query = query.copy()
+        else:
+            resolved.query = URIQuery(querysplit(query or "", unquote), unquote=unquote)
+        fragment = match.group("fragment")
+        resolved.fragment = URIQuery(querysplit(fragment or "", unquote), unquote=unquote)
+        return resolved